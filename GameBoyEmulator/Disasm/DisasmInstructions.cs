@@ -101,7 +101,7 @@ namespace GameBoyEmulator.Desktop.Disasm {
             },
             new Instruction {
                 Flags = new []{ "-", "-", "-", "-" },
-                Length = 1,
+                Length = 2,
                 Opcode = 0x10,
                 Value = "STOP"
             },
@@ -203,7 +203,7 @@ namespace GameBoyEmulator.Desktop.Disasm {
             },
             new Instruction {
                 Flags = new []{ "-", "-", "-", "-" },
-                Length = 1,
+                Length = 3,
                 Opcode = 0x21,
                 Value = "LD HL, d16"
             },
@@ -299,7 +299,7 @@ namespace GameBoyEmulator.Desktop.Disasm {
             },
             new Instruction {
                 Flags = new []{ "-", "-", "-", "-" },
-                Length = 1,
+                Length = 3,
                 Opcode = 0x31,
                 Value = "LD SP, d16"
             },
@@ -1349,7 +1349,7 @@ namespace GameBoyEmulator.Desktop.Disasm {
             },
             new Instruction {
                 Flags = new []{ "-", "-", "-", "-" },
-                Length = 1,
+                Length = 2,
                 Opcode = 0xe0,
                 Value = "LD [$FF00 + a8], A"
             },
@@ -1445,7 +1445,7 @@ namespace GameBoyEmulator.Desktop.Disasm {
             },
             new Instruction {
                 Flags = new []{ "-", "-", "-", "-" },
-                Length = 1,
+                Length = 2,
                 Opcode = 0xf0,
                 Value = "LD A, [$FF00 + a8]"
             },
@@ -0,0 +1,234 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq.Expressions;
+using System.Reflection;
+
+namespace GameBoyEmulator.Desktop.GBC {
+    /// <summary>
+    /// Translates straight runs of code, from an address up to the next instruction that can branch,
+    /// into a single compiled delegate that calls the instruction handlers back to back.
+    /// Blocks are only compiled once their address was executed HotThreshold times.
+    /// Like the InstructionCache, the switchable bank area keeps one table of blocks per bank, and blocks
+    /// in the fixed bank end at the bank boundary, so they never run code of another bank.
+    /// Code in Work RAM and High RAM is compiled as well. Pages holding it are marked as code pages so
+    /// Memory routes their writes through InvalidateWrite, which drops the blocks overlapping the address.
+    /// </summary>
+    public class BlockCache {
+        private const int HotThreshold = 32;
+        private const int MaxInstructions = 64;
+        private const int RomEnd = 0x8000;
+        private const int BankedRom = 0x4000;
+        private const int WorkRamStart = 0xC000;
+        private const int WorkRamEnd = 0xE000; // The echo at 0xE000 is interpreted
+        private const int HighRamStart = 0xFF80;
+        private const int HighRamEnd = 0xFFFF;
+
+        private static readonly MethodInfo BeginInstruction =
+            typeof(CPU).GetMethod("BeginInstruction", BindingFlags.Instance | BindingFlags.NonPublic);
+        private static readonly MethodInfo FinishInstruction =
+            typeof(CPU).GetMethod("FinishInstruction", BindingFlags.Instance | BindingFlags.NonPublic);
+
+        private readonly CPU cpu;
+        // Blocks outside of the switchable bank area, indexed by address
+        private readonly CompiledBlock[] blocks = new CompiledBlock[0x10000];
+        private readonly Dictionary<int, CompiledBlock[]> bankBlocks = new Dictionary<int, CompiledBlock[]>();
+        private CompiledBlock[] currentBank;
+        private int currentBankNumber = -1;
+        private readonly byte[] hits = new byte[0x10000];
+
+        /// <summary>
+        /// RAM blocks overlapping each page, null for pages without compiled code
+        /// </summary>
+        private readonly List<CompiledBlock>[] pageBlocks = new List<CompiledBlock>[256];
+
+        /// <summary>
+        /// Set when a write invalidated compiled code. The running block may be stale, so it stops.
+        /// </summary>
+        internal bool CodeModified;
+
+        public BlockCache(CPU cpu) {
+            this.cpu = cpu;
+        }
+
+        public void Clear() {
+            Array.Clear(blocks, 0, blocks.Length);
+            Array.Clear(hits, 0, hits.Length);
+            bankBlocks.Clear();
+            currentBank = null;
+            currentBankNumber = -1;
+            for (var page = 0; page < pageBlocks.Length; page++) {
+                if (pageBlocks[page] == null) continue;
+                pageBlocks[page] = null;
+                cpu.memory.SetCodePage(page, false);
+            }
+        }
+
+        /// <summary>
+        /// Drops the RAM blocks that contain the written address
+        /// </summary>
+        /// <param name="addr"></param>
+        internal void InvalidateWrite(int addr) {
+            var list = pageBlocks[addr >> 8];
+            if (list == null) return;
+
+            for (var i = list.Count - 1; i >= 0; i--) {
+                var block = list[i];
+                if (addr >= block.Address && addr < block.End) {
+                    Remove(block);
+                }
+            }
+        }
+
+        private void Remove(CompiledBlock block) {
+            if (blocks[block.Address] == block) {
+                blocks[block.Address] = null;
+            }
+            for (var page = block.Address >> 8; page <= (block.End - 1) >> 8; page++) {
+                var list = pageBlocks[page];
+                list.Remove(block);
+                if (list.Count == 0) {
+                    pageBlocks[page] = null;
+                    cpu.memory.SetCodePage(page, false);
+                }
+            }
+            CodeModified = true;
+        }
+
+        private void Add(CompiledBlock block) {
+            for (var page = block.Address >> 8; page <= (block.End - 1) >> 8; page++) {
+                if (pageBlocks[page] == null) {
+                    pageBlocks[page] = new List<CompiledBlock>();
+                    cpu.memory.SetCodePage(page, true);
+                }
+                pageBlocks[page].Add(block);
+            }
+        }
+
+        /// <summary>
+        /// End of the region where a block starting at the address may be compiled, 0 if it can not
+        /// </summary>
+        /// <param name="pc"></param>
+        /// <returns></returns>
+        private static int RegionEnd(int pc) {
+            if (pc < BankedRom) return BankedRom;
+            if (pc < RomEnd) return RomEnd;
+            if (pc >= WorkRamStart && pc < WorkRamEnd) return WorkRamEnd;
+            if (pc >= HighRamStart && pc < HighRamEnd) return HighRamEnd;
+            return 0;
+        }
+
+        /// <summary>
+        /// Returns the block that starts at the address, or null if it should be interpreted
+        /// </summary>
+        /// <param name="pc"></param>
+        /// <returns></returns>
+        internal CompiledBlock Get(int pc) {
+            // The BIOS overlays the ROM and leaves it by reading 0x100, so it is always interpreted
+            var regionEnd = RegionEnd(pc);
+            if (regionEnd == 0 || cpu.memory.inBIOS) return null;
+
+            var table = blocks;
+            var index = pc;
+            if (pc >= BankedRom && pc < RomEnd) {
+                table = SwitchableBank();
+                index -= BankedRom;
+            }
+
+            var block = table[index];
+            if (block != null) {
+                return block;
+            }
+
+            if (++hits[pc] < HotThreshold) return null;
+
+            hits[pc] = 0;
+            block = Compile(pc, regionEnd);
+            table[index] = block;
+            if (pc >= RomEnd) {
+                Add(block);
+            }
+            return block;
+        }
+
+        private CompiledBlock[] SwitchableBank() {
+            var bank = cpu.memory.CurrentBank;
+            if (bank == currentBankNumber) {
+                return currentBank;
+            }
+
+            if (!bankBlocks.TryGetValue(bank, out currentBank)) {
+                currentBank = new CompiledBlock[RomEnd - BankedRom];
+                bankBlocks[bank] = currentBank;
+            }
+            currentBankNumber = bank;
+            return currentBank;
+        }
+
+        private CompiledBlock Compile(int address, int regionEnd) {
+            var memory = cpu.memory;
+            var cpuParam = Expression.Parameter(typeof(CPU), "cpu");
+            var exit = Expression.Label("exit");
+            var body = new List<Expression>();
+
+            var pc = address;
+            for (var i = 0; i < MaxInstructions; i++) {
+                OpcodeEntry entry;
+                int next;
+                int length;
+                if (pc < RomEnd) {
+                    // Same decoding as Cycle, so superinstructions run in compiled blocks too
+                    var op = cpu.instructions.Get(pc);
+                    var cbPrefixed = op >> 8 == 1;
+                    entry = cpu.instructions.Entries[op];
+                    next = pc + (cbPrefixed ? 2 : 1);
+                    length = cbPrefixed ? 2 : entry.Length;
+                } else {
+                    var op = (int) memory.ReadByte(pc);
+                    next = pc + 1;
+                    length = CPUInstructions.Dispatch[op].Length;
+                    if (op == 0xCB) {
+                        // CB Prefixed opcodes are at the upper half of the dispatch table
+                        op = 0x100 | memory.ReadByte(pc + 1);
+                        next++;
+                    }
+                    entry = CPUInstructions.Dispatch[op];
+                }
+
+                var handler = entry.Handler;
+                body.Add(Expression.Call(cpuParam, BeginInstruction, Expression.Constant(next)));
+                body.Add(handler.Target == null
+                    ? (Expression) Expression.Call(handler.Method, cpuParam)
+                    : Expression.Invoke(Expression.Constant(handler), cpuParam));
+
+                pc += length;
+                if (entry.EndsBlock || i == MaxInstructions - 1 || pc >= regionEnd) {
+                    body.Add(Expression.Call(cpuParam, FinishInstruction));
+                    break;
+                }
+
+                // An interrupt leaves the block, the handler runs on the next call
+                body.Add(Expression.IfThen(Expression.Call(cpuParam, FinishInstruction), Expression.Return(exit)));
+            }
+            body.Add(Expression.Label(exit));
+
+            return new CompiledBlock {
+                Address = address,
+                End = Math.Min(pc, regionEnd),
+                // ldh, cp/and and a jr back to the ldh
+                IdleLoop = pc == address + 6 && cpu.IsIdleLoop(address) && memory.ReadByte(address + 5) == 0xFA,
+                Run = Expression.Lambda<Action<CPU>>(Expression.Block(body), cpuParam).Compile(),
+            };
+        }
+    }
+
+    internal class CompiledBlock {
+        public int Address;
+        public int End;
+
+        /// <summary>
+        /// The block is a whole LY/STAT polling loop, see CPU.IdleLoopSkip
+        /// </summary>
+        public bool IdleLoop;
+        public Action<CPU> Run;
+    }
+}
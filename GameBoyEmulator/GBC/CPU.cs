@@ -1,5 +1,6 @@
 ﻿using System;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Runtime.InteropServices;
 using System.Threading;
 using GameBoyEmulator.Desktop.Disasm;
@@ -8,8 +9,8 @@ namespace GameBoyEmulator.Desktop.GBC {
     public class CPU {
         internal const int CPU_CLOCK = 4194304;
         internal const float CPU_PERIOD_MS = 1000f / CPU_CLOCK;
-
-        private DateTime LastUpdate;
+        internal const int FRAME_CYCLES = 70224;
+        internal const double FRAME_PERIOD_MS = 1000.0 * FRAME_CYCLES / CPU_CLOCK; // 59.73 Hz
 
         internal Disassembler disasm;
         
@@ -19,17 +20,28 @@ namespace GameBoyEmulator.Desktop.GBC {
         internal Memory memory;
         internal GBKeys GbKeys;
         internal GBTimer timer;
+        internal Scheduler scheduler;
+        internal BlockCache blocks;
+        internal InstructionCache instructions;
         internal bool _halt;
         internal GPU gpu;
-        internal bool running;
-        internal bool paused;
-        internal bool step;
+        internal volatile bool running;
+        internal volatile bool paused;
+        internal volatile bool step;
+        internal volatile bool resetPending;
         internal bool stopped;
 
         internal Thread cpuThread;
 
-        internal Mutex mtx;
-        internal double lastCycleTimeMs;
+        internal double lastFrameTimeMs;
+
+        #region Idle Loops
+        // ldh a,(LY/STAT); cp/and n; jr nz/z,-6 polling loops, like the one in the BIOS.
+        // Once an iteration leaves A and F as it found them, the following ones only burn cycles
+        // until the polled register changes, so they are skipped in one go.
+        private const int IdleLoopCycles = 12 + 8 + 12;
+        private int idleLoopAt = -1;
+        #endregion
         
         public delegate void PauseEvent();
 
@@ -37,19 +49,20 @@ namespace GameBoyEmulator.Desktop.GBC {
         
         public CPU() {
             reg = new CPURegisters();
+            scheduler = new Scheduler();
             memory = new Memory(this);
             gpu = new GPU(this);
-            mtx = new Mutex();
             GbKeys = new GBKeys(this);
             timer = new GBTimer(this);
-            Reset();
-            LastUpdate = DateTime.Now;
+            blocks = new BlockCache(this);
+            instructions = new InstructionCache(this);
+            ResetState();
             cpuThread = new Thread(() => Update());
             cpuThread.IsBackground = true;
             running = false;
             paused = true;
             step = false;
-            lastCycleTimeMs = 0;
+            lastFrameTimeMs = 0;
             disasm = new Disassembler();
 
             Console.WriteLine(disasm.Disasm(0x0000, memory._bios));
@@ -68,22 +81,16 @@ namespace GameBoyEmulator.Desktop.GBC {
         }
 
         public void Step() {
-            mtx.WaitOne();
-            paused = false;
             step = true;
-            mtx.ReleaseMutex();
+            paused = false;
         }
 
         public void Continue() {
-            mtx.WaitOne();
             paused = false;
-            mtx.ReleaseMutex();
         }
 
         public void Pause() {
-            mtx.WaitOne();
             paused = true;
-            mtx.ReleaseMutex();
             OnPause?.Invoke();
         }
         
@@ -94,63 +101,202 @@ namespace GameBoyEmulator.Desktop.GBC {
             cpuThread.Join();
         }
 
+        /// <summary>
+        /// Resets the machine. When the CPU thread is running the reset is deferred to the next frame boundary.
+        /// </summary>
         public void Reset() {
-            mtx.WaitOne();
+            if (running) {
+                resetPending = true;
+            } else {
+                ResetState();
+            }
+        }
+
+        private void ResetState() {
+            gpu.SyncRenderer();
             _halt = false;
+            idleLoopAt = -1;
             clockT = 0;
             clockM = 0;
             stopped = false;
+            scheduler.Reset();
             reg.Reset();
             memory.Reset();
             gpu.Reset();
             GbKeys.Reset();
             timer.Reset();
-            mtx.ReleaseMutex();
+            blocks.Clear();
+            instructions.Clear();
         }
 
         public void Update() {
             Console.WriteLine("CPU Update Thread Started");
+            var stopwatch = Stopwatch.StartNew();
+            var nextFrameMs = 0.0;
             while (running) {
-                if (!paused) {
-                    var delta = DateTime.Now - LastUpdate;
-                    //if (!(delta.TotalMilliseconds > CPU_PERIOD_MS)) continue;
-                    lastCycleTimeMs = delta.TotalMilliseconds;
+                if (resetPending) {
+                    resetPending = false;
+                    ResetState();
+                }
+
+                if (step) {
+                    step = false;
                     Cycle();
-                    LastUpdate = DateTime.Now;
-                    
-                    if (!step) continue;
-                    
-                        step = false;
                     paused = true;
                     OnPause?.Invoke();
-                } else {
+                    continue;
+                }
+
+                if (paused) {
                     Thread.Sleep(10);
+                    nextFrameMs = stopwatch.Elapsed.TotalMilliseconds;
+                    continue;
                 }
+
+                var frameStartMs = stopwatch.Elapsed.TotalMilliseconds;
+                RunFrame();
+                var nowMs = stopwatch.Elapsed.TotalMilliseconds;
+                lastFrameTimeMs = nowMs - frameStartMs;
+
+                nextFrameMs += FRAME_PERIOD_MS;
+                if (nowMs - nextFrameMs > FRAME_PERIOD_MS * 4) {
+                    // Too far behind (host hiccup), do not try to catch up
+                    nextFrameMs = nowMs;
+                }
+
+                WaitUntil(stopwatch, nextFrameMs);
             }
             Console.WriteLine("CPU Update Thread Stopped");
         }
 
+        /// <summary>
+        /// Runs a whole frame worth of cycles without any pacing.
+        /// </summary>
+        public void RunFrame() {
+            var startClockT = clockT;
+            while (clockT - startClockT < FRAME_CYCLES) {
+                RunBlock();
+            }
+        }
+
+        private static void WaitUntil(Stopwatch stopwatch, double targetMs) {
+            double remainingMs;
+            while ((remainingMs = targetMs - stopwatch.Elapsed.TotalMilliseconds) > 0) {
+                if (remainingMs > 2) {
+                    Thread.Sleep((int) remainingMs - 1);
+                } else {
+                    Thread.Yield();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Marks the loop a JR NZ/Z just branched back to as an idle loop, when it is one
+        /// </summary>
+        /// <param name="jrAddr">Address of the JR</param>
+        internal void DetectIdleLoop(int jrAddr) {
+            if (reg.PC == jrAddr - 4 && IsIdleLoop(reg.PC)) {
+                idleLoopAt = reg.PC;
+            }
+        }
+
+        internal bool IsIdleLoop(int addr) {
+            var register = memory.ReadByte(addr + 1);
+            var op = memory.ReadByte(addr + 2);
+            return memory.ReadByte(addr) == 0xF0 &&
+                   (register == 0x44 || register == 0x41) &&
+                   (op == 0xFE || op == 0xE6);
+        }
+
+        /// <summary>
+        /// Cycles of idle loop iterations that can be skipped, 0 if the next iteration would change anything
+        /// </summary>
+        /// <returns></returns>
+        private int IdleLoopSkip() {
+            if (stopped) return 0;
+
+            var pc = reg.PC;
+            var value = memory.ReadByte(0xFF00 + memory.ReadByte(pc + 1));
+            if (memory.ReadByte(pc + 2) == 0xE6) {
+                value &= memory.ReadByte(pc + 3);
+            }
+            if (value != reg.A) return 0;
+
+            // Reads done before then return the same value, and every interrupt comes from a scheduled event
+            var until = Math.Min(scheduler.NextEventAt, gpu.NextStatusChangeAt());
+            var span = (int) Math.Min(until - scheduler.Now, FRAME_CYCLES);
+            return span / IdleLoopCycles * IdleLoopCycles;
+        }
+
         public void Cycle() {
-            mtx.WaitOne();
             // Normal Cycle
             reg.CycleCount++;
             var totalClockM = 0;
             var totalClockT = 0;
             if (_halt) {
-                totalClockM += 1;
-                totalClockT += 4;
+                // Nothing but an interrupt can wake the CPU, and interrupts are only raised by scheduled events.
+                // So skip straight to the next one instead of spinning 4 cycles at a time.
+                var skip = 4;
+                if (!stopped) {
+                    skip = Math.Max(4, (int) Math.Min(scheduler.NextEventAt - scheduler.Now + 3, FRAME_CYCLES) & ~3);
+                }
+                // Counted as the 4 cycle steps it replaces, like the idle loop skip counts its iterations
+                reg.CycleCount += skip / 4 - 1;
+                totalClockM += skip / 4;
+                totalClockT += skip;
             } else {
-                var op = memory.ReadByte(reg.PC);
-                reg.PC++;
-                CPUInstructions.opcodes[op](this);
-                totalClockM += reg.lastClockM;
-                totalClockT += reg.lastClockT;
+                // Only right after the loop branched back, interrupts could have run anything in between
+                var idleSkip = idleLoopAt == reg.PC ? IdleLoopSkip() : 0;
+                idleLoopAt = -1;
+                if (idleSkip > 0) {
+                    reg.CycleCount += idleSkip / IdleLoopCycles * 3 - 1;
+                    totalClockM += idleSkip / 4;
+                    totalClockT += idleSkip;
+                } else {
+                    var pc = reg.PC;
+                    int op;
+                    Action<CPU> handler;
+                    if (pc < 0x8000 && !memory.inBIOS) {
+                        // The BIOS leaves its overlay when 0x100 is fetched, so it is never predecoded
+                        op = instructions.Get(pc);
+                        reg.PC = (ushort) (pc + (op >> 8 == 1 ? 2 : 1));
+                        handler = instructions.Entries[op].Handler;
+                    } else {
+                        op = memory.ReadByte(pc);
+                        reg.PC++;
+                        if (op == 0xCB) {
+                            // CB Prefixed opcodes are at the upper half of the dispatch table
+                            op = 0x100 | memory.ReadByte(reg.PC);
+                            reg.PC++;
+                        }
+                        handler = CPUInstructions.Dispatch[op].Handler;
+                    }
+                    handler(this);
+                    totalClockM += reg.lastClockM;
+                    totalClockT += reg.lastClockT;
+
+                    if (op == 0x20 || op == 0x28) {
+                        DetectIdleLoop(pc);
+                    }
+                }
             }
 
+            EndInstruction(totalClockM, totalClockT);
+        }
+
+        /// <summary>
+        /// Dispatches pending interrupts, then advances the clocks and the peripherals
+        /// </summary>
+        /// <param name="totalClockM"></param>
+        /// <param name="totalClockT"></param>
+        /// <returns>true if an interrupt was dispatched</returns>
+        internal bool EndInstruction(int totalClockM, int totalClockT) {
+            var interrupted = false;
             // Check Interrupts
             if (reg.InterruptEnable && reg.EnabledInterrupts != 0 && reg.TriggerInterrupts != 0) {
                 _halt = false;
                 reg.InterruptEnable = false;
+                interrupted = true;
                 var interruptsFired = reg.EnabledInterrupts & reg.TriggerInterrupts;
                 if ((interruptsFired & Flags.INT_VBLANK) > 0) {
                     reg.TriggerInterrupts &= (byte) ~Flags.INT_VBLANK;
@@ -182,6 +328,7 @@ namespace GameBoyEmulator.Desktop.GBC {
                     totalClockT += reg.lastClockT;
                 } else {
                     reg.InterruptEnable = true;
+                    interrupted = false;
                 }
             }
             
@@ -189,14 +336,73 @@ namespace GameBoyEmulator.Desktop.GBC {
             clockT += totalClockT;
 
             if (!stopped) {
-                // GPU
-                gpu.Cycle();
+                // GPU and Timers
+                scheduler.Advance(totalClockT);
+            }
+
+            return interrupted;
+        }
+
+        #region Superinstructions
+        /// <summary>
+        /// Set when a superinstruction stopped at an interrupt, so the compiled block running it stops as well
+        /// </summary>
+        private bool chainInterrupted;
+
+        /// <summary>
+        /// Called by superinstructions between two of their instructions, does what Cycle does between them
+        /// </summary>
+        /// <param name="pc">Address after the opcode of the next instruction</param>
+        /// <returns>false if an interrupt was dispatched, so the superinstruction must stop</returns>
+        internal bool ChainInstruction(int pc) {
+            if (EndInstruction(reg.lastClockM, reg.lastClockT)) {
+                // Already accounted for, nothing is left for Cycle to add
+                reg.lastClockM = 0;
+                reg.lastClockT = 0;
+                chainInterrupted = true;
+                return false;
+            }
+
+            BeginInstruction(pc);
+            return true;
+        }
+        #endregion
+
+        #region Compiled Blocks
+        /// <summary>
+        /// Runs the compiled block at PC, or a single instruction when there is none
+        /// </summary>
+        public void RunBlock() {
+            var block = _halt || idleLoopAt != -1 ? null : blocks.Get(reg.PC);
+            if (block == null) {
+                Cycle();
+                return;
+            }
 
-                // Timers
-                timer.Increment();
+            blocks.CodeModified = false;
+            chainInterrupted = false;
+            block.Run(this);
+            if (block.IdleLoop && reg.PC == block.Address) {
+                idleLoopAt = reg.PC;
             }
+        }
+
+        /// <summary>
+        /// Called by compiled blocks before each instruction handler
+        /// </summary>
+        /// <param name="pc">Address after the opcode</param>
+        internal void BeginInstruction(int pc) {
+            reg.CycleCount++;
+            reg.PC = (ushort) pc;
+        }
 
-            mtx.ReleaseMutex();
+        /// <summary>
+        /// Called by compiled blocks after each instruction handler
+        /// </summary>
+        /// <returns>true if an interrupt was dispatched or code was modified, so the block must stop</returns>
+        internal bool FinishInstruction() {
+            return EndInstruction(reg.lastClockM, reg.lastClockT) || chainInterrupted || blocks.CodeModified;
         }
+        #endregion
     }
 }
@@ -0,0 +1,6315 @@
+using System;
+
+namespace GameBoyEmulator.Desktop.GBC {
+    // AUTO GENERATED FILE - PLEASE CHECK Generators/gen.py! //
+    public static partial class CPUInstructions {
+        #region Specialized Handlers
+        /// <summary>
+        /// 0x01 - LD BC, d16
+        /// </summary>
+        private static void LD__nn_B_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.B = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// 0x02 - LD [BC], A
+        /// </summary>
+        private static void LD__m_B_C_A(CPU cpu) {
+            var reg = cpu.reg;
+            var hl = (reg.B << 8) + reg.C;
+            cpu.memory.WriteByte(hl, reg.A);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x03 - INC BC
+        /// </summary>
+        private static void INC_B_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C++;
+            if (reg.C == 0) {
+                reg.B++;
+            }
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x04 - INC B
+        /// </summary>
+        private static void INCr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.B;
+            var v2 = (byte) (v + 1);
+            reg.B = v2;
+
+            reg.IncFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x05 - DEC B
+        /// </summary>
+        private static void DECr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.B;
+            var v2 = (byte) (v - 1);
+            reg.B = v2;
+
+            reg.DecFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x06 - LD B, d8
+        /// </summary>
+        private static void LDrn_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.B = b;
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x09 - ADD HL, BC
+        /// </summary>
+        private static void ADDHL_B_C(CPU cpu) {
+            var reg = cpu.reg;
+            var hl = reg.HL;
+            var ab = (reg.B << 8) + reg.C;
+            var sum = hl + ab;
+
+            reg.FlagCarry = sum > 65535;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = ((ab & 0xFFF) + (hl & 0xFFF)) > 0xFFF;
+
+            reg.H = (byte) (sum >> 8);
+            reg.L = (byte) sum;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x0A - LD A, [BC]
+        /// </summary>
+        private static void LD___m_A_B_C(CPU cpu) {
+            var reg = cpu.reg;
+            var hl = (reg.B << 8) + reg.C;
+            reg.A = cpu.memory.ReadByte(hl);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x0B - DEC BC
+        /// </summary>
+        private static void DEC_B_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C--;
+            if (reg.C == 255) {
+                reg.B--;
+            }
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x0C - INC C
+        /// </summary>
+        private static void INCr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.C;
+            var v2 = (byte) (v + 1);
+            reg.C = v2;
+
+            reg.IncFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x0D - DEC C
+        /// </summary>
+        private static void DECr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.C;
+            var v2 = (byte) (v - 1);
+            reg.C = v2;
+
+            reg.DecFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x0E - LD C, d8
+        /// </summary>
+        private static void LDrn_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.C = b;
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x11 - LD DE, d16
+        /// </summary>
+        private static void LD__nn_D_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.D = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// 0x12 - LD [DE], A
+        /// </summary>
+        private static void LD__m_D_E_A(CPU cpu) {
+            var reg = cpu.reg;
+            var hl = (reg.D << 8) + reg.E;
+            cpu.memory.WriteByte(hl, reg.A);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x13 - INC DE
+        /// </summary>
+        private static void INC_D_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E++;
+            if (reg.E == 0) {
+                reg.D++;
+            }
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x14 - INC D
+        /// </summary>
+        private static void INCr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.D;
+            var v2 = (byte) (v + 1);
+            reg.D = v2;
+
+            reg.IncFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x15 - DEC D
+        /// </summary>
+        private static void DECr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.D;
+            var v2 = (byte) (v - 1);
+            reg.D = v2;
+
+            reg.DecFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x16 - LD D, d8
+        /// </summary>
+        private static void LDrn_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.D = b;
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x19 - ADD HL, DE
+        /// </summary>
+        private static void ADDHL_D_E(CPU cpu) {
+            var reg = cpu.reg;
+            var hl = reg.HL;
+            var ab = (reg.D << 8) + reg.E;
+            var sum = hl + ab;
+
+            reg.FlagCarry = sum > 65535;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = ((ab & 0xFFF) + (hl & 0xFFF)) > 0xFFF;
+
+            reg.H = (byte) (sum >> 8);
+            reg.L = (byte) sum;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x1A - LD A, [DE]
+        /// </summary>
+        private static void LD___m_A_D_E(CPU cpu) {
+            var reg = cpu.reg;
+            var hl = (reg.D << 8) + reg.E;
+            reg.A = cpu.memory.ReadByte(hl);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x1B - DEC DE
+        /// </summary>
+        private static void DEC_D_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E--;
+            if (reg.E == 255) {
+                reg.D--;
+            }
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x1C - INC E
+        /// </summary>
+        private static void INCr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.E;
+            var v2 = (byte) (v + 1);
+            reg.E = v2;
+
+            reg.IncFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x1D - DEC E
+        /// </summary>
+        private static void DECr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.E;
+            var v2 = (byte) (v - 1);
+            reg.E = v2;
+
+            reg.DecFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x1E - LD E, d8
+        /// </summary>
+        private static void LDrn_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.E = b;
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x21 - LD HL, d16
+        /// </summary>
+        private static void LD__nn_H_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.H = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// 0x23 - INC HL
+        /// </summary>
+        private static void INC_H_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L++;
+            if (reg.L == 0) {
+                reg.H++;
+            }
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x24 - INC H
+        /// </summary>
+        private static void INCr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.H;
+            var v2 = (byte) (v + 1);
+            reg.H = v2;
+
+            reg.IncFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x25 - DEC H
+        /// </summary>
+        private static void DECr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.H;
+            var v2 = (byte) (v - 1);
+            reg.H = v2;
+
+            reg.DecFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x26 - LD H, d8
+        /// </summary>
+        private static void LDrn_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.H = b;
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x29 - ADD HL, HL
+        /// </summary>
+        private static void ADDHL_H_L(CPU cpu) {
+            var reg = cpu.reg;
+            var hl = reg.HL;
+            var ab = (reg.H << 8) + reg.L;
+            var sum = hl + ab;
+
+            reg.FlagCarry = sum > 65535;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = ((ab & 0xFFF) + (hl & 0xFFF)) > 0xFFF;
+
+            reg.H = (byte) (sum >> 8);
+            reg.L = (byte) sum;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x2B - DEC HL
+        /// </summary>
+        private static void DEC_H_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L--;
+            if (reg.L == 255) {
+                reg.H--;
+            }
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x2C - INC L
+        /// </summary>
+        private static void INCr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.L;
+            var v2 = (byte) (v + 1);
+            reg.L = v2;
+
+            reg.IncFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x2D - DEC L
+        /// </summary>
+        private static void DECr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.L;
+            var v2 = (byte) (v - 1);
+            reg.L = v2;
+
+            reg.DecFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x2E - LD L, d8
+        /// </summary>
+        private static void LDrn_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.L = b;
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x3C - INC A
+        /// </summary>
+        private static void INCr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.A;
+            var v2 = (byte) (v + 1);
+            reg.A = v2;
+
+            reg.IncFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x3D - DEC A
+        /// </summary>
+        private static void DECr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.A;
+            var v2 = (byte) (v - 1);
+            reg.A = v2;
+
+            reg.DecFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x3E - LD A, d8
+        /// </summary>
+        private static void LDrn_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.A = b;
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x40 - LD B, B
+        /// </summary>
+        private static void LDrr_B_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x41 - LD B, C
+        /// </summary>
+        private static void LDrr_B_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B = reg.C;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x42 - LD B, D
+        /// </summary>
+        private static void LDrr_B_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B = reg.D;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x43 - LD B, E
+        /// </summary>
+        private static void LDrr_B_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B = reg.E;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x44 - LD B, H
+        /// </summary>
+        private static void LDrr_B_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B = reg.H;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x45 - LD B, L
+        /// </summary>
+        private static void LDrr_B_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B = reg.L;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x46 - LD B, [HL]
+        /// </summary>
+        private static void LDrHLm_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B = cpu.memory.ReadByte(reg.HL);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x47 - LD B, A
+        /// </summary>
+        private static void LDrr_B_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B = reg.A;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x48 - LD C, B
+        /// </summary>
+        private static void LDrr_C_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C = reg.B;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x49 - LD C, C
+        /// </summary>
+        private static void LDrr_C_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x4A - LD C, D
+        /// </summary>
+        private static void LDrr_C_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C = reg.D;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x4B - LD C, E
+        /// </summary>
+        private static void LDrr_C_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C = reg.E;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x4C - LD C, H
+        /// </summary>
+        private static void LDrr_C_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C = reg.H;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x4D - LD C, L
+        /// </summary>
+        private static void LDrr_C_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C = reg.L;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x4E - LD C, [HL]
+        /// </summary>
+        private static void LDrHLm_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C = cpu.memory.ReadByte(reg.HL);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x4F - LD C, A
+        /// </summary>
+        private static void LDrr_C_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C = reg.A;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x50 - LD D, B
+        /// </summary>
+        private static void LDrr_D_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D = reg.B;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x51 - LD D, C
+        /// </summary>
+        private static void LDrr_D_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D = reg.C;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x52 - LD D, D
+        /// </summary>
+        private static void LDrr_D_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x53 - LD D, E
+        /// </summary>
+        private static void LDrr_D_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D = reg.E;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x54 - LD D, H
+        /// </summary>
+        private static void LDrr_D_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D = reg.H;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x55 - LD D, L
+        /// </summary>
+        private static void LDrr_D_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D = reg.L;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x56 - LD D, [HL]
+        /// </summary>
+        private static void LDrHLm_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D = cpu.memory.ReadByte(reg.HL);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x57 - LD D, A
+        /// </summary>
+        private static void LDrr_D_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D = reg.A;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x58 - LD E, B
+        /// </summary>
+        private static void LDrr_E_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E = reg.B;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x59 - LD E, C
+        /// </summary>
+        private static void LDrr_E_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E = reg.C;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x5A - LD E, D
+        /// </summary>
+        private static void LDrr_E_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E = reg.D;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x5B - LD E, E
+        /// </summary>
+        private static void LDrr_E_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x5C - LD E, H
+        /// </summary>
+        private static void LDrr_E_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E = reg.H;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x5D - LD E, L
+        /// </summary>
+        private static void LDrr_E_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E = reg.L;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x5E - LD E, [HL]
+        /// </summary>
+        private static void LDrHLm_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E = cpu.memory.ReadByte(reg.HL);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x5F - LD E, A
+        /// </summary>
+        private static void LDrr_E_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E = reg.A;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x60 - LD H, B
+        /// </summary>
+        private static void LDrr_H_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H = reg.B;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x61 - LD H, C
+        /// </summary>
+        private static void LDrr_H_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H = reg.C;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x62 - LD H, D
+        /// </summary>
+        private static void LDrr_H_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H = reg.D;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x63 - LD H, E
+        /// </summary>
+        private static void LDrr_H_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H = reg.E;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x64 - LD H, H
+        /// </summary>
+        private static void LDrr_H_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x65 - LD H, L
+        /// </summary>
+        private static void LDrr_H_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H = reg.L;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x66 - LD H, [HL]
+        /// </summary>
+        private static void LDrHLm_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H = cpu.memory.ReadByte(reg.HL);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x67 - LD H, A
+        /// </summary>
+        private static void LDrr_H_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H = reg.A;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x68 - LD L, B
+        /// </summary>
+        private static void LDrr_L_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L = reg.B;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x69 - LD L, C
+        /// </summary>
+        private static void LDrr_L_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L = reg.C;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x6A - LD L, D
+        /// </summary>
+        private static void LDrr_L_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L = reg.D;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x6B - LD L, E
+        /// </summary>
+        private static void LDrr_L_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L = reg.E;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x6C - LD L, H
+        /// </summary>
+        private static void LDrr_L_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L = reg.H;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x6D - LD L, L
+        /// </summary>
+        private static void LDrr_L_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x6E - LD L, [HL]
+        /// </summary>
+        private static void LDrHLm_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L = cpu.memory.ReadByte(reg.HL);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x6F - LD L, A
+        /// </summary>
+        private static void LDrr_L_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L = reg.A;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x70 - LD [HL], B
+        /// </summary>
+        private static void LDHLmr_B(CPU cpu) {
+            var reg = cpu.reg;
+            cpu.memory.WriteByte(reg.HL, reg.B);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x71 - LD [HL], C
+        /// </summary>
+        private static void LDHLmr_C(CPU cpu) {
+            var reg = cpu.reg;
+            cpu.memory.WriteByte(reg.HL, reg.C);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x72 - LD [HL], D
+        /// </summary>
+        private static void LDHLmr_D(CPU cpu) {
+            var reg = cpu.reg;
+            cpu.memory.WriteByte(reg.HL, reg.D);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x73 - LD [HL], E
+        /// </summary>
+        private static void LDHLmr_E(CPU cpu) {
+            var reg = cpu.reg;
+            cpu.memory.WriteByte(reg.HL, reg.E);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x74 - LD [HL], H
+        /// </summary>
+        private static void LDHLmr_H(CPU cpu) {
+            var reg = cpu.reg;
+            cpu.memory.WriteByte(reg.HL, reg.H);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x75 - LD [HL], L
+        /// </summary>
+        private static void LDHLmr_L(CPU cpu) {
+            var reg = cpu.reg;
+            cpu.memory.WriteByte(reg.HL, reg.L);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x77 - LD [HL], A
+        /// </summary>
+        private static void LDHLmr_A(CPU cpu) {
+            var reg = cpu.reg;
+            cpu.memory.WriteByte(reg.HL, reg.A);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x78 - LD A, B
+        /// </summary>
+        private static void LDrr_A_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A = reg.B;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x79 - LD A, C
+        /// </summary>
+        private static void LDrr_A_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A = reg.C;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x7A - LD A, D
+        /// </summary>
+        private static void LDrr_A_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A = reg.D;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x7B - LD A, E
+        /// </summary>
+        private static void LDrr_A_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A = reg.E;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x7C - LD A, H
+        /// </summary>
+        private static void LDrr_A_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A = reg.H;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x7D - LD A, L
+        /// </summary>
+        private static void LDrr_A_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A = reg.L;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x7E - LD A, [HL]
+        /// </summary>
+        private static void LDrHLm_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A = cpu.memory.ReadByte(reg.HL);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// 0x7F - LD A, A
+        /// </summary>
+        private static void LDrr_A_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x80 - ADD A, B
+        /// </summary>
+        private static void ADDr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var z = (int) reg.B;
+            var sum = reg.A + z;
+
+            reg.AddFlags(reg.A, z, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x81 - ADD A, C
+        /// </summary>
+        private static void ADDr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var z = (int) reg.C;
+            var sum = reg.A + z;
+
+            reg.AddFlags(reg.A, z, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x82 - ADD A, D
+        /// </summary>
+        private static void ADDr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var z = (int) reg.D;
+            var sum = reg.A + z;
+
+            reg.AddFlags(reg.A, z, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x83 - ADD A, E
+        /// </summary>
+        private static void ADDr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var z = (int) reg.E;
+            var sum = reg.A + z;
+
+            reg.AddFlags(reg.A, z, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x84 - ADD A, H
+        /// </summary>
+        private static void ADDr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var z = (int) reg.H;
+            var sum = reg.A + z;
+
+            reg.AddFlags(reg.A, z, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x85 - ADD A, L
+        /// </summary>
+        private static void ADDr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var z = (int) reg.L;
+            var sum = reg.A + z;
+
+            reg.AddFlags(reg.A, z, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x87 - ADD A, A
+        /// </summary>
+        private static void ADDr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var z = (int) reg.A;
+            var sum = reg.A + z;
+
+            reg.AddFlags(reg.A, z, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x88 - ADC A, B
+        /// </summary>
+        private static void ADCr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.B;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A + b + f;
+
+            reg.AddFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x89 - ADC A, C
+        /// </summary>
+        private static void ADCr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.C;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A + b + f;
+
+            reg.AddFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x8A - ADC A, D
+        /// </summary>
+        private static void ADCr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.D;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A + b + f;
+
+            reg.AddFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x8B - ADC A, E
+        /// </summary>
+        private static void ADCr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.E;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A + b + f;
+
+            reg.AddFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x8C - ADC A, H
+        /// </summary>
+        private static void ADCr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.H;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A + b + f;
+
+            reg.AddFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x8D - ADC A, L
+        /// </summary>
+        private static void ADCr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.L;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A + b + f;
+
+            reg.AddFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x8F - ADC A, A
+        /// </summary>
+        private static void ADCr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.A;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A + b + f;
+
+            reg.AddFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x90 - SUB A, B
+        /// </summary>
+        private static void SUBr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.B;
+            var sum = reg.A - b;
+
+            reg.SubFlags(reg.A, b, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x91 - SUB A, C
+        /// </summary>
+        private static void SUBr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.C;
+            var sum = reg.A - b;
+
+            reg.SubFlags(reg.A, b, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x92 - SUB A, D
+        /// </summary>
+        private static void SUBr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.D;
+            var sum = reg.A - b;
+
+            reg.SubFlags(reg.A, b, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x93 - SUB A, E
+        /// </summary>
+        private static void SUBr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.E;
+            var sum = reg.A - b;
+
+            reg.SubFlags(reg.A, b, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x94 - SUB A, H
+        /// </summary>
+        private static void SUBr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.H;
+            var sum = reg.A - b;
+
+            reg.SubFlags(reg.A, b, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x95 - SUB A, L
+        /// </summary>
+        private static void SUBr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.L;
+            var sum = reg.A - b;
+
+            reg.SubFlags(reg.A, b, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x97 - SUB A, A
+        /// </summary>
+        private static void SUBr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.A;
+            var sum = reg.A - b;
+
+            reg.SubFlags(reg.A, b, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x98 - SBC A, B
+        /// </summary>
+        private static void SBCr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.B;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A - b - f;
+
+            reg.SubFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x99 - SBC A, C
+        /// </summary>
+        private static void SBCr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.C;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A - b - f;
+
+            reg.SubFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x9A - SBC A, D
+        /// </summary>
+        private static void SBCr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.D;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A - b - f;
+
+            reg.SubFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x9B - SBC A, E
+        /// </summary>
+        private static void SBCr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.E;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A - b - f;
+
+            reg.SubFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x9C - SBC A, H
+        /// </summary>
+        private static void SBCr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.H;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A - b - f;
+
+            reg.SubFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x9D - SBC A, L
+        /// </summary>
+        private static void SBCr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.L;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A - b - f;
+
+            reg.SubFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0x9F - SBC A, A
+        /// </summary>
+        private static void SBCr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = (int) reg.A;
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A - b - f;
+
+            reg.SubFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xA0 - AND A, B
+        /// </summary>
+        private static void ANDr_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= reg.B;
+
+            reg.AndFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xA1 - AND A, C
+        /// </summary>
+        private static void ANDr_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= reg.C;
+
+            reg.AndFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xA2 - AND A, D
+        /// </summary>
+        private static void ANDr_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= reg.D;
+
+            reg.AndFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xA3 - AND A, E
+        /// </summary>
+        private static void ANDr_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= reg.E;
+
+            reg.AndFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xA4 - AND A, H
+        /// </summary>
+        private static void ANDr_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= reg.H;
+
+            reg.AndFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xA5 - AND A, L
+        /// </summary>
+        private static void ANDr_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= reg.L;
+
+            reg.AndFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xA7 - AND A, A
+        /// </summary>
+        private static void ANDr_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= reg.A;
+
+            reg.AndFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xA8 - XOR A, B
+        /// </summary>
+        private static void XORr_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A ^= reg.B;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xA9 - XOR A, C
+        /// </summary>
+        private static void XORr_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A ^= reg.C;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xAA - XOR A, D
+        /// </summary>
+        private static void XORr_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A ^= reg.D;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xAB - XOR A, E
+        /// </summary>
+        private static void XORr_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A ^= reg.E;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xAC - XOR A, H
+        /// </summary>
+        private static void XORr_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A ^= reg.H;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xAD - XOR A, L
+        /// </summary>
+        private static void XORr_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A ^= reg.L;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xAF - XOR A, A
+        /// </summary>
+        private static void XORr_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A ^= reg.A;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xB0 - OR A, B
+        /// </summary>
+        private static void ORr_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= reg.B;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xB1 - OR A, C
+        /// </summary>
+        private static void ORr_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= reg.C;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xB2 - OR A, D
+        /// </summary>
+        private static void ORr_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= reg.D;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xB3 - OR A, E
+        /// </summary>
+        private static void ORr_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= reg.E;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xB4 - OR A, H
+        /// </summary>
+        private static void ORr_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= reg.H;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xB5 - OR A, L
+        /// </summary>
+        private static void ORr_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= reg.L;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xB7 - OR A, A
+        /// </summary>
+        private static void ORr_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= reg.A;
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xB8 - CP A, B
+        /// </summary>
+        private static void CPr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var a = (int) reg.A;
+            var b = reg.B;
+
+            reg.SubFlags(a, b, 0);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xB9 - CP A, C
+        /// </summary>
+        private static void CPr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var a = (int) reg.A;
+            var b = reg.C;
+
+            reg.SubFlags(a, b, 0);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xBA - CP A, D
+        /// </summary>
+        private static void CPr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var a = (int) reg.A;
+            var b = reg.D;
+
+            reg.SubFlags(a, b, 0);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xBB - CP A, E
+        /// </summary>
+        private static void CPr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var a = (int) reg.A;
+            var b = reg.E;
+
+            reg.SubFlags(a, b, 0);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xBC - CP A, H
+        /// </summary>
+        private static void CPr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var a = (int) reg.A;
+            var b = reg.H;
+
+            reg.SubFlags(a, b, 0);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xBD - CP A, L
+        /// </summary>
+        private static void CPr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var a = (int) reg.A;
+            var b = reg.L;
+
+            reg.SubFlags(a, b, 0);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xBF - CP A, A
+        /// </summary>
+        private static void CPr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var a = (int) reg.A;
+            var b = reg.A;
+
+            reg.SubFlags(a, b, 0);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// 0xC1 - POP BC
+        /// </summary>
+        private static void POP_B_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+            reg.B = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// 0xC5 - PUSH BC
+        /// </summary>
+        private static void PUSH_B_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.B);
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.C);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 16;
+        }
+
+        /// <summary>
+        /// 0xC7 - RST 00H
+        /// </summary>
+        private static void RSTXX_00(CPU cpu) {
+            RSTXX(cpu, 0x00);
+        }
+
+        /// <summary>
+        /// 0xCF - RST 08H
+        /// </summary>
+        private static void RSTXX_08(CPU cpu) {
+            RSTXX(cpu, 0x08);
+        }
+
+        /// <summary>
+        /// 0xD1 - POP DE
+        /// </summary>
+        private static void POP_D_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+            reg.D = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// 0xD3 - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_D3(CPU cpu) {
+            NOPWARN(cpu, 0xD3);
+        }
+
+        /// <summary>
+        /// 0xD5 - PUSH DE
+        /// </summary>
+        private static void PUSH_D_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.D);
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.E);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 16;
+        }
+
+        /// <summary>
+        /// 0xD7 - RST 10H
+        /// </summary>
+        private static void RSTXX_10(CPU cpu) {
+            RSTXX(cpu, 0x10);
+        }
+
+        /// <summary>
+        /// 0xDB - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_DB(CPU cpu) {
+            NOPWARN(cpu, 0xDB);
+        }
+
+        /// <summary>
+        /// 0xDD - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_DD(CPU cpu) {
+            NOPWARN(cpu, 0xDD);
+        }
+
+        /// <summary>
+        /// 0xDF - RST 18H
+        /// </summary>
+        private static void RSTXX_18(CPU cpu) {
+            RSTXX(cpu, 0x18);
+        }
+
+        /// <summary>
+        /// 0xE1 - POP HL
+        /// </summary>
+        private static void POP_H_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+            reg.H = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// 0xE3 - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_E3(CPU cpu) {
+            NOPWARN(cpu, 0xE3);
+        }
+
+        /// <summary>
+        /// 0xE4 - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_E4(CPU cpu) {
+            NOPWARN(cpu, 0xE4);
+        }
+
+        /// <summary>
+        /// 0xE5 - PUSH HL
+        /// </summary>
+        private static void PUSH_H_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.H);
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.L);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 16;
+        }
+
+        /// <summary>
+        /// 0xE7 - RST 20H
+        /// </summary>
+        private static void RSTXX_20(CPU cpu) {
+            RSTXX(cpu, 0x20);
+        }
+
+        /// <summary>
+        /// 0xEA - LD [a16], A
+        /// </summary>
+        private static void LDmm_A(CPU cpu) {
+            var reg = cpu.reg;
+            var addr = cpu.memory.ReadWord(reg.PC);
+            reg.PC += 2;
+            cpu.memory.WriteByte(addr, reg.A);
+            reg.lastClockM += 4;
+            reg.lastClockT += 16;
+        }
+
+        /// <summary>
+        /// 0xEB - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_EB(CPU cpu) {
+            NOPWARN(cpu, 0xEB);
+        }
+
+        /// <summary>
+        /// 0xEC - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_EC(CPU cpu) {
+            NOPWARN(cpu, 0xEC);
+        }
+
+        /// <summary>
+        /// 0xED - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_ED(CPU cpu) {
+            NOPWARN(cpu, 0xED);
+        }
+
+        /// <summary>
+        /// 0xEF - RST 28H
+        /// </summary>
+        private static void RSTXX_28(CPU cpu) {
+            RSTXX(cpu, 0x28);
+        }
+
+        /// <summary>
+        /// 0xF1 - POP AF
+        /// </summary>
+        private static void POP_A_F(CPU cpu) {
+            var reg = cpu.reg;
+            reg.F = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+            reg.A = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// 0xF4 - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_F4(CPU cpu) {
+            NOPWARN(cpu, 0xF4);
+        }
+
+        /// <summary>
+        /// 0xF5 - PUSH AF
+        /// </summary>
+        private static void PUSH_A_F(CPU cpu) {
+            var reg = cpu.reg;
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.A);
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.F);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 16;
+        }
+
+        /// <summary>
+        /// 0xF7 - RST 30H
+        /// </summary>
+        private static void RSTXX_30(CPU cpu) {
+            RSTXX(cpu, 0x30);
+        }
+
+        /// <summary>
+        /// 0xFA - LD A, [a16]
+        /// </summary>
+        private static void LD_mm_A(CPU cpu) {
+            var reg = cpu.reg;
+            var addr = cpu.memory.ReadWord(reg.PC);
+            reg.A = cpu.memory.ReadByte(addr);
+            reg.PC += 2;
+            reg.lastClockM = 4;
+            reg.lastClockT = 16;
+        }
+
+        /// <summary>
+        /// 0xFC - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_FC(CPU cpu) {
+            NOPWARN(cpu, 0xFC);
+        }
+
+        /// <summary>
+        /// 0xFD - UNDEFINED
+        /// </summary>
+        private static void NOPWARN_FD(CPU cpu) {
+            NOPWARN(cpu, 0xFD);
+        }
+
+        /// <summary>
+        /// 0xFF - RST 38H
+        /// </summary>
+        private static void RSTXX_38(CPU cpu) {
+            RSTXX(cpu, 0x38);
+        }
+
+        /// <summary>
+        /// CB00 - RLC B
+        /// </summary>
+        private static void RLCr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.B;
+            var c = v >> 7;
+
+            v = (byte) ((v << 1) | c);
+            reg.B = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB01 - RLC C
+        /// </summary>
+        private static void RLCr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.C;
+            var c = v >> 7;
+
+            v = (byte) ((v << 1) | c);
+            reg.C = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB02 - RLC D
+        /// </summary>
+        private static void RLCr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.D;
+            var c = v >> 7;
+
+            v = (byte) ((v << 1) | c);
+            reg.D = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB03 - RLC E
+        /// </summary>
+        private static void RLCr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.E;
+            var c = v >> 7;
+
+            v = (byte) ((v << 1) | c);
+            reg.E = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB04 - RLC H
+        /// </summary>
+        private static void RLCr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.H;
+            var c = v >> 7;
+
+            v = (byte) ((v << 1) | c);
+            reg.H = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB05 - RLC L
+        /// </summary>
+        private static void RLCr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.L;
+            var c = v >> 7;
+
+            v = (byte) ((v << 1) | c);
+            reg.L = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB07 - RLC A
+        /// </summary>
+        private static void RLCr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.A;
+            var c = v >> 7;
+
+            v = (byte) ((v << 1) | c);
+            reg.A = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB08 - RRC B
+        /// </summary>
+        private static void RRCr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.B;
+            var c = b & 1;
+
+            b = (byte) ((b >> 1) | (c << 7));
+            reg.B = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB09 - RRC C
+        /// </summary>
+        private static void RRCr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.C;
+            var c = b & 1;
+
+            b = (byte) ((b >> 1) | (c << 7));
+            reg.C = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB0A - RRC D
+        /// </summary>
+        private static void RRCr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.D;
+            var c = b & 1;
+
+            b = (byte) ((b >> 1) | (c << 7));
+            reg.D = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB0B - RRC E
+        /// </summary>
+        private static void RRCr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.E;
+            var c = b & 1;
+
+            b = (byte) ((b >> 1) | (c << 7));
+            reg.E = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB0C - RRC H
+        /// </summary>
+        private static void RRCr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.H;
+            var c = b & 1;
+
+            b = (byte) ((b >> 1) | (c << 7));
+            reg.H = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB0D - RRC L
+        /// </summary>
+        private static void RRCr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.L;
+            var c = b & 1;
+
+            b = (byte) ((b >> 1) | (c << 7));
+            reg.L = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB0F - RRC A
+        /// </summary>
+        private static void RRCr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.A;
+            var c = b & 1;
+
+            b = (byte) ((b >> 1) | (c << 7));
+            reg.A = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB10 - RL B
+        /// </summary>
+        private static void RLr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.B;
+            var c = (v >> 7) > 0;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            v = (byte) ((v << 1) | f);
+            reg.B = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB11 - RL C
+        /// </summary>
+        private static void RLr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.C;
+            var c = (v >> 7) > 0;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            v = (byte) ((v << 1) | f);
+            reg.C = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB12 - RL D
+        /// </summary>
+        private static void RLr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.D;
+            var c = (v >> 7) > 0;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            v = (byte) ((v << 1) | f);
+            reg.D = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB13 - RL E
+        /// </summary>
+        private static void RLr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.E;
+            var c = (v >> 7) > 0;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            v = (byte) ((v << 1) | f);
+            reg.E = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB14 - RL H
+        /// </summary>
+        private static void RLr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.H;
+            var c = (v >> 7) > 0;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            v = (byte) ((v << 1) | f);
+            reg.H = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB15 - RL L
+        /// </summary>
+        private static void RLr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.L;
+            var c = (v >> 7) > 0;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            v = (byte) ((v << 1) | f);
+            reg.L = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB17 - RL X
+        /// </summary>
+        private static void RLr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var v = reg.A;
+            var c = (v >> 7) > 0;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            v = (byte) ((v << 1) | f);
+            reg.A = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB18 - RR B
+        /// </summary>
+        private static void RRr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.B;
+            var c = b & 1;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            b = (byte) ((b >> 1) | (f << 7));
+            reg.B = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB19 - RR C
+        /// </summary>
+        private static void RRr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.C;
+            var c = b & 1;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            b = (byte) ((b >> 1) | (f << 7));
+            reg.C = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB1A - RR D
+        /// </summary>
+        private static void RRr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.D;
+            var c = b & 1;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            b = (byte) ((b >> 1) | (f << 7));
+            reg.D = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB1B - RR E
+        /// </summary>
+        private static void RRr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.E;
+            var c = b & 1;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            b = (byte) ((b >> 1) | (f << 7));
+            reg.E = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB1C - RR H
+        /// </summary>
+        private static void RRr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.H;
+            var c = b & 1;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            b = (byte) ((b >> 1) | (f << 7));
+            reg.H = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB1D - RR L
+        /// </summary>
+        private static void RRr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.L;
+            var c = b & 1;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            b = (byte) ((b >> 1) | (f << 7));
+            reg.L = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB1F - RR A
+        /// </summary>
+        private static void RRr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.A;
+            var c = b & 1;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            b = (byte) ((b >> 1) | (f << 7));
+            reg.A = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB20 - SLA B
+        /// </summary>
+        private static void SLAr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.B;
+            var c = b >> 7;
+
+            b = (byte) (b << 1);
+            reg.B = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB21 - SLA C
+        /// </summary>
+        private static void SLAr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.C;
+            var c = b >> 7;
+
+            b = (byte) (b << 1);
+            reg.C = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB22 - SLA D
+        /// </summary>
+        private static void SLAr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.D;
+            var c = b >> 7;
+
+            b = (byte) (b << 1);
+            reg.D = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB23 - SLA E
+        /// </summary>
+        private static void SLAr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.E;
+            var c = b >> 7;
+
+            b = (byte) (b << 1);
+            reg.E = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB24 - SLA H
+        /// </summary>
+        private static void SLAr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.H;
+            var c = b >> 7;
+
+            b = (byte) (b << 1);
+            reg.H = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB25 - SLA L
+        /// </summary>
+        private static void SLAr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.L;
+            var c = b >> 7;
+
+            b = (byte) (b << 1);
+            reg.L = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB27 - SLA A
+        /// </summary>
+        private static void SLAr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.A;
+            var c = b >> 7;
+
+            b = (byte) (b << 1);
+            reg.A = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB28 - SRA B
+        /// </summary>
+        private static void SRAr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.B;
+            var c = (b & 1) > 0;
+            var ext = b & 0x80;
+
+            b = (byte) ((b >> 1) | ext);
+            reg.B = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB29 - SRA C
+        /// </summary>
+        private static void SRAr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.C;
+            var c = (b & 1) > 0;
+            var ext = b & 0x80;
+
+            b = (byte) ((b >> 1) | ext);
+            reg.C = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB2A - SRA D
+        /// </summary>
+        private static void SRAr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.D;
+            var c = (b & 1) > 0;
+            var ext = b & 0x80;
+
+            b = (byte) ((b >> 1) | ext);
+            reg.D = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB2B - SRA E
+        /// </summary>
+        private static void SRAr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.E;
+            var c = (b & 1) > 0;
+            var ext = b & 0x80;
+
+            b = (byte) ((b >> 1) | ext);
+            reg.E = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB2C - SRA H
+        /// </summary>
+        private static void SRAr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.H;
+            var c = (b & 1) > 0;
+            var ext = b & 0x80;
+
+            b = (byte) ((b >> 1) | ext);
+            reg.H = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB2D - SRA L
+        /// </summary>
+        private static void SRAr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.L;
+            var c = (b & 1) > 0;
+            var ext = b & 0x80;
+
+            b = (byte) ((b >> 1) | ext);
+            reg.L = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB2F - SRA A
+        /// </summary>
+        private static void SRAr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.A;
+            var c = (b & 1) > 0;
+            var ext = b & 0x80;
+
+            b = (byte) ((b >> 1) | ext);
+            reg.A = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB30 - SWAP B
+        /// </summary>
+        private static void SWAPr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.B;
+            var swapped = ((b & 0x0F) << 4) | ((b & 0xF0) >> 4);
+            reg.B = (byte) swapped;
+
+            reg.FlagZero = swapped == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = false;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB31 - SWAP C
+        /// </summary>
+        private static void SWAPr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.C;
+            var swapped = ((b & 0x0F) << 4) | ((b & 0xF0) >> 4);
+            reg.C = (byte) swapped;
+
+            reg.FlagZero = swapped == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = false;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB32 - SWAP D
+        /// </summary>
+        private static void SWAPr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.D;
+            var swapped = ((b & 0x0F) << 4) | ((b & 0xF0) >> 4);
+            reg.D = (byte) swapped;
+
+            reg.FlagZero = swapped == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = false;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB33 - SWAP E
+        /// </summary>
+        private static void SWAPr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.E;
+            var swapped = ((b & 0x0F) << 4) | ((b & 0xF0) >> 4);
+            reg.E = (byte) swapped;
+
+            reg.FlagZero = swapped == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = false;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB34 - SWAP H
+        /// </summary>
+        private static void SWAPr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.H;
+            var swapped = ((b & 0x0F) << 4) | ((b & 0xF0) >> 4);
+            reg.H = (byte) swapped;
+
+            reg.FlagZero = swapped == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = false;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB35 - SWAP L
+        /// </summary>
+        private static void SWAPr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.L;
+            var swapped = ((b & 0x0F) << 4) | ((b & 0xF0) >> 4);
+            reg.L = (byte) swapped;
+
+            reg.FlagZero = swapped == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = false;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB37 - SWAP A
+        /// </summary>
+        private static void SWAPr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.A;
+            var swapped = ((b & 0x0F) << 4) | ((b & 0xF0) >> 4);
+            reg.A = (byte) swapped;
+
+            reg.FlagZero = swapped == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = false;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB38 - SRL B
+        /// </summary>
+        private static void SRLr_B(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.B;
+            var c = (b & 1) > 0;
+
+            b = (byte) (b >> 1);
+            reg.B = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB39 - SRL C
+        /// </summary>
+        private static void SRLr_C(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.C;
+            var c = (b & 1) > 0;
+
+            b = (byte) (b >> 1);
+            reg.C = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB3A - SRL D
+        /// </summary>
+        private static void SRLr_D(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.D;
+            var c = (b & 1) > 0;
+
+            b = (byte) (b >> 1);
+            reg.D = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB3B - SRL E
+        /// </summary>
+        private static void SRLr_E(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.E;
+            var c = (b & 1) > 0;
+
+            b = (byte) (b >> 1);
+            reg.E = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB3C - SRL H
+        /// </summary>
+        private static void SRLr_H(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.H;
+            var c = (b & 1) > 0;
+
+            b = (byte) (b >> 1);
+            reg.H = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB3D - SRL L
+        /// </summary>
+        private static void SRLr_L(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.L;
+            var c = (b & 1) > 0;
+
+            b = (byte) (b >> 1);
+            reg.L = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB3F - SRL A
+        /// </summary>
+        private static void SRLr_A(CPU cpu) {
+            var reg = cpu.reg;
+            var b = reg.A;
+            var c = (b & 1) > 0;
+
+            b = (byte) (b >> 1);
+            reg.A = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB40 - BIT 0, B
+        /// </summary>
+        private static void BIT_0_B(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.B & (1 << 0)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB41 - BIT 0, C
+        /// </summary>
+        private static void BIT_0_C(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.C & (1 << 0)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB42 - BIT 0, D
+        /// </summary>
+        private static void BIT_0_D(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.D & (1 << 0)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB43 - BIT 0, E
+        /// </summary>
+        private static void BIT_0_E(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.E & (1 << 0)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB44 - BIT 0, H
+        /// </summary>
+        private static void BIT_0_H(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.H & (1 << 0)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB45 - BIT 0, L
+        /// </summary>
+        private static void BIT_0_L(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.L & (1 << 0)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB46 - BIT 0, [HL]
+        /// </summary>
+        private static void BITm_0(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (cpu.memory.ReadByte(reg.HL) & (1 << 0)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB47 - BIT 0, A
+        /// </summary>
+        private static void BIT_0_A(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.A & (1 << 0)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB48 - BIT 1, B
+        /// </summary>
+        private static void BIT_1_B(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.B & (1 << 1)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB49 - BIT 1, C
+        /// </summary>
+        private static void BIT_1_C(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.C & (1 << 1)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB4A - BIT 1, D
+        /// </summary>
+        private static void BIT_1_D(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.D & (1 << 1)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB4B - BIT 1, E
+        /// </summary>
+        private static void BIT_1_E(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.E & (1 << 1)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB4C - BIT 1, H
+        /// </summary>
+        private static void BIT_1_H(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.H & (1 << 1)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB4D - BIT 1, L
+        /// </summary>
+        private static void BIT_1_L(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.L & (1 << 1)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB4E - BIT 1, [HL]
+        /// </summary>
+        private static void BITm_1(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (cpu.memory.ReadByte(reg.HL) & (1 << 1)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB4F - BIT 1, A
+        /// </summary>
+        private static void BIT_1_A(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.A & (1 << 1)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB50 - BIT 2, B
+        /// </summary>
+        private static void BIT_2_B(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.B & (1 << 2)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB51 - BIT 2, C
+        /// </summary>
+        private static void BIT_2_C(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.C & (1 << 2)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB52 - BIT 2, D
+        /// </summary>
+        private static void BIT_2_D(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.D & (1 << 2)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB53 - BIT 2, E
+        /// </summary>
+        private static void BIT_2_E(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.E & (1 << 2)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB54 - BIT 2, H
+        /// </summary>
+        private static void BIT_2_H(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.H & (1 << 2)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB55 - BIT 2, L
+        /// </summary>
+        private static void BIT_2_L(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.L & (1 << 2)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB56 - BIT 2, [HL]
+        /// </summary>
+        private static void BITm_2(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (cpu.memory.ReadByte(reg.HL) & (1 << 2)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB57 - BIT 2, A
+        /// </summary>
+        private static void BIT_2_A(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.A & (1 << 2)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB58 - BIT 3, B
+        /// </summary>
+        private static void BIT_3_B(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.B & (1 << 3)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB59 - BIT 3, C
+        /// </summary>
+        private static void BIT_3_C(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.C & (1 << 3)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB5A - BIT 3, D
+        /// </summary>
+        private static void BIT_3_D(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.D & (1 << 3)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB5B - BIT 3, E
+        /// </summary>
+        private static void BIT_3_E(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.E & (1 << 3)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB5C - BIT 3, H
+        /// </summary>
+        private static void BIT_3_H(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.H & (1 << 3)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB5D - BIT 3, L
+        /// </summary>
+        private static void BIT_3_L(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.L & (1 << 3)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB5E - BIT 3, [HL]
+        /// </summary>
+        private static void BITm_3(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (cpu.memory.ReadByte(reg.HL) & (1 << 3)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB5F - BIT 3, A
+        /// </summary>
+        private static void BIT_3_A(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.A & (1 << 3)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB60 - BIT 4, B
+        /// </summary>
+        private static void BIT_4_B(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.B & (1 << 4)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB61 - BIT 4, C
+        /// </summary>
+        private static void BIT_4_C(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.C & (1 << 4)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB62 - BIT 4, D
+        /// </summary>
+        private static void BIT_4_D(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.D & (1 << 4)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB63 - BIT 4, E
+        /// </summary>
+        private static void BIT_4_E(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.E & (1 << 4)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB64 - BIT 4, H
+        /// </summary>
+        private static void BIT_4_H(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.H & (1 << 4)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB65 - BIT 4, L
+        /// </summary>
+        private static void BIT_4_L(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.L & (1 << 4)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB66 - BIT 4, [HL]
+        /// </summary>
+        private static void BITm_4(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (cpu.memory.ReadByte(reg.HL) & (1 << 4)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB67 - BIT 4, A
+        /// </summary>
+        private static void BIT_4_A(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.A & (1 << 4)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB68 - BIT 5, B
+        /// </summary>
+        private static void BIT_5_B(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.B & (1 << 5)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB69 - BIT 5, C
+        /// </summary>
+        private static void BIT_5_C(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.C & (1 << 5)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB6A - BIT 5, D
+        /// </summary>
+        private static void BIT_5_D(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.D & (1 << 5)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB6B - BIT 5, E
+        /// </summary>
+        private static void BIT_5_E(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.E & (1 << 5)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB6C - BIT 5, H
+        /// </summary>
+        private static void BIT_5_H(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.H & (1 << 5)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB6D - BIT 5, L
+        /// </summary>
+        private static void BIT_5_L(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.L & (1 << 5)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB6E - BIT 5, [HL]
+        /// </summary>
+        private static void BITm_5(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (cpu.memory.ReadByte(reg.HL) & (1 << 5)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB6F - BIT 5, A
+        /// </summary>
+        private static void BIT_5_A(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.A & (1 << 5)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB70 - BIT 6, B
+        /// </summary>
+        private static void BIT_6_B(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.B & (1 << 6)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB71 - BIT 6, C
+        /// </summary>
+        private static void BIT_6_C(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.C & (1 << 6)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB72 - BIT 6, D
+        /// </summary>
+        private static void BIT_6_D(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.D & (1 << 6)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB73 - BIT 6, E
+        /// </summary>
+        private static void BIT_6_E(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.E & (1 << 6)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB74 - BIT 6, H
+        /// </summary>
+        private static void BIT_6_H(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.H & (1 << 6)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB75 - BIT 6, L
+        /// </summary>
+        private static void BIT_6_L(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.L & (1 << 6)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB76 - BIT 6, [HL]
+        /// </summary>
+        private static void BITm_6(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (cpu.memory.ReadByte(reg.HL) & (1 << 6)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB77 - BIT 6, A
+        /// </summary>
+        private static void BIT_6_A(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.A & (1 << 6)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB78 - BIT 7, B
+        /// </summary>
+        private static void BIT_7_B(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.B & (1 << 7)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB79 - BIT 7, C
+        /// </summary>
+        private static void BIT_7_C(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.C & (1 << 7)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB7A - BIT 7, D
+        /// </summary>
+        private static void BIT_7_D(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.D & (1 << 7)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB7B - BIT 7, E
+        /// </summary>
+        private static void BIT_7_E(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.E & (1 << 7)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB7C - BIT 7, H
+        /// </summary>
+        private static void BIT_7_H(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.H & (1 << 7)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB7D - BIT 7, L
+        /// </summary>
+        private static void BIT_7_L(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.L & (1 << 7)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB7E - BIT 7, [HL]
+        /// </summary>
+        private static void BITm_7(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (cpu.memory.ReadByte(reg.HL) & (1 << 7)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB7F - BIT 7, A
+        /// </summary>
+        private static void BIT_7_A(CPU cpu) {
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.A & (1 << 7)) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
+        }
+
+        /// <summary>
+        /// CB80 - RES 0, B
+        /// </summary>
+        private static void RES_0_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B &= (byte) (~(1 << 0) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB81 - RES 0, C
+        /// </summary>
+        private static void RES_0_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C &= (byte) (~(1 << 0) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB82 - RES 0, D
+        /// </summary>
+        private static void RES_0_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D &= (byte) (~(1 << 0) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB83 - RES 0, E
+        /// </summary>
+        private static void RES_0_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E &= (byte) (~(1 << 0) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB84 - RES 0, H
+        /// </summary>
+        private static void RES_0_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H &= (byte) (~(1 << 0) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB85 - RES 0, L
+        /// </summary>
+        private static void RES_0_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L &= (byte) (~(1 << 0) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB86 - RES 0, [HL]
+        /// </summary>
+        private static void RESHL_0(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b &= (byte) (~(1 << 0) & 0xFF);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB87 - RES 0, A
+        /// </summary>
+        private static void RES_0_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= (byte) (~(1 << 0) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB88 - RES 1, B
+        /// </summary>
+        private static void RES_1_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B &= (byte) (~(1 << 1) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB89 - RES 1, C
+        /// </summary>
+        private static void RES_1_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C &= (byte) (~(1 << 1) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB8A - RES 1, D
+        /// </summary>
+        private static void RES_1_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D &= (byte) (~(1 << 1) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB8B - RES 1, E
+        /// </summary>
+        private static void RES_1_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E &= (byte) (~(1 << 1) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB8C - RES 1, H
+        /// </summary>
+        private static void RES_1_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H &= (byte) (~(1 << 1) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB8D - RES 1, L
+        /// </summary>
+        private static void RES_1_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L &= (byte) (~(1 << 1) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB8E - RES 1, [HL]
+        /// </summary>
+        private static void RESHL_1(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b &= (byte) (~(1 << 1) & 0xFF);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB8F - RES 1, A
+        /// </summary>
+        private static void RES_1_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= (byte) (~(1 << 1) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB90 - RES 2, B
+        /// </summary>
+        private static void RES_2_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B &= (byte) (~(1 << 2) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB91 - RES 2, C
+        /// </summary>
+        private static void RES_2_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C &= (byte) (~(1 << 2) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB92 - RES 2, D
+        /// </summary>
+        private static void RES_2_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D &= (byte) (~(1 << 2) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB93 - RES 2, E
+        /// </summary>
+        private static void RES_2_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E &= (byte) (~(1 << 2) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB94 - RES 2, H
+        /// </summary>
+        private static void RES_2_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H &= (byte) (~(1 << 2) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB95 - RES 2, L
+        /// </summary>
+        private static void RES_2_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L &= (byte) (~(1 << 2) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB96 - RES 2, [HL]
+        /// </summary>
+        private static void RESHL_2(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b &= (byte) (~(1 << 2) & 0xFF);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB97 - RES 2, A
+        /// </summary>
+        private static void RES_2_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= (byte) (~(1 << 2) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB98 - RES 3, B
+        /// </summary>
+        private static void RES_3_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B &= (byte) (~(1 << 3) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB99 - RES 3, C
+        /// </summary>
+        private static void RES_3_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C &= (byte) (~(1 << 3) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB9A - RES 3, D
+        /// </summary>
+        private static void RES_3_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D &= (byte) (~(1 << 3) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB9B - RES 3, E
+        /// </summary>
+        private static void RES_3_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E &= (byte) (~(1 << 3) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB9C - RES 3, H
+        /// </summary>
+        private static void RES_3_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H &= (byte) (~(1 << 3) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB9D - RES 3, L
+        /// </summary>
+        private static void RES_3_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L &= (byte) (~(1 << 3) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CB9E - RES 3, [HL]
+        /// </summary>
+        private static void RESHL_3(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b &= (byte) (~(1 << 3) & 0xFF);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CB9F - RES 3, A
+        /// </summary>
+        private static void RES_3_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= (byte) (~(1 << 3) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBA0 - RES 4, B
+        /// </summary>
+        private static void RES_4_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B &= (byte) (~(1 << 4) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBA1 - RES 4, C
+        /// </summary>
+        private static void RES_4_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C &= (byte) (~(1 << 4) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBA2 - RES 4, D
+        /// </summary>
+        private static void RES_4_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D &= (byte) (~(1 << 4) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBA3 - RES 4, E
+        /// </summary>
+        private static void RES_4_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E &= (byte) (~(1 << 4) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBA4 - RES 4, H
+        /// </summary>
+        private static void RES_4_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H &= (byte) (~(1 << 4) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBA5 - RES 4, L
+        /// </summary>
+        private static void RES_4_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L &= (byte) (~(1 << 4) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBA6 - RES 4, [HL]
+        /// </summary>
+        private static void RESHL_4(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b &= (byte) (~(1 << 4) & 0xFF);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBA7 - RES 4, A
+        /// </summary>
+        private static void RES_4_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= (byte) (~(1 << 4) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBA8 - RES 5, B
+        /// </summary>
+        private static void RES_5_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B &= (byte) (~(1 << 5) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBA9 - RES 5, C
+        /// </summary>
+        private static void RES_5_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C &= (byte) (~(1 << 5) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBAA - RES 5, D
+        /// </summary>
+        private static void RES_5_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D &= (byte) (~(1 << 5) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBAB - RES 5, E
+        /// </summary>
+        private static void RES_5_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E &= (byte) (~(1 << 5) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBAC - RES 5, H
+        /// </summary>
+        private static void RES_5_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H &= (byte) (~(1 << 5) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBAD - RES 5, L
+        /// </summary>
+        private static void RES_5_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L &= (byte) (~(1 << 5) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBAE - RES 5, [HL]
+        /// </summary>
+        private static void RESHL_5(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b &= (byte) (~(1 << 5) & 0xFF);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBAF - RES 5, A
+        /// </summary>
+        private static void RES_5_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= (byte) (~(1 << 5) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBB0 - RES 6, B
+        /// </summary>
+        private static void RES_6_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B &= (byte) (~(1 << 6) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBB1 - RES 6, C
+        /// </summary>
+        private static void RES_6_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C &= (byte) (~(1 << 6) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBB2 - RES 6, D
+        /// </summary>
+        private static void RES_6_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D &= (byte) (~(1 << 6) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBB3 - RES 6, E
+        /// </summary>
+        private static void RES_6_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E &= (byte) (~(1 << 6) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBB4 - RES 6, H
+        /// </summary>
+        private static void RES_6_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H &= (byte) (~(1 << 6) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBB5 - RES 6, L
+        /// </summary>
+        private static void RES_6_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L &= (byte) (~(1 << 6) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBB6 - RES 6, [HL]
+        /// </summary>
+        private static void RESHL_6(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b &= (byte) (~(1 << 6) & 0xFF);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBB7 - RES 6, A
+        /// </summary>
+        private static void RES_6_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= (byte) (~(1 << 6) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBB8 - RES 7, B
+        /// </summary>
+        private static void RES_7_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B &= (byte) (~(1 << 7) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBB9 - RES 7, C
+        /// </summary>
+        private static void RES_7_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C &= (byte) (~(1 << 7) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBBA - RES 7, D
+        /// </summary>
+        private static void RES_7_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D &= (byte) (~(1 << 7) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBBB - RES 7, E
+        /// </summary>
+        private static void RES_7_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E &= (byte) (~(1 << 7) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBBC - RES 7, H
+        /// </summary>
+        private static void RES_7_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H &= (byte) (~(1 << 7) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBBD - RES 7, L
+        /// </summary>
+        private static void RES_7_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L &= (byte) (~(1 << 7) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBBE - RES 7, [HL]
+        /// </summary>
+        private static void RESHL_7(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b &= (byte) (~(1 << 7) & 0xFF);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBBF - RES 7, A
+        /// </summary>
+        private static void RES_7_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A &= (byte) (~(1 << 7) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBC0 - SET 0, B
+        /// </summary>
+        private static void SET_0_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B |= (byte) (1 << 0);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBC1 - SET 0, C
+        /// </summary>
+        private static void SET_0_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C |= (byte) (1 << 0);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBC2 - SET 0, D
+        /// </summary>
+        private static void SET_0_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D |= (byte) (1 << 0);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBC3 - SET 0, E
+        /// </summary>
+        private static void SET_0_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E |= (byte) (1 << 0);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBC4 - SET 0, H
+        /// </summary>
+        private static void SET_0_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H |= (byte) (1 << 0);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBC5 - SET 0, L
+        /// </summary>
+        private static void SET_0_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L |= (byte) (1 << 0);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBC6 - SET 0, [HL]
+        /// </summary>
+        private static void SETHL_0(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b |= (byte) (1 << 0);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBC7 - SET 0, A
+        /// </summary>
+        private static void SET_0_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= (byte) (1 << 0);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBC8 - SET 1, B
+        /// </summary>
+        private static void SET_1_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B |= (byte) (1 << 1);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBC9 - SET 1, C
+        /// </summary>
+        private static void SET_1_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C |= (byte) (1 << 1);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBCA - SET 1, D
+        /// </summary>
+        private static void SET_1_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D |= (byte) (1 << 1);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBCB - SET 1, E
+        /// </summary>
+        private static void SET_1_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E |= (byte) (1 << 1);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBCC - SET 1, H
+        /// </summary>
+        private static void SET_1_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H |= (byte) (1 << 1);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBCD - SET 1, L
+        /// </summary>
+        private static void SET_1_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L |= (byte) (1 << 1);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBCE - SET 1, [HL]
+        /// </summary>
+        private static void SETHL_1(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b |= (byte) (1 << 1);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBCF - SET 1, A
+        /// </summary>
+        private static void SET_1_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= (byte) (1 << 1);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBD0 - SET 2, B
+        /// </summary>
+        private static void SET_2_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B |= (byte) (1 << 2);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBD1 - SET 2, C
+        /// </summary>
+        private static void SET_2_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C |= (byte) (1 << 2);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBD2 - SET 2, D
+        /// </summary>
+        private static void SET_2_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D |= (byte) (1 << 2);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBD3 - SET 2, E
+        /// </summary>
+        private static void SET_2_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E |= (byte) (1 << 2);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBD4 - SET 2, H
+        /// </summary>
+        private static void SET_2_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H |= (byte) (1 << 2);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBD5 - SET 2, L
+        /// </summary>
+        private static void SET_2_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L |= (byte) (1 << 2);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBD6 - SET 2, [HL]
+        /// </summary>
+        private static void SETHL_2(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b |= (byte) (1 << 2);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBD7 - SET 2, A
+        /// </summary>
+        private static void SET_2_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= (byte) (1 << 2);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBD8 - SET 3, B
+        /// </summary>
+        private static void SET_3_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B |= (byte) (1 << 3);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBD9 - SET 3, C
+        /// </summary>
+        private static void SET_3_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C |= (byte) (1 << 3);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBDA - SET 3, D
+        /// </summary>
+        private static void SET_3_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D |= (byte) (1 << 3);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBDB - SET 3, E
+        /// </summary>
+        private static void SET_3_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E |= (byte) (1 << 3);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBDC - SET 3, H
+        /// </summary>
+        private static void SET_3_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H |= (byte) (1 << 3);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBDD - SET 3, L
+        /// </summary>
+        private static void SET_3_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L |= (byte) (1 << 3);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBDE - SET 3, [HL]
+        /// </summary>
+        private static void SETHL_3(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b |= (byte) (1 << 3);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBDF - SET 3, A
+        /// </summary>
+        private static void SET_3_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= (byte) (1 << 3);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBE0 - SET 4, B
+        /// </summary>
+        private static void SET_4_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B |= (byte) (1 << 4);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBE1 - SET 4, C
+        /// </summary>
+        private static void SET_4_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C |= (byte) (1 << 4);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBE2 - SET 4, D
+        /// </summary>
+        private static void SET_4_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D |= (byte) (1 << 4);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBE3 - SET 4, E
+        /// </summary>
+        private static void SET_4_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E |= (byte) (1 << 4);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBE4 - SET 4, H
+        /// </summary>
+        private static void SET_4_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H |= (byte) (1 << 4);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBE5 - SET 4, L
+        /// </summary>
+        private static void SET_4_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L |= (byte) (1 << 4);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBE6 - SET 4, [HL]
+        /// </summary>
+        private static void SETHL_4(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b |= (byte) (1 << 4);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBE7 - SET 4, A
+        /// </summary>
+        private static void SET_4_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= (byte) (1 << 4);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBE8 - SET 5, B
+        /// </summary>
+        private static void SET_5_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B |= (byte) (1 << 5);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBE9 - SET 5, C
+        /// </summary>
+        private static void SET_5_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C |= (byte) (1 << 5);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBEA - SET 5, D
+        /// </summary>
+        private static void SET_5_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D |= (byte) (1 << 5);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBEB - SET 5, E
+        /// </summary>
+        private static void SET_5_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E |= (byte) (1 << 5);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBEC - SET 5, H
+        /// </summary>
+        private static void SET_5_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H |= (byte) (1 << 5);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBED - SET 5, L
+        /// </summary>
+        private static void SET_5_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L |= (byte) (1 << 5);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBEE - SET 5, [HL]
+        /// </summary>
+        private static void SETHL_5(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b |= (byte) (1 << 5);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBEF - SET 5, A
+        /// </summary>
+        private static void SET_5_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= (byte) (1 << 5);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBF0 - SET 6, B
+        /// </summary>
+        private static void SET_6_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B |= (byte) (1 << 6);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBF1 - SET 6, C
+        /// </summary>
+        private static void SET_6_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C |= (byte) (1 << 6);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBF2 - SET 6, D
+        /// </summary>
+        private static void SET_6_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D |= (byte) (1 << 6);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBF3 - SET 6, E
+        /// </summary>
+        private static void SET_6_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E |= (byte) (1 << 6);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBF4 - SET 6, H
+        /// </summary>
+        private static void SET_6_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H |= (byte) (1 << 6);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBF5 - SET 6, L
+        /// </summary>
+        private static void SET_6_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L |= (byte) (1 << 6);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBF6 - SET 6, [HL]
+        /// </summary>
+        private static void SETHL_6(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b |= (byte) (1 << 6);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBF7 - SET 6, A
+        /// </summary>
+        private static void SET_6_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= (byte) (1 << 6);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBF8 - SET 7, B
+        /// </summary>
+        private static void SET_7_B(CPU cpu) {
+            var reg = cpu.reg;
+            reg.B |= (byte) (1 << 7);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBF9 - SET 7, C
+        /// </summary>
+        private static void SET_7_C(CPU cpu) {
+            var reg = cpu.reg;
+            reg.C |= (byte) (1 << 7);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBFA - SET 7, D
+        /// </summary>
+        private static void SET_7_D(CPU cpu) {
+            var reg = cpu.reg;
+            reg.D |= (byte) (1 << 7);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBFB - SET 7, E
+        /// </summary>
+        private static void SET_7_E(CPU cpu) {
+            var reg = cpu.reg;
+            reg.E |= (byte) (1 << 7);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBFC - SET 7, H
+        /// </summary>
+        private static void SET_7_H(CPU cpu) {
+            var reg = cpu.reg;
+            reg.H |= (byte) (1 << 7);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBFD - SET 7, L
+        /// </summary>
+        private static void SET_7_L(CPU cpu) {
+            var reg = cpu.reg;
+            reg.L |= (byte) (1 << 7);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+
+        /// <summary>
+        /// CBFE - SET 7, [HL]
+        /// </summary>
+        private static void SETHL_7(CPU cpu) {
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b |= (byte) (1 << 7);
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
+        }
+
+        /// <summary>
+        /// CBFF - SET 7, A
+        /// </summary>
+        private static void SET_7_A(CPU cpu) {
+            var reg = cpu.reg;
+            reg.A |= (byte) (1 << 7);
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
+        }
+        #endregion
+        #region Dispatch Table
+        /// <summary>
+        /// 0x000 - 0x0FF are the base opcodes, 0x100 - 0x1FF the 0xCB prefixed ones.
+        /// Cycles are in clock cycles (T), taking the branch when conditional.
+        /// Lengths are in bytes, the 0xCB prefix counts as part of PREFIX CB.
+        /// </summary>
+        internal static readonly OpcodeEntry[] Dispatch = {
+            #region 0x00 Group
+            new OpcodeEntry(NOP, 4, 1, false),
+            new OpcodeEntry(LD__nn_B_C, 12, 3, false),
+            new OpcodeEntry(LD__m_B_C_A, 8, 1, false),
+            new OpcodeEntry(INC_B_C, 8, 1, false),
+            new OpcodeEntry(INCr_B, 4, 1, false),
+            new OpcodeEntry(DECr_B, 4, 1, false),
+            new OpcodeEntry(LDrn_B, 8, 2, false),
+            new OpcodeEntry(RLCA, 4, 1, false),
+            new OpcodeEntry(LDmmSP, 20, 3, false),
+            new OpcodeEntry(ADDHL_B_C, 8, 1, false),
+            new OpcodeEntry(LD___m_A_B_C, 8, 1, false),
+            new OpcodeEntry(DEC_B_C, 8, 1, false),
+            new OpcodeEntry(INCr_C, 4, 1, false),
+            new OpcodeEntry(DECr_C, 4, 1, false),
+            new OpcodeEntry(LDrn_C, 8, 2, false),
+            new OpcodeEntry(RRCA, 4, 1, false),
+            #endregion
+            #region 0x10 Group
+            new OpcodeEntry(STOP, 4, 2, true),
+            new OpcodeEntry(LD__nn_D_E, 12, 3, false),
+            new OpcodeEntry(LD__m_D_E_A, 8, 1, false),
+            new OpcodeEntry(INC_D_E, 8, 1, false),
+            new OpcodeEntry(INCr_D, 4, 1, false),
+            new OpcodeEntry(DECr_D, 4, 1, false),
+            new OpcodeEntry(LDrn_D, 8, 2, false),
+            new OpcodeEntry(RLA, 4, 1, false),
+            new OpcodeEntry(JRn, 12, 2, true),
+            new OpcodeEntry(ADDHL_D_E, 8, 1, false),
+            new OpcodeEntry(LD___m_A_D_E, 8, 1, false),
+            new OpcodeEntry(DEC_D_E, 8, 1, false),
+            new OpcodeEntry(INCr_E, 4, 1, false),
+            new OpcodeEntry(DECr_E, 4, 1, false),
+            new OpcodeEntry(LDrn_E, 8, 2, false),
+            new OpcodeEntry(RRA, 4, 1, false),
+            #endregion
+            #region 0x20 Group
+            new OpcodeEntry(JRNZn, 12, 2, true),
+            new OpcodeEntry(LD__nn_H_L, 12, 3, false),
+            new OpcodeEntry(LDHLIA, 8, 1, false),
+            new OpcodeEntry(INC_H_L, 8, 1, false),
+            new OpcodeEntry(INCr_H, 4, 1, false),
+            new OpcodeEntry(DECr_H, 4, 1, false),
+            new OpcodeEntry(LDrn_H, 8, 2, false),
+            new OpcodeEntry(DAA, 4, 1, false),
+            new OpcodeEntry(JRZn, 12, 2, true),
+            new OpcodeEntry(ADDHL_H_L, 8, 1, false),
+            new OpcodeEntry(LDAHLI, 8, 1, false),
+            new OpcodeEntry(DEC_H_L, 8, 1, false),
+            new OpcodeEntry(INCr_L, 4, 1, false),
+            new OpcodeEntry(DECr_L, 4, 1, false),
+            new OpcodeEntry(LDrn_L, 8, 2, false),
+            new OpcodeEntry(CPL, 4, 1, false),
+            #endregion
+            #region 0x30 Group
+            new OpcodeEntry(JRNCn, 12, 2, true),
+            new OpcodeEntry(LDSPnn, 12, 3, false),
+            new OpcodeEntry(LDHLDA, 8, 1, false),
+            new OpcodeEntry(INCSP, 8, 1, false),
+            new OpcodeEntry(INCHLm, 12, 1, false),
+            new OpcodeEntry(DECHLm, 12, 1, false),
+            new OpcodeEntry(LDHLmn, 12, 2, false),
+            new OpcodeEntry(SCF, 4, 1, false),
+            new OpcodeEntry(JRCn, 12, 2, true),
+            new OpcodeEntry(ADDHLSP, 8, 1, false),
+            new OpcodeEntry(LDAHLD, 8, 1, false),
+            new OpcodeEntry(DECSP, 8, 1, false),
+            new OpcodeEntry(INCr_A, 4, 1, false),
+            new OpcodeEntry(DECr_A, 4, 1, false),
+            new OpcodeEntry(LDrn_A, 8, 2, false),
+            new OpcodeEntry(CCF, 4, 1, false),
+            #endregion
+            #region 0x40 Group
+            new OpcodeEntry(LDrr_B_B, 4, 1, false),
+            new OpcodeEntry(LDrr_B_C, 4, 1, false),
+            new OpcodeEntry(LDrr_B_D, 4, 1, false),
+            new OpcodeEntry(LDrr_B_E, 4, 1, false),
+            new OpcodeEntry(LDrr_B_H, 4, 1, false),
+            new OpcodeEntry(LDrr_B_L, 4, 1, false),
+            new OpcodeEntry(LDrHLm_B, 8, 1, false),
+            new OpcodeEntry(LDrr_B_A, 4, 1, false),
+            new OpcodeEntry(LDrr_C_B, 4, 1, false),
+            new OpcodeEntry(LDrr_C_C, 4, 1, false),
+            new OpcodeEntry(LDrr_C_D, 4, 1, false),
+            new OpcodeEntry(LDrr_C_E, 4, 1, false),
+            new OpcodeEntry(LDrr_C_H, 4, 1, false),
+            new OpcodeEntry(LDrr_C_L, 4, 1, false),
+            new OpcodeEntry(LDrHLm_C, 8, 1, false),
+            new OpcodeEntry(LDrr_C_A, 4, 1, false),
+            #endregion
+            #region 0x50 Group
+            new OpcodeEntry(LDrr_D_B, 4, 1, false),
+            new OpcodeEntry(LDrr_D_C, 4, 1, false),
+            new OpcodeEntry(LDrr_D_D, 4, 1, false),
+            new OpcodeEntry(LDrr_D_E, 4, 1, false),
+            new OpcodeEntry(LDrr_D_H, 4, 1, false),
+            new OpcodeEntry(LDrr_D_L, 4, 1, false),
+            new OpcodeEntry(LDrHLm_D, 8, 1, false),
+            new OpcodeEntry(LDrr_D_A, 4, 1, false),
+            new OpcodeEntry(LDrr_E_B, 4, 1, false),
+            new OpcodeEntry(LDrr_E_C, 4, 1, false),
+            new OpcodeEntry(LDrr_E_D, 4, 1, false),
+            new OpcodeEntry(LDrr_E_E, 4, 1, false),
+            new OpcodeEntry(LDrr_E_H, 4, 1, false),
+            new OpcodeEntry(LDrr_E_L, 4, 1, false),
+            new OpcodeEntry(LDrHLm_E, 8, 1, false),
+            new OpcodeEntry(LDrr_E_A, 4, 1, false),
+            #endregion
+            #region 0x60 Group
+            new OpcodeEntry(LDrr_H_B, 4, 1, false),
+            new OpcodeEntry(LDrr_H_C, 4, 1, false),
+            new OpcodeEntry(LDrr_H_D, 4, 1, false),
+            new OpcodeEntry(LDrr_H_E, 4, 1, false),
+            new OpcodeEntry(LDrr_H_H, 4, 1, false),
+            new OpcodeEntry(LDrr_H_L, 4, 1, false),
+            new OpcodeEntry(LDrHLm_H, 8, 1, false),
+            new OpcodeEntry(LDrr_H_A, 4, 1, false),
+            new OpcodeEntry(LDrr_L_B, 4, 1, false),
+            new OpcodeEntry(LDrr_L_C, 4, 1, false),
+            new OpcodeEntry(LDrr_L_D, 4, 1, false),
+            new OpcodeEntry(LDrr_L_E, 4, 1, false),
+            new OpcodeEntry(LDrr_L_H, 4, 1, false),
+            new OpcodeEntry(LDrr_L_L, 4, 1, false),
+            new OpcodeEntry(LDrHLm_L, 8, 1, false),
+            new OpcodeEntry(LDrr_L_A, 4, 1, false),
+            #endregion
+            #region 0x70 Group
+            new OpcodeEntry(LDHLmr_B, 8, 1, false),
+            new OpcodeEntry(LDHLmr_C, 8, 1, false),
+            new OpcodeEntry(LDHLmr_D, 8, 1, false),
+            new OpcodeEntry(LDHLmr_E, 8, 1, false),
+            new OpcodeEntry(LDHLmr_H, 8, 1, false),
+            new OpcodeEntry(LDHLmr_L, 8, 1, false),
+            new OpcodeEntry(HALT, 4, 1, true),
+            new OpcodeEntry(LDHLmr_A, 8, 1, false),
+            new OpcodeEntry(LDrr_A_B, 4, 1, false),
+            new OpcodeEntry(LDrr_A_C, 4, 1, false),
+            new OpcodeEntry(LDrr_A_D, 4, 1, false),
+            new OpcodeEntry(LDrr_A_E, 4, 1, false),
+            new OpcodeEntry(LDrr_A_H, 4, 1, false),
+            new OpcodeEntry(LDrr_A_L, 4, 1, false),
+            new OpcodeEntry(LDrHLm_A, 8, 1, false),
+            new OpcodeEntry(LDrr_A_A, 4, 1, false),
+            #endregion
+            #region 0x80 Group
+            new OpcodeEntry(ADDr_B, 4, 1, false),
+            new OpcodeEntry(ADDr_C, 4, 1, false),
+            new OpcodeEntry(ADDr_D, 4, 1, false),
+            new OpcodeEntry(ADDr_E, 4, 1, false),
+            new OpcodeEntry(ADDr_H, 4, 1, false),
+            new OpcodeEntry(ADDr_L, 4, 1, false),
+            new OpcodeEntry(ADDHL, 8, 1, false),
+            new OpcodeEntry(ADDr_A, 4, 1, false),
+            new OpcodeEntry(ADCr_B, 4, 1, false),
+            new OpcodeEntry(ADCr_C, 4, 1, false),
+            new OpcodeEntry(ADCr_D, 4, 1, false),
+            new OpcodeEntry(ADCr_E, 4, 1, false),
+            new OpcodeEntry(ADCr_H, 4, 1, false),
+            new OpcodeEntry(ADCr_L, 4, 1, false),
+            new OpcodeEntry(ADCHL, 8, 1, false),
+            new OpcodeEntry(ADCr_A, 4, 1, false),
+            #endregion
+            #region 0x90 Group
+            new OpcodeEntry(SUBr_B, 4, 1, false),
+            new OpcodeEntry(SUBr_C, 4, 1, false),
+            new OpcodeEntry(SUBr_D, 4, 1, false),
+            new OpcodeEntry(SUBr_E, 4, 1, false),
+            new OpcodeEntry(SUBr_H, 4, 1, false),
+            new OpcodeEntry(SUBr_L, 4, 1, false),
+            new OpcodeEntry(SUBHL, 8, 1, false),
+            new OpcodeEntry(SUBr_A, 4, 1, false),
+            new OpcodeEntry(SBCr_B, 4, 1, false),
+            new OpcodeEntry(SBCr_C, 4, 1, false),
+            new OpcodeEntry(SBCr_D, 4, 1, false),
+            new OpcodeEntry(SBCr_E, 4, 1, false),
+            new OpcodeEntry(SBCr_H, 4, 1, false),
+            new OpcodeEntry(SBCr_L, 4, 1, false),
+            new OpcodeEntry(SBCHL, 8, 1, false),
+            new OpcodeEntry(SBCr_A, 4, 1, false),
+            #endregion
+            #region 0xA0 Group
+            new OpcodeEntry(ANDr_B, 4, 1, false),
+            new OpcodeEntry(ANDr_C, 4, 1, false),
+            new OpcodeEntry(ANDr_D, 4, 1, false),
+            new OpcodeEntry(ANDr_E, 4, 1, false),
+            new OpcodeEntry(ANDr_H, 4, 1, false),
+            new OpcodeEntry(ANDr_L, 4, 1, false),
+            new OpcodeEntry(ANDHL, 8, 1, false),
+            new OpcodeEntry(ANDr_A, 4, 1, false),
+            new OpcodeEntry(XORr_B, 4, 1, false),
+            new OpcodeEntry(XORr_C, 4, 1, false),
+            new OpcodeEntry(XORr_D, 4, 1, false),
+            new OpcodeEntry(XORr_E, 4, 1, false),
+            new OpcodeEntry(XORr_H, 4, 1, false),
+            new OpcodeEntry(XORr_L, 4, 1, false),
+            new OpcodeEntry(XORHL, 8, 1, false),
+            new OpcodeEntry(XORr_A, 4, 1, false),
+            #endregion
+            #region 0xB0 Group
+            new OpcodeEntry(ORr_B, 4, 1, false),
+            new OpcodeEntry(ORr_C, 4, 1, false),
+            new OpcodeEntry(ORr_D, 4, 1, false),
+            new OpcodeEntry(ORr_E, 4, 1, false),
+            new OpcodeEntry(ORr_H, 4, 1, false),
+            new OpcodeEntry(ORr_L, 4, 1, false),
+            new OpcodeEntry(ORHL, 4, 1, false),
+            new OpcodeEntry(ORr_A, 4, 1, false),
+            new OpcodeEntry(CPr_B, 4, 1, false),
+            new OpcodeEntry(CPr_C, 4, 1, false),
+            new OpcodeEntry(CPr_D, 4, 1, false),
+            new OpcodeEntry(CPr_E, 4, 1, false),
+            new OpcodeEntry(CPr_H, 4, 1, false),
+            new OpcodeEntry(CPr_L, 4, 1, false),
+            new OpcodeEntry(CPHL, 4, 1, false),
+            new OpcodeEntry(CPr_A, 4, 1, false),
+            #endregion
+            #region 0xC0 Group
+            new OpcodeEntry(RETNZ, 20, 1, true),
+            new OpcodeEntry(POP_B_C, 12, 1, false),
+            new OpcodeEntry(JPNZnn, 16, 3, true),
+            new OpcodeEntry(JPnn, 16, 3, true),
+            new OpcodeEntry(CALLNZnn, 24, 3, true),
+            new OpcodeEntry(PUSH_B_C, 16, 1, false),
+            new OpcodeEntry(ADDn, 8, 2, false),
+            new OpcodeEntry(RSTXX_00, 16, 1, true),
+            new OpcodeEntry(RETZ, 20, 1, true),
+            new OpcodeEntry(RET, 16, 1, true),
+            new OpcodeEntry(JPZnn, 16, 3, true),
+            new OpcodeEntry(CBCall, 4, 2, false),
+            new OpcodeEntry(CALLZnn, 24, 3, true),
+            new OpcodeEntry(CALLnn, 24, 3, true),
+            new OpcodeEntry(ADCn, 8, 2, false),
+            new OpcodeEntry(RSTXX_08, 16, 1, true),
+            #endregion
+            #region 0xD0 Group
+            new OpcodeEntry(RETNC, 20, 1, true),
+            new OpcodeEntry(POP_D_E, 12, 1, false),
+            new OpcodeEntry(JPNCnn, 16, 3, true),
+            new OpcodeEntry(NOPWARN_D3, 0, 1, true),
+            new OpcodeEntry(CALLNCnn, 24, 3, true),
+            new OpcodeEntry(PUSH_D_E, 16, 1, false),
+            new OpcodeEntry(SUBn, 8, 2, false),
+            new OpcodeEntry(RSTXX_10, 16, 1, true),
+            new OpcodeEntry(RETC, 20, 1, true),
+            new OpcodeEntry(RETI, 16, 1, true),
+            new OpcodeEntry(JPCnn, 16, 3, true),
+            new OpcodeEntry(NOPWARN_DB, 0, 1, true),
+            new OpcodeEntry(CALLCnn, 24, 3, true),
+            new OpcodeEntry(NOPWARN_DD, 0, 1, true),
+            new OpcodeEntry(SBCn, 8, 2, false),
+            new OpcodeEntry(RSTXX_18, 16, 1, true),
+            #endregion
+            #region 0xE0 Group
+            new OpcodeEntry(LDIOnA, 12, 2, false),
+            new OpcodeEntry(POP_H_L, 12, 1, false),
+            new OpcodeEntry(LDIOCA, 8, 1, false),
+            new OpcodeEntry(NOPWARN_E3, 0, 1, true),
+            new OpcodeEntry(NOPWARN_E4, 0, 1, true),
+            new OpcodeEntry(PUSH_H_L, 16, 1, false),
+            new OpcodeEntry(ANDn, 8, 2, false),
+            new OpcodeEntry(RSTXX_20, 16, 1, true),
+            new OpcodeEntry(ADDSPn, 16, 2, false),
+            new OpcodeEntry(JPHL, 4, 1, true),
+            new OpcodeEntry(LDmm_A, 16, 3, false),
+            new OpcodeEntry(NOPWARN_EB, 0, 1, true),
+            new OpcodeEntry(NOPWARN_EC, 0, 1, true),
+            new OpcodeEntry(NOPWARN_ED, 0, 1, true),
+            new OpcodeEntry(XORn, 8, 2, false),
+            new OpcodeEntry(RSTXX_28, 16, 1, true),
+            #endregion
+            #region 0xF0 Group
+            new OpcodeEntry(LDAIOn, 12, 2, false),
+            new OpcodeEntry(POP_A_F, 12, 1, false),
+            new OpcodeEntry(LDAIOC, 8, 1, false),
+            new OpcodeEntry(DI, 4, 1, false),
+            new OpcodeEntry(NOPWARN_F4, 0, 1, true),
+            new OpcodeEntry(PUSH_A_F, 16, 1, false),
+            new OpcodeEntry(ORn, 8, 2, false),
+            new OpcodeEntry(RSTXX_30, 16, 1, true),
+            new OpcodeEntry(LDHLSPn, 12, 2, false),
+            new OpcodeEntry(LDHLSPr, 8, 1, false),
+            new OpcodeEntry(LD_mm_A, 16, 3, false),
+            new OpcodeEntry(EI, 4, 1, false),
+            new OpcodeEntry(NOPWARN_FC, 0, 1, true),
+            new OpcodeEntry(NOPWARN_FD, 0, 1, true),
+            new OpcodeEntry(CPn, 8, 2, false),
+            new OpcodeEntry(RSTXX_38, 16, 1, true),
+            #endregion
+            #region CB00 Group
+            new OpcodeEntry(RLCr_B, 8, 1, false),
+            new OpcodeEntry(RLCr_C, 8, 1, false),
+            new OpcodeEntry(RLCr_D, 8, 1, false),
+            new OpcodeEntry(RLCr_E, 8, 1, false),
+            new OpcodeEntry(RLCr_H, 8, 1, false),
+            new OpcodeEntry(RLCr_L, 8, 1, false),
+            new OpcodeEntry(RLCHL, 16, 1, false),
+            new OpcodeEntry(RLCr_A, 8, 1, false),
+            new OpcodeEntry(RRCr_B, 8, 1, false),
+            new OpcodeEntry(RRCr_C, 8, 1, false),
+            new OpcodeEntry(RRCr_D, 8, 1, false),
+            new OpcodeEntry(RRCr_E, 8, 1, false),
+            new OpcodeEntry(RRCr_H, 8, 1, false),
+            new OpcodeEntry(RRCr_L, 8, 1, false),
+            new OpcodeEntry(RRCHL, 16, 1, false),
+            new OpcodeEntry(RRCr_A, 8, 1, false),
+            #endregion
+            #region CB10 Group
+            new OpcodeEntry(RLr_B, 8, 1, false),
+            new OpcodeEntry(RLr_C, 8, 1, false),
+            new OpcodeEntry(RLr_D, 8, 1, false),
+            new OpcodeEntry(RLr_E, 8, 1, false),
+            new OpcodeEntry(RLr_H, 8, 1, false),
+            new OpcodeEntry(RLr_L, 8, 1, false),
+            new OpcodeEntry(RLHL, 16, 1, false),
+            new OpcodeEntry(RLr_A, 8, 1, false),
+            new OpcodeEntry(RRr_B, 8, 1, false),
+            new OpcodeEntry(RRr_C, 8, 1, false),
+            new OpcodeEntry(RRr_D, 8, 1, false),
+            new OpcodeEntry(RRr_E, 8, 1, false),
+            new OpcodeEntry(RRr_H, 8, 1, false),
+            new OpcodeEntry(RRr_L, 8, 1, false),
+            new OpcodeEntry(RRHL, 16, 1, false),
+            new OpcodeEntry(RRr_A, 8, 1, false),
+            #endregion
+            #region CB20 Group
+            new OpcodeEntry(SLAr_B, 8, 1, false),
+            new OpcodeEntry(SLAr_C, 8, 1, false),
+            new OpcodeEntry(SLAr_D, 8, 1, false),
+            new OpcodeEntry(SLAr_E, 8, 1, false),
+            new OpcodeEntry(SLAr_H, 8, 1, false),
+            new OpcodeEntry(SLAr_L, 8, 1, false),
+            new OpcodeEntry(SLAHL, 16, 1, false),
+            new OpcodeEntry(SLAr_A, 8, 1, false),
+            new OpcodeEntry(SRAr_B, 8, 1, false),
+            new OpcodeEntry(SRAr_C, 8, 1, false),
+            new OpcodeEntry(SRAr_D, 8, 1, false),
+            new OpcodeEntry(SRAr_E, 8, 1, false),
+            new OpcodeEntry(SRAr_H, 8, 1, false),
+            new OpcodeEntry(SRAr_L, 8, 1, false),
+            new OpcodeEntry(SRAHL, 16, 1, false),
+            new OpcodeEntry(SRAr_A, 8, 1, false),
+            #endregion
+            #region CB30 Group
+            new OpcodeEntry(SWAPr_B, 8, 1, false),
+            new OpcodeEntry(SWAPr_C, 8, 1, false),
+            new OpcodeEntry(SWAPr_D, 8, 1, false),
+            new OpcodeEntry(SWAPr_E, 8, 1, false),
+            new OpcodeEntry(SWAPr_H, 8, 1, false),
+            new OpcodeEntry(SWAPr_L, 8, 1, false),
+            new OpcodeEntry(SWAPHL, 16, 1, false),
+            new OpcodeEntry(SWAPr_A, 8, 1, false),
+            new OpcodeEntry(SRLr_B, 8, 1, false),
+            new OpcodeEntry(SRLr_C, 8, 1, false),
+            new OpcodeEntry(SRLr_D, 8, 1, false),
+            new OpcodeEntry(SRLr_E, 8, 1, false),
+            new OpcodeEntry(SRLr_H, 8, 1, false),
+            new OpcodeEntry(SRLr_L, 8, 1, false),
+            new OpcodeEntry(SRLHL, 16, 1, false),
+            new OpcodeEntry(SRLr_A, 8, 1, false),
+            #endregion
+            #region CB40 Group
+            new OpcodeEntry(BIT_0_B, 8, 1, false),
+            new OpcodeEntry(BIT_0_C, 8, 1, false),
+            new OpcodeEntry(BIT_0_D, 8, 1, false),
+            new OpcodeEntry(BIT_0_E, 8, 1, false),
+            new OpcodeEntry(BIT_0_H, 8, 1, false),
+            new OpcodeEntry(BIT_0_L, 8, 1, false),
+            new OpcodeEntry(BITm_0, 16, 1, false),
+            new OpcodeEntry(BIT_0_A, 8, 1, false),
+            new OpcodeEntry(BIT_1_B, 8, 1, false),
+            new OpcodeEntry(BIT_1_C, 8, 1, false),
+            new OpcodeEntry(BIT_1_D, 8, 1, false),
+            new OpcodeEntry(BIT_1_E, 8, 1, false),
+            new OpcodeEntry(BIT_1_H, 8, 1, false),
+            new OpcodeEntry(BIT_1_L, 8, 1, false),
+            new OpcodeEntry(BITm_1, 16, 1, false),
+            new OpcodeEntry(BIT_1_A, 8, 1, false),
+            #endregion
+            #region CB50 Group
+            new OpcodeEntry(BIT_2_B, 8, 1, false),
+            new OpcodeEntry(BIT_2_C, 8, 1, false),
+            new OpcodeEntry(BIT_2_D, 8, 1, false),
+            new OpcodeEntry(BIT_2_E, 8, 1, false),
+            new OpcodeEntry(BIT_2_H, 8, 1, false),
+            new OpcodeEntry(BIT_2_L, 8, 1, false),
+            new OpcodeEntry(BITm_2, 16, 1, false),
+            new OpcodeEntry(BIT_2_A, 8, 1, false),
+            new OpcodeEntry(BIT_3_B, 8, 1, false),
+            new OpcodeEntry(BIT_3_C, 8, 1, false),
+            new OpcodeEntry(BIT_3_D, 8, 1, false),
+            new OpcodeEntry(BIT_3_E, 8, 1, false),
+            new OpcodeEntry(BIT_3_H, 8, 1, false),
+            new OpcodeEntry(BIT_3_L, 8, 1, false),
+            new OpcodeEntry(BITm_3, 16, 1, false),
+            new OpcodeEntry(BIT_3_A, 8, 1, false),
+            #endregion
+            #region CB60 Group
+            new OpcodeEntry(BIT_4_B, 8, 1, false),
+            new OpcodeEntry(BIT_4_C, 8, 1, false),
+            new OpcodeEntry(BIT_4_D, 8, 1, false),
+            new OpcodeEntry(BIT_4_E, 8, 1, false),
+            new OpcodeEntry(BIT_4_H, 8, 1, false),
+            new OpcodeEntry(BIT_4_L, 8, 1, false),
+            new OpcodeEntry(BITm_4, 16, 1, false),
+            new OpcodeEntry(BIT_4_A, 8, 1, false),
+            new OpcodeEntry(BIT_5_B, 8, 1, false),
+            new OpcodeEntry(BIT_5_C, 8, 1, false),
+            new OpcodeEntry(BIT_5_D, 8, 1, false),
+            new OpcodeEntry(BIT_5_E, 8, 1, false),
+            new OpcodeEntry(BIT_5_H, 8, 1, false),
+            new OpcodeEntry(BIT_5_L, 8, 1, false),
+            new OpcodeEntry(BITm_5, 16, 1, false),
+            new OpcodeEntry(BIT_5_A, 8, 1, false),
+            #endregion
+            #region CB70 Group
+            new OpcodeEntry(BIT_6_B, 8, 1, false),
+            new OpcodeEntry(BIT_6_C, 8, 1, false),
+            new OpcodeEntry(BIT_6_D, 8, 1, false),
+            new OpcodeEntry(BIT_6_E, 8, 1, false),
+            new OpcodeEntry(BIT_6_H, 8, 1, false),
+            new OpcodeEntry(BIT_6_L, 8, 1, false),
+            new OpcodeEntry(BITm_6, 16, 1, false),
+            new OpcodeEntry(BIT_6_A, 8, 1, false),
+            new OpcodeEntry(BIT_7_B, 8, 1, false),
+            new OpcodeEntry(BIT_7_C, 8, 1, false),
+            new OpcodeEntry(BIT_7_D, 8, 1, false),
+            new OpcodeEntry(BIT_7_E, 8, 1, false),
+            new OpcodeEntry(BIT_7_H, 8, 1, false),
+            new OpcodeEntry(BIT_7_L, 8, 1, false),
+            new OpcodeEntry(BITm_7, 16, 1, false),
+            new OpcodeEntry(BIT_7_A, 8, 1, false),
+            #endregion
+            #region CB80 Group
+            new OpcodeEntry(RES_0_B, 8, 1, false),
+            new OpcodeEntry(RES_0_C, 8, 1, false),
+            new OpcodeEntry(RES_0_D, 8, 1, false),
+            new OpcodeEntry(RES_0_E, 8, 1, false),
+            new OpcodeEntry(RES_0_H, 8, 1, false),
+            new OpcodeEntry(RES_0_L, 8, 1, false),
+            new OpcodeEntry(RESHL_0, 16, 1, false),
+            new OpcodeEntry(RES_0_A, 8, 1, false),
+            new OpcodeEntry(RES_1_B, 8, 1, false),
+            new OpcodeEntry(RES_1_C, 8, 1, false),
+            new OpcodeEntry(RES_1_D, 8, 1, false),
+            new OpcodeEntry(RES_1_E, 8, 1, false),
+            new OpcodeEntry(RES_1_H, 8, 1, false),
+            new OpcodeEntry(RES_1_L, 8, 1, false),
+            new OpcodeEntry(RESHL_1, 16, 1, false),
+            new OpcodeEntry(RES_1_A, 8, 1, false),
+            #endregion
+            #region CB90 Group
+            new OpcodeEntry(RES_2_B, 8, 1, false),
+            new OpcodeEntry(RES_2_C, 8, 1, false),
+            new OpcodeEntry(RES_2_D, 8, 1, false),
+            new OpcodeEntry(RES_2_E, 8, 1, false),
+            new OpcodeEntry(RES_2_H, 8, 1, false),
+            new OpcodeEntry(RES_2_L, 8, 1, false),
+            new OpcodeEntry(RESHL_2, 16, 1, false),
+            new OpcodeEntry(RES_2_A, 8, 1, false),
+            new OpcodeEntry(RES_3_B, 8, 1, false),
+            new OpcodeEntry(RES_3_C, 8, 1, false),
+            new OpcodeEntry(RES_3_D, 8, 1, false),
+            new OpcodeEntry(RES_3_E, 8, 1, false),
+            new OpcodeEntry(RES_3_H, 8, 1, false),
+            new OpcodeEntry(RES_3_L, 8, 1, false),
+            new OpcodeEntry(RESHL_3, 16, 1, false),
+            new OpcodeEntry(RES_3_A, 8, 1, false),
+            #endregion
+            #region CBA0 Group
+            new OpcodeEntry(RES_4_B, 8, 1, false),
+            new OpcodeEntry(RES_4_C, 8, 1, false),
+            new OpcodeEntry(RES_4_D, 8, 1, false),
+            new OpcodeEntry(RES_4_E, 8, 1, false),
+            new OpcodeEntry(RES_4_H, 8, 1, false),
+            new OpcodeEntry(RES_4_L, 8, 1, false),
+            new OpcodeEntry(RESHL_4, 16, 1, false),
+            new OpcodeEntry(RES_4_A, 8, 1, false),
+            new OpcodeEntry(RES_5_B, 8, 1, false),
+            new OpcodeEntry(RES_5_C, 8, 1, false),
+            new OpcodeEntry(RES_5_D, 8, 1, false),
+            new OpcodeEntry(RES_5_E, 8, 1, false),
+            new OpcodeEntry(RES_5_H, 8, 1, false),
+            new OpcodeEntry(RES_5_L, 8, 1, false),
+            new OpcodeEntry(RESHL_5, 16, 1, false),
+            new OpcodeEntry(RES_5_A, 8, 1, false),
+            #endregion
+            #region CBB0 Group
+            new OpcodeEntry(RES_6_B, 8, 1, false),
+            new OpcodeEntry(RES_6_C, 8, 1, false),
+            new OpcodeEntry(RES_6_D, 8, 1, false),
+            new OpcodeEntry(RES_6_E, 8, 1, false),
+            new OpcodeEntry(RES_6_H, 8, 1, false),
+            new OpcodeEntry(RES_6_L, 8, 1, false),
+            new OpcodeEntry(RESHL_6, 16, 1, false),
+            new OpcodeEntry(RES_6_A, 8, 1, false),
+            new OpcodeEntry(RES_7_B, 8, 1, false),
+            new OpcodeEntry(RES_7_C, 8, 1, false),
+            new OpcodeEntry(RES_7_D, 8, 1, false),
+            new OpcodeEntry(RES_7_E, 8, 1, false),
+            new OpcodeEntry(RES_7_H, 8, 1, false),
+            new OpcodeEntry(RES_7_L, 8, 1, false),
+            new OpcodeEntry(RESHL_7, 16, 1, false),
+            new OpcodeEntry(RES_7_A, 8, 1, false),
+            #endregion
+            #region CBC0 Group
+            new OpcodeEntry(SET_0_B, 8, 1, false),
+            new OpcodeEntry(SET_0_C, 8, 1, false),
+            new OpcodeEntry(SET_0_D, 8, 1, false),
+            new OpcodeEntry(SET_0_E, 8, 1, false),
+            new OpcodeEntry(SET_0_H, 8, 1, false),
+            new OpcodeEntry(SET_0_L, 8, 1, false),
+            new OpcodeEntry(SETHL_0, 16, 1, false),
+            new OpcodeEntry(SET_0_A, 8, 1, false),
+            new OpcodeEntry(SET_1_B, 8, 1, false),
+            new OpcodeEntry(SET_1_C, 8, 1, false),
+            new OpcodeEntry(SET_1_D, 8, 1, false),
+            new OpcodeEntry(SET_1_E, 8, 1, false),
+            new OpcodeEntry(SET_1_H, 8, 1, false),
+            new OpcodeEntry(SET_1_L, 8, 1, false),
+            new OpcodeEntry(SETHL_1, 16, 1, false),
+            new OpcodeEntry(SET_1_A, 8, 1, false),
+            #endregion
+            #region CBD0 Group
+            new OpcodeEntry(SET_2_B, 8, 1, false),
+            new OpcodeEntry(SET_2_C, 8, 1, false),
+            new OpcodeEntry(SET_2_D, 8, 1, false),
+            new OpcodeEntry(SET_2_E, 8, 1, false),
+            new OpcodeEntry(SET_2_H, 8, 1, false),
+            new OpcodeEntry(SET_2_L, 8, 1, false),
+            new OpcodeEntry(SETHL_2, 16, 1, false),
+            new OpcodeEntry(SET_2_A, 8, 1, false),
+            new OpcodeEntry(SET_3_B, 8, 1, false),
+            new OpcodeEntry(SET_3_C, 8, 1, false),
+            new OpcodeEntry(SET_3_D, 8, 1, false),
+            new OpcodeEntry(SET_3_E, 8, 1, false),
+            new OpcodeEntry(SET_3_H, 8, 1, false),
+            new OpcodeEntry(SET_3_L, 8, 1, false),
+            new OpcodeEntry(SETHL_3, 16, 1, false),
+            new OpcodeEntry(SET_3_A, 8, 1, false),
+            #endregion
+            #region CBE0 Group
+            new OpcodeEntry(SET_4_B, 8, 1, false),
+            new OpcodeEntry(SET_4_C, 8, 1, false),
+            new OpcodeEntry(SET_4_D, 8, 1, false),
+            new OpcodeEntry(SET_4_E, 8, 1, false),
+            new OpcodeEntry(SET_4_H, 8, 1, false),
+            new OpcodeEntry(SET_4_L, 8, 1, false),
+            new OpcodeEntry(SETHL_4, 16, 1, false),
+            new OpcodeEntry(SET_4_A, 8, 1, false),
+            new OpcodeEntry(SET_5_B, 8, 1, false),
+            new OpcodeEntry(SET_5_C, 8, 1, false),
+            new OpcodeEntry(SET_5_D, 8, 1, false),
+            new OpcodeEntry(SET_5_E, 8, 1, false),
+            new OpcodeEntry(SET_5_H, 8, 1, false),
+            new OpcodeEntry(SET_5_L, 8, 1, false),
+            new OpcodeEntry(SETHL_5, 16, 1, false),
+            new OpcodeEntry(SET_5_A, 8, 1, false),
+            #endregion
+            #region CBF0 Group
+            new OpcodeEntry(SET_6_B, 8, 1, false),
+            new OpcodeEntry(SET_6_C, 8, 1, false),
+            new OpcodeEntry(SET_6_D, 8, 1, false),
+            new OpcodeEntry(SET_6_E, 8, 1, false),
+            new OpcodeEntry(SET_6_H, 8, 1, false),
+            new OpcodeEntry(SET_6_L, 8, 1, false),
+            new OpcodeEntry(SETHL_6, 16, 1, false),
+            new OpcodeEntry(SET_6_A, 8, 1, false),
+            new OpcodeEntry(SET_7_B, 8, 1, false),
+            new OpcodeEntry(SET_7_C, 8, 1, false),
+            new OpcodeEntry(SET_7_D, 8, 1, false),
+            new OpcodeEntry(SET_7_E, 8, 1, false),
+            new OpcodeEntry(SET_7_H, 8, 1, false),
+            new OpcodeEntry(SET_7_L, 8, 1, false),
+            new OpcodeEntry(SETHL_7, 16, 1, false),
+            new OpcodeEntry(SET_7_A, 8, 1, false),
+            #endregion
+        };
+        #endregion
+        #region CPU Instructions
+        internal static readonly Action<CPU>[] opcodes = GetHandlers(0x000);
+        internal static readonly Action<CPU>[] CBOPS = GetHandlers(0x100);
+
+        private static Action<CPU>[] GetHandlers(int offset) {
+            var handlers = new Action<CPU>[256];
+            for (var i = 0; i < 256; i++) {
+                handlers[i] = Dispatch[offset + i].Handler;
+            }
+
+            return handlers;
+        }
+        #endregion
+    }
+}
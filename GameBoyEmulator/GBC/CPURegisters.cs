@@ -5,7 +5,7 @@ using System.Text.RegularExpressions;
 
 namespace GameBoyEmulator.Desktop.GBC {
     public class CPURegisters {
-        public byte A, B, C, D, E, H, L, F;
+        public byte A, B, C, D, E, H, L;
         private byte _A, _B, _C, _D, _E, _H, _L, _F;
 
         public bool InterruptEnable;
@@ -16,8 +16,149 @@ namespace GameBoyEmulator.Desktop.GBC {
         public ushort PC, SP;
         public int lastClockM, lastClockT;
 
+        #region Lazy Flags
+        private enum FlagOp : byte {
+            None,
+            Add,
+            Sub,
+            And,
+            Or,
+            Inc,
+            Dec,
+        }
+
+        private byte f;
+
+        // Last ALU operation, its flags are only computed when read
+        private FlagOp flagOp;
+        private int flagA, flagB, flagCarry, flagResult;
+
+        /// <summary>
+        /// Flags register. Reading it computes the flags of the last recorded ALU operation.
+        /// </summary>
+        public byte F {
+            get {
+                if (flagOp != FlagOp.None) {
+                    f = EvaluateFlags();
+                    flagOp = FlagOp.None;
+                }
+                return f;
+            }
+            set {
+                f = value;
+                flagOp = FlagOp.None;
+            }
+        }
+
+        private byte EvaluateFlags() {
+            bool sub, halfCarry;
+            switch (flagOp) {
+                case FlagOp.Add:
+                    sub = false;
+                    halfCarry = (flagA & 0xF) + (flagB & 0xF) + flagCarry > 0xF;
+                    break;
+                case FlagOp.Sub:
+                    sub = true;
+                    halfCarry = (flagA & 0xF) < (flagB & 0xF) + flagCarry;
+                    break;
+                case FlagOp.And:
+                    sub = false;
+                    halfCarry = true;
+                    break;
+                case FlagOp.Inc:
+                    sub = false;
+                    halfCarry = (flagA & 0xF) == 0xF;
+                    break;
+                case FlagOp.Dec:
+                    sub = true;
+                    halfCarry = (flagA & 0xF) == 0;
+                    break;
+                default:
+                    sub = false;
+                    halfCarry = false;
+                    break;
+            }
+
+            // The lower nibble is never touched by the ALU
+            var flags = f & 0x0F;
+            if (FlagZero) flags |= Flags.FLAG_ZERO;
+            if (sub) flags |= Flags.FLAG_SUB;
+            if (halfCarry) flags |= Flags.FLAG_HALF_CARRY;
+            if (FlagCarry) flags |= Flags.FLAG_CARRY;
+            return (byte) flags;
+        }
+
+        /// <summary>
+        /// Records an 8 bit addition: a + b + carry
+        /// </summary>
+        /// <param name="a"></param>
+        /// <param name="b"></param>
+        /// <param name="carry"></param>
+        public void AddFlags(int a, int b, int carry) {
+            flagOp = FlagOp.Add;
+            flagA = a;
+            flagB = b;
+            flagCarry = carry;
+            flagResult = a + b + carry;
+        }
+
+        /// <summary>
+        /// Records an 8 bit subtraction or comparison: a - b - carry
+        /// </summary>
+        /// <param name="a"></param>
+        /// <param name="b"></param>
+        /// <param name="carry"></param>
+        public void SubFlags(int a, int b, int carry) {
+            flagOp = FlagOp.Sub;
+            flagA = a;
+            flagB = b;
+            flagCarry = carry;
+            flagResult = a - b - carry;
+        }
+
+        /// <summary>
+        /// Records an AND
+        /// </summary>
+        /// <param name="result"></param>
+        public void AndFlags(int result) {
+            flagOp = FlagOp.And;
+            flagResult = result;
+        }
+
+        /// <summary>
+        /// Records an OR or a XOR
+        /// </summary>
+        /// <param name="result"></param>
+        public void OrFlags(int result) {
+            flagOp = FlagOp.Or;
+            flagResult = result;
+        }
+
+        /// <summary>
+        /// Records an 8 bit increment, which keeps the carry
+        /// </summary>
+        /// <param name="v">Value before the increment</param>
+        public void IncFlags(int v) {
+            flagCarry = FlagCarry ? 1 : 0;
+            flagOp = FlagOp.Inc;
+            flagA = v;
+            flagResult = v + 1;
+        }
+
+        /// <summary>
+        /// Records an 8 bit decrement, which keeps the carry
+        /// </summary>
+        /// <param name="v">Value before the decrement</param>
+        public void DecFlags(int v) {
+            flagCarry = FlagCarry ? 1 : 0;
+            flagOp = FlagOp.Dec;
+            flagA = v;
+            flagResult = v - 1;
+        }
+        #endregion
+
         public bool FlagZero {
-            get => (F & Flags.FLAG_ZERO) > 0;
+            get => flagOp == FlagOp.None ? (f & Flags.FLAG_ZERO) > 0 : (flagResult & 0xFF) == 0;
             set {
                 if (value) {
                     F |= Flags.FLAG_ZERO;
@@ -50,7 +191,21 @@ namespace GameBoyEmulator.Desktop.GBC {
         }
 
         public bool FlagCarry {
-            get => (F & Flags.FLAG_CARRY) > 0;
+            get {
+                switch (flagOp) {
+                    case FlagOp.None:
+                        return (f & Flags.FLAG_CARRY) > 0;
+                    case FlagOp.Add:
+                        return flagResult > 0xFF;
+                    case FlagOp.Sub:
+                        return flagResult < 0;
+                    case FlagOp.And:
+                    case FlagOp.Or:
+                        return false;
+                    default:
+                        return flagCarry != 0;
+                }
+            }
             set {
                 if (value) {
                     F |= Flags.FLAG_CARRY;
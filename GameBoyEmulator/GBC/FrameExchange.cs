@@ -0,0 +1,71 @@
+﻿using System;
+using System.Threading;
+
+namespace GameBoyEmulator.Desktop.GBC {
+    /// <summary>
+    /// Lock-free triple buffer between the GPU (producer) and the presenter (consumer).
+    /// The GPU draws on the back buffer and publishes it at VBlank by swapping it with the middle one.
+    /// The presenter swaps its front buffer with the middle one whenever a new frame was published.
+    /// Neither side ever waits for the other.
+    /// </summary>
+    public class FrameExchange {
+        private const int IndexMask = 0x03;
+        private const int FreshFrame = 0x04;
+
+        private readonly byte[][] buffers;
+        private readonly int[] generations;
+
+        private int back;
+        private int middle; // Buffer index | FreshFrame, shared between both threads
+        private int front;
+
+        public FrameExchange(int size) {
+            buffers = new byte[3][];
+            generations = new int[3];
+            for (var i = 0; i < 3; i++) {
+                buffers[i] = new byte[size];
+            }
+            back = 0;
+            middle = 1;
+            front = 2;
+        }
+
+        /// <summary>
+        /// Buffer the GPU is drawing on
+        /// </summary>
+        public byte[] Back => buffers[back];
+
+        /// <summary>
+        /// Publishes the back buffer as the latest complete frame. Called from the GPU thread.
+        /// </summary>
+        /// <param name="generation">Frame Generation of the published frame</param>
+        /// <returns>The new back buffer, initialized with the published frame</returns>
+        public byte[] Publish(int generation) {
+            var published = back;
+            generations[published] = generation;
+            back = Interlocked.Exchange(ref middle, published | FreshFrame) & IndexMask;
+            // The renderer only writes the lines that changed, so it needs to start from the last frame
+            Buffer.BlockCopy(buffers[published], 0, buffers[back], 0, buffers[back].Length);
+            return buffers[back];
+        }
+
+        /// <summary>
+        /// Takes the latest complete frame, if any was published since the last call. Called from the presenter thread.
+        /// </summary>
+        /// <param name="frame"></param>
+        /// <param name="generation"></param>
+        /// <returns>false if there is no new frame</returns>
+        public bool TryTake(out byte[] frame, out int generation) {
+            if ((Volatile.Read(ref middle) & FreshFrame) == 0) {
+                frame = null;
+                generation = 0;
+                return false;
+            }
+
+            front = Interlocked.Exchange(ref middle, front) & IndexMask;
+            frame = buffers[front];
+            generation = generations[front];
+            return true;
+        }
+    }
+}
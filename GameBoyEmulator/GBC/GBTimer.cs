@@ -2,77 +2,83 @@
 
 namespace GameBoyEmulator.Desktop.GBC {
     public class GBTimer {
-        private int div, tma, tima, tac;
-        private int clockMain, clockSub, clockDiv;
+        /// <summary>
+        /// DIV increments at 16384 Hz
+        /// </summary>
+        private const int DivPeriod = 256;
+
+        /// <summary>
+        /// TIMA period in Clock Cycles for each TAC input clock select
+        /// </summary>
+        private static readonly int[] TimerPeriods = { 1024, 16, 64, 256 };
+
+        private int tma, tima, tac;
+
+        /// <summary>
+        /// Master clock DIV was last reset at. DIV itself is derived from the clock when read.
+        /// </summary>
+        private long divResetAt;
+
+        /// <summary>
+        /// Master clock of the last TIMA tick counted in tima. Later ticks are derived from the clock when read.
+        /// </summary>
+        private long timaUpdatedAt;
 
         private CPU cpu;
+
+        private bool TimerEnabled => (tac & 0x04) != 0;
+        private int TimerPeriod => TimerPeriods[tac & 0x03];
         
         public GBTimer(CPU cpu) {
             this.cpu = cpu;
+            cpu.scheduler.Register(SchedulerEvents.TIMER_OVERFLOW, OnTimerOverflow);
             Reset();
         }
 
         public void Reset() {
-            div = 0;
-            tma = 0;
+            divResetAt = cpu.scheduler.Now;
             tma = 0;
             tima = 0;
+            timaUpdatedAt = cpu.scheduler.Now;
             tac = 0;
-            clockMain = 0;
-            clockSub = 0;
-            clockDiv = 0;
+            cpu.scheduler.Cancel(SchedulerEvents.TIMER_OVERFLOW);
         }
 
-        public void Cycle() {
-            tima++;
-            clockMain = 0;
-            if (tima > 255) {
-                tima = tma;
-                cpu.reg.TriggerInterrupts |= Flags.INT_TIMER;
+        private int CurrentTima() {
+            if (!TimerEnabled) {
+                return tima;
             }
+            return tima + (int) ((cpu.scheduler.Now - timaUpdatedAt) / TimerPeriod);
         }
 
-        public void Increment() {
-            clockSub += cpu.reg.lastClockM;
-
-            if (clockSub > 3) {
-                clockMain++;
-                clockSub -= 4;
-                clockDiv++;
+        /// <summary>
+        /// Counts the ticks elapsed since the last update into tima, keeping the tick phase
+        /// </summary>
+        private void UpdateTima() {
+            if (!TimerEnabled) return;
+            var ticks = (cpu.scheduler.Now - timaUpdatedAt) / TimerPeriod;
+            tima += (int) ticks;
+            timaUpdatedAt += ticks * TimerPeriod;
+        }
 
-                if (clockDiv == 16) {
-                    clockDiv = 0;
-                    div++;
-                    div %= 256;
-                }
-            }
+        /// <summary>
+        /// Schedules the tick that takes TIMA past 255
+        /// </summary>
+        private void ScheduleOverflow() {
+            cpu.scheduler.ScheduleAt(SchedulerEvents.TIMER_OVERFLOW, timaUpdatedAt + (256 - tima) * (long) TimerPeriod);
+        }
 
-            if ((tac & 0x04) != 0x00) {
-                switch (tac & 0x03) {
-                    case 0: 
-                        if (clockMain >= 64) 
-                            Cycle();
-                        break;
-                    case 1:
-                        if (clockMain >= 1)
-                            Cycle();
-                        break;
-                    case 2:
-                        if (clockMain >= 4)
-                            Cycle();
-                        break;
-                    case 3:
-                        if (clockMain >= 16)
-                            Cycle();
-                        break;
-                }
-            }
+        private void OnTimerOverflow(long due) {
+            tima = tma;
+            timaUpdatedAt = due;
+            cpu.reg.TriggerInterrupts |= Flags.INT_TIMER;
+            ScheduleOverflow();
         }
 
         public byte Read(int addr) {
             switch (addr) {
-                case 0xFF04: return (byte) div;
-                case 0xFF05: return (byte) tima;
+                case 0xFF04: return (byte) ((cpu.scheduler.Now - divResetAt) / DivPeriod);
+                case 0xFF05: return (byte) CurrentTima();
                 case 0xFF06: return (byte) tma;
                 case 0xFF07: return (byte) tac;
             }
@@ -83,16 +89,28 @@ namespace GameBoyEmulator.Desktop.GBC {
         public void Write(int addr, byte val) {
             switch (addr) {
                 case 0xFF04: 
-                    div = 0;
+                    divResetAt = cpu.scheduler.Now;
                     break;
                 case 0xFF05: 
+                    UpdateTima();
                     tima = val;
+                    if (TimerEnabled) {
+                        ScheduleOverflow();
+                    }
                     break;
                 case 0xFF06: 
                     tma = val;
                     break;
                 case 0xFF07:
+                    UpdateTima();
+                    var oldTac = tac;
                     tac = val & 0x07;
+                    if (!TimerEnabled) {
+                        cpu.scheduler.Cancel(SchedulerEvents.TIMER_OVERFLOW);
+                    } else if (tac != oldTac) {
+                        timaUpdatedAt = cpu.scheduler.Now;
+                        ScheduleOverflow();
+                    }
                     break;
             }
         }
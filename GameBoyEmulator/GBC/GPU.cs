@@ -1,6 +1,5 @@
 ﻿using System;
-using System.Linq;
-using Microsoft.Xna.Framework;
+using System.Threading;
 
 namespace GameBoyEmulator.Desktop.GBC {
     public class GPU {
@@ -10,11 +9,17 @@ namespace GameBoyEmulator.Desktop.GBC {
         private const int VerticalBlankCycles = 4560 / 4;
         private const int OamCycles = 83 / 4;
         private const int VRamCycles = 175 / 4;
+
+        private const int MaxObjectsPerLine = 10;
+        private const int DmaCycles = 160;
+        private const int RenderQueueSize = 256; // Power of two, larger than a frame worth of lines
         #endregion
         
-        private int modeClocks;
+        // LY and the mode as of the last GPU_MODE event. Mode changes without side effects, and the VBlank
+        // lines, are not scheduled at all: CurrentLine and CurrentMode derive them from the master clock.
         private int line;
         private GPUModes mode;
+        private long modeStartedAt;
         private CPU cpu;
 
         internal bool FlagLycLy => (lcdStat & Flags.FLAG_LYC_LY) > 0;
@@ -41,45 +46,123 @@ namespace GameBoyEmulator.Desktop.GBC {
 
         private GPUObject[] objs;
         private GPUObject[] prioObjects;
+
+        /// <summary>
+        /// Objects visible at each line, already in drawing order. Rebuilt on demand when OAM changes.
+        /// </summary>
+        private readonly GPUObject[][] lineObjects;
+        private readonly int[] lineObjectCount;
+        private bool objsDirty;
+        private bool dmaActive;
         
-        private readonly Color[] BgPallete = {
-            Color.Black,
-            Color.DarkGray,
-            Color.Gray,
-            Color.White,
-        };
-        
-        private readonly Color[] Obj0Pallete = {
-            Color.Black,
-            Color.DarkGray,
-            Color.Gray,
-            Color.White,
+        private readonly byte[] BgPallete = {
+            Shades.BLACK,
+            Shades.LIGHT_GRAY,
+            Shades.DARK_GRAY,
+            Shades.WHITE,
         };
 
-        private readonly Color[] Obj1Pallete = {
-            Color.Black,
-            Color.DarkGray,
-            Color.Gray,
-            Color.White,
-        };
+        // Raw palette registers, latched into every line snapshot. 0x27 matches the initial palettes.
+        private byte bgp = 0x27;
+        private byte obp0 = 0x27;
+        private byte obp1 = 0x27;
 
         private readonly byte[] registers;
 
-        public readonly Color[] TileBuffer;
-        public Color[] VRamBuffer;
+        #region Render Pipeline
+        // Lines are rendered from register snapshots, either inline or by a render thread that trails the CPU.
+        // Everything below is only touched by whoever renders, except the queue indexes.
+        // VRAM and OAM are shared, so every write to them waits for the queued lines first (SyncRenderer).
+        private readonly ScanlineRegisters[] renderQueue = new ScanlineRegisters[RenderQueueSize];
+        private volatile int queueHead; // Written by the CPU thread
+        private volatile int queueTail; // Written by the renderer
+        private readonly ManualResetEventSlim renderPending = new ManualResetEventSlim(false);
+        private Thread renderThread;
+        private volatile bool renderRunning;
+
+        private readonly byte[] renderBgPallete = new byte[4];
+        private readonly byte[] renderObj0Pallete = new byte[4];
+        private readonly byte[] renderObj1Pallete = new byte[4];
+        private int renderBgp;
+        private int renderObp0;
+        private int renderObp1;
+        private bool renderObjSize;
+        #endregion
+
+        #region Change Tracking
+        // Bumped by the CPU thread whenever the content of a buffer changes. The frontend compares
+        // LineGenerations against the frame it last presented to skip unchanged uploads, the debugger views
+        // are only repainted when the tile set or map generations moved since they were last published.
+        // Frames carry their own generation through the FrameExchange.
+        internal int FrameGeneration;
+        internal int TileSetGeneration;
+        internal int TileMapGeneration;
+
+        /// <summary>
+        /// FrameGeneration that includes the last change of each line
+        /// </summary>
+        internal readonly int[] LineGenerations = new int[144];
+
+        private bool frameChanged;
+        private readonly byte[] lineBuffer = new byte[160];
+        #endregion
+
+        #region VRAM Debug View
+        // Painted by the CPU thread at VBlank, once the renderer drew every queued line, and handed to the
+        // frontend through a FrameExchange each, so it never reads the tiles while they are decoded.
+        // Each map cell remembers the tile and tile version it was painted with, so UpdateVRAM only repaints
+        // cells whose tile number or tile data changed since the last call. Tiles in the tile view do the same.
+        internal bool DebugViews;
+        internal readonly FrameExchange TileViews;
+        internal readonly FrameExchange VRamViews;
+        private byte[] TileBuffer;
+        private byte[] VRamBuffer;
+        private int viewTileSetGeneration = -1;
+        private int viewTileMapGeneration = -1;
+        private readonly int[] tileVersions = new int[512];
+        private readonly int[] tileViewVersions = new int[512];
+        private int tileViewPalleteVersion;
+        private int bgPalleteVersion;
+        private readonly int[] vramCellTiles = new int[32 * 32];
+        private readonly int[] vramCellVersions = new int[32 * 32];
+        private int vramPalleteVersion;
+        private int vramMapBase;
+        #endregion
 
         private GPUTile[] tileSet;
+
+        /// <summary>
+        /// Background rows already resolved through the renderer BG palette, 8 rows of 8 pixels per tile
+        /// </summary>
+        private readonly byte[] bgRowCache = new byte[384 * 8 * 8];
+        private readonly bool[] bgRowCacheValid = new bool[384];
+
+        /// <summary>
+        /// One bit per tile in 0x8000-0x97FF. Tiles are only decoded when something needs them, by the renderer
+        /// or by the VBlank debug view update, never concurrently: VRAM writes wait for the renderer first.
+        /// </summary>
+        private readonly long[] dirtyTiles = new long[384 / 64];
         
         public GPU(CPU cpu) {
             this.cpu = cpu;
-            TileBuffer = new Color[144 * 288];
+            cpu.scheduler.Register(SchedulerEvents.GPU_MODE, OnModeEnd);
+            cpu.scheduler.Register(SchedulerEvents.OAM_DMA, OnDmaEnd);
+            TileViews = new FrameExchange(144 * 288);
+            VRamViews = new FrameExchange(256 * 256);
+            TileBuffer = TileViews.Back;
+            VRamBuffer = VRamViews.Back;
             for (var i = 0; i < TileBuffer.Length; i++) {
                 var x = i % 144;
                 var y = i / 144;
-                TileBuffer[i] = (x % 9 == 8) || (y % 9 == 8) ? Color.Transparent : Color.White;
+                TileBuffer[i] = (x % 9 == 8) || (y % 9 == 8) ? Shades.TRANSPARENT : Shades.WHITE;
             }
             registers = new byte[0xFF];
             currentRow = new byte[160];
+            lineObjects = new GPUObject[144][];
+            for (var i = 0; i < 144; i++) {
+                lineObjects[i] = new GPUObject[MaxObjectsPerLine];
+            }
+            lineObjectCount = new int[144];
             for (var i = 0; i < 160; i++) {
                 currentRow[i] = 0x00;
             }
@@ -87,21 +170,30 @@ namespace GameBoyEmulator.Desktop.GBC {
         }
 
         public void Reset() {
-            modeClocks = 0;
             scrollX = 0;
             scrollY = 0;
             winX = 0;
             winY = 0;
             line = 0;
             mode = GPUModes.OAM_READ;
+            modeStartedAt = cpu.scheduler.Now;
+            cpu.scheduler.ScheduleAt(SchedulerEvents.GPU_MODE, modeStartedAt + (OamCycles + VRamCycles) * 4);
             tileSet = new GPUTile[512];
             for (var i = 0; i < 512; i++) {
                 tileSet[i] = new GPUTile();
             }
-            VRamBuffer = new Color[256*256];
-            for (var i = 0; i < 256 * 256; i++) {
-                VRamBuffer[i] = Color.White;
+            for (var i = 0; i < dirtyTiles.Length; i++) {
+                dirtyTiles[i] = 0;
             }
+            Array.Clear(bgRowCacheValid, 0, bgRowCacheValid.Length);
+            TileSetGeneration++;
+            TileMapGeneration++;
+            for (var i = 0; i < VRamBuffer.Length; i++) {
+                VRamBuffer[i] = Shades.WHITE;
+            }
+            // Repaint both debug views from the new tile set
+            vramMapBase = -1;
+            tileViewPalleteVersion = bgPalleteVersion - 1;
             oam = new byte[160];
             switchLCD = true;
             switchBg = false;
@@ -121,6 +213,12 @@ namespace GameBoyEmulator.Desktop.GBC {
                 };
                 prioObjects[i] = objs[i];
             }
+            objsDirty = true;
+            dmaActive = false;
+            renderBgp = -1;
+            renderObp0 = -1;
+            renderObp1 = -1;
+            cpu.scheduler.Cancel(SchedulerEvents.OAM_DMA);
 
             switchObj = false;
             lineCompare = 0;
@@ -148,14 +246,14 @@ namespace GameBoyEmulator.Desktop.GBC {
                 case 0xFF41:
                     var ift = interruptsFired;
                     interruptsFired = 0x00;
-                    var res = ((int)mode & 0x3) | (line == lineCompare ? 4 : 0) | (ift << 3) | 0x80;
+                    var res = ((int)CurrentMode() & 0x3) | (CurrentLine() == lineCompare ? 4 : 0) | (ift << 3) | 0x80;
                     return (byte) res;
                 case 0xFF42:
                     return (byte) scrollY;
                 case 0xFF43:
                     return (byte) scrollX;
                 case 0xFF44:
-                    return (byte) line;
+                    return (byte) CurrentLine();
                 case 0xFF45:
                     return lineCompare;
                 case 0xFF4A:
@@ -175,7 +273,11 @@ namespace GameBoyEmulator.Desktop.GBC {
                     switchBg = (val & 0x01) > 0;
                     switchObj = (val & 0x02) > 0;
                     objSize = (val & 0x04) > 0;
-                    bgMapBase = (ushort) ((val & 0x08) > 0 ? 0x1C00 : 0x1800);
+                    var mapBase = (ushort) ((val & 0x08) > 0 ? 0x1C00 : 0x1800);
+                    if (mapBase != bgMapBase) {
+                        bgMapBase = mapBase;
+                        TileMapGeneration++;
+                    }
                     bgTileBase = (ushort) ((val & 0x10) > 0 ? 0x0000 : 0x0800);
                     switchWin = (val & 0x20) > 0;
                     winMapBase = (ushort) ((val & 0x40) > 0 ? 0x1C00 : 0x1800);
@@ -183,6 +285,9 @@ namespace GameBoyEmulator.Desktop.GBC {
                     break;
                 case 0xFF41:
                     lcdStat = (byte) (val & 0x78);
+                    if (mode == GPUModes.VBLANK) {
+                        ScheduleVBlankEvent(CurrentLine() + 1);
+                    }
                     break;
                 case 0xFF42:
                     scrollY = val;
@@ -192,64 +297,32 @@ namespace GameBoyEmulator.Desktop.GBC {
                     break;
                 case 0xFF45:
                     lineCompare = val;
+                    if (mode == GPUModes.VBLANK) {
+                        ScheduleVBlankEvent(CurrentLine() + 1);
+                    }
                     break;
                 case 0xFF46:
-                    for (var i = 0; i < 160; i++) {
-                        var v = cpu.memory.ReadByte((val << 8) + i);
-                        oam[i] = v;
-                        UpdateOAM(0xFE00 + i, v, false);
-                    }
-                    SortOAM();
+                    // The whole block is copied at once. The transfer window only locks the CPU out of the OAM.
+                    SyncRenderer();
+                    cpu.memory.ReadBlock(val << 8, oam, 0, oam.Length);
+                    objsDirty = true;
+                    dmaActive = true;
+                    cpu.scheduler.Schedule(SchedulerEvents.OAM_DMA, DmaCycles * 4);
                     break;
                 case 0xFF47:
                     // Console.WriteLine("Writting BG Pallete");
-                    for (var i = 0; i < 4; i++) {
-                        var b = (val >> (i * 2)) & 3;
-                        switch (b) {
-                            case 0: BgPallete[i] = Color.FromNonPremultiplied(255, 255, 255, 255);
-                                break;
-                            case 1: BgPallete[i] = Color.FromNonPremultiplied(192, 192, 192, 255);
-                                break;
-                            case 2: BgPallete[i] = Color.FromNonPremultiplied(96, 96, 96, 255);
-                                break;
-                            case 3: BgPallete[i] = Color.FromNonPremultiplied(0, 0, 0, 255);
-                                break;
-                        }
-                    }
-                    
-                    RefreshTileData(-1);
+                    bgp = val;
+                    DecodePallete(val, BgPallete);
+                    bgPalleteVersion++;
+                    TileSetGeneration++;
                     break;
                 case 0xFF48:
                     // Console.WriteLine("Writting Obj0 Pallete");
-                    for (var i = 0; i < 4; i++) {
-                        var b = (val >> (i * 2)) & 3;
-                        switch (b) {
-                            case 0: Obj0Pallete[i] = Color.FromNonPremultiplied(255, 255, 255, 255);
-                                break;
-                            case 1: Obj0Pallete[i] = Color.FromNonPremultiplied(192, 192, 192, 255);
-                                break;
-                            case 2: Obj0Pallete[i] = Color.FromNonPremultiplied(96, 96, 96, 255);
-                                break;
-                            case 3: Obj0Pallete[i] = Color.FromNonPremultiplied(0, 0, 0, 255);
-                                break;
-                        }
-                    }
+                    obp0 = val;
                     break;
                 case 0xFF49:
                     // Console.WriteLine("Writting Obj1 Pallete");
-                    for (var i = 0; i < 4; i++) {
-                        var b = (val >> (i * 2)) & 3;
-                        switch (b) {
-                            case 0: Obj1Pallete[i] = Color.FromNonPremultiplied(255, 255, 255, 255);
-                                break;
-                            case 1: Obj1Pallete[i] = Color.FromNonPremultiplied(192, 192, 192, 255);
-                                break;
-                            case 2: Obj1Pallete[i] = Color.FromNonPremultiplied(96, 96, 96, 255);
-                                 break;
-                            case 3: Obj1Pallete[i] = Color.FromNonPremultiplied(0, 0, 0, 255);
-                                break;
-                        }
-                    }
+                    obp1 = val;
                     break;
                 case 0xFF4A:
                     winY = val;
@@ -260,300 +333,596 @@ namespace GameBoyEmulator.Desktop.GBC {
             }
         }
 
-        public void RenderScanline() {
-            if (switchLCD) {
-                #region Background Draw
-                if (switchBg || switchWin) {
-                    
-                    var bufferOffset = line * 160;
-                    
-                    #region Background
-                    var bgVramOffset = Addresses.VRAMBASE;
-                    bgVramOffset += bgMapBase;
-                    bgVramOffset += (((line + scrollY) & 0xFF) / 8) * 32;
-                    
-                    var bgY = (line + scrollY) % 8;
-                    var bgX = scrollX % 8;
-                    var bgTileOffset = (scrollX / 8) % 32;
-                    #endregion
-                    #region Window
-                    var winVramOffset = Addresses.VRAMBASE;
-                    winVramOffset += winMapBase;
-                    winVramOffset += (((line + winY) & 0xFF) / 8) * 32;
-                    
-                    var wY = (line + winY) % 8;
-                    var wX = winX % 8;
-                    var wTileOffset = (winX / 8) % 32;  
-                    #endregion
-
-                    var x = 0;
-                    var y = 0;
-                    var tileOffset = 0; 
-                    var vramOffset = 0;
-
-                    if (switchWin) {
-                        x = wX;
-                        y = wY;
-                        tileOffset = wTileOffset;
-                        vramOffset = winVramOffset;
-                    } else {
-                        x = bgX;
-                        y = bgY;
-                        tileOffset = bgTileOffset;
-                        vramOffset = bgVramOffset;
-                    }
+        /// <summary>
+        /// Latches the registers of the current line and renders it, or queues it for the render thread
+        /// </summary>
+        private void QueueScanline() {
+            if (!switchLCD) return;
 
-                    var tile = (int) cpu.memory.ReadByte(vramOffset + tileOffset);
-                    
-                    if (bgTileBase != 0x0000 && tile < 128) {
-                        tile += 256;
-                    }
+            if (renderThread == null) {
+                var regs = CaptureRegisters();
+                RenderScanline(ref regs);
+                return;
+            }
 
-                    var tileRow = tileSet[tile].TileData[y];
-
-                    for (var i = 0; i < 160; i++) {
-                        var color = BgPallete[tileRow[x]];
-                        currentRow[i] = tileRow[x];
-                        cpu.memory.videoBuffer[bufferOffset] = color;
-                        bufferOffset++;
-                        x++;
-                        if (x != 8) continue;
-
-                        x = 0;
-                        tileOffset = (tileOffset + 1) % 32;
-                        tile = cpu.memory.ReadByte(vramOffset + tileOffset);
-                        if (bgTileBase != 0x0000 && tile < 128) {
-                            tile += 256;
-                        }
+            var head = queueHead;
+            if (head - queueTail == RenderQueueSize) {
+                SyncRenderer();
+            }
+            renderQueue[head & (RenderQueueSize - 1)] = CaptureRegisters();
+            queueHead = head + 1;
+            renderPending.Set();
+        }
+
+        private ScanlineRegisters CaptureRegisters() {
+            return new ScanlineRegisters {
+                Line = line,
+                ScrollX = scrollX,
+                ScrollY = scrollY,
+                WinX = winX,
+                WinY = winY,
+                SwitchBg = switchBg,
+                SwitchObj = switchObj,
+                SwitchWin = switchWin,
+                ObjSize = objSize,
+                BgTileBase = bgTileBase,
+                BgMapBase = bgMapBase,
+                WinMapBase = winMapBase,
+                Bgp = bgp,
+                Obp0 = obp0,
+                Obp1 = obp1,
+            };
+        }
+
+        /// <summary>
+        /// Waits until the render thread drew every queued line. Must be called before changing
+        /// anything the renderer reads besides the snapshots: VRAM, OAM and the video buffer.
+        /// </summary>
+        internal void SyncRenderer() {
+            if (queueTail == queueHead) return;
+
+            var spin = new SpinWait();
+            while (queueTail != queueHead) {
+                spin.SpinOnce();
+            }
+        }
+
+        public void StartRenderThread() {
+            if (renderThread != null) return;
+            renderRunning = true;
+            renderThread = new Thread(RenderLoop) {
+                IsBackground = true,
+                Name = "GPU Renderer"
+            };
+            renderThread.Start();
+        }
 
-                        tileRow = tileSet[tile].TileData[y];
+        /// <summary>
+        /// Stops the render thread after it drew every queued line. Lines are rendered inline afterwards.
+        /// </summary>
+        public void StopRenderThread() {
+            if (renderThread == null) return;
+            renderRunning = false;
+            renderPending.Set();
+            renderThread.Join();
+            renderThread = null;
+        }
+
+        private void RenderLoop() {
+            while (true) {
+                var tail = queueTail;
+                if (tail == queueHead) {
+                    if (!renderRunning) return;
+                    renderPending.Reset();
+                    // Recheck after the reset so a line queued in between is not missed
+                    if (tail == queueHead && renderRunning) {
+                        renderPending.Wait();
                     }
+                    continue;
                 }
+
+                RenderScanline(ref renderQueue[tail & (RenderQueueSize - 1)]);
+                queueTail = tail + 1;
+            }
+        }
+
+        /// <summary>
+        /// Updates the palettes used by the renderer when the snapshot ones changed
+        /// </summary>
+        /// <param name="regs"></param>
+        private void LatchPalletes(ref ScanlineRegisters regs) {
+            if (regs.Bgp != renderBgp) {
+                renderBgp = regs.Bgp;
+                DecodePallete(regs.Bgp, renderBgPallete);
+                Array.Clear(bgRowCacheValid, 0, bgRowCacheValid.Length);
+            }
+            if (regs.Obp0 != renderObp0) {
+                renderObp0 = regs.Obp0;
+                DecodePallete(regs.Obp0, renderObj0Pallete);
+            }
+            if (regs.Obp1 != renderObp1) {
+                renderObp1 = regs.Obp1;
+                DecodePallete(regs.Obp1, renderObj1Pallete);
+            }
+        }
+
+        private static void DecodePallete(byte val, byte[] pallete) {
+            for (var i = 0; i < 4; i++) {
+                pallete[i] = (byte) ((val >> (i * 2)) & 3);
+            }
+        }
+
+        private void RenderScanline(ref ScanlineRegisters regs) {
+            var line = regs.Line;
+            DecodeDirtyTiles();
+            LatchPalletes(ref regs);
+            var videoBuffer = cpu.memory.videoBuffer;
+            var bufferOffset = line * 160;
+            #region Background Draw
+            if (regs.SwitchBg || regs.SwitchWin) {
+                
+                #region Background
+                var bgVramOffset = Addresses.VRAMBASE;
+                bgVramOffset += regs.BgMapBase;
+                bgVramOffset += (((line + regs.ScrollY) & 0xFF) / 8) * 32;
+                
+                var bgY = (line + regs.ScrollY) % 8;
+                var bgX = regs.ScrollX % 8;
+                var bgTileOffset = (regs.ScrollX / 8) % 32;
                 #endregion
-                #region Object Draw 
-
-                if (switchObj) {
-                    var spriteCount = 0;
-                    for (var i = 0; i < 40; i++) {
-                        var obj = prioObjects[i];
-
-                        if (spriteCount > 10) break;
-                        if (obj.X < 0 || obj.X >= 168) continue;
-                        if (obj.Y < 0 || obj.Y >= 160) continue;
-                        
-                        if (obj.Y <= line && (obj.Y + 8) > line) {
-                            var tileData = tileSet[obj.Tile];
-                            var tileRow = obj.YFlip
-                                ? tileData.TileData[7 - (line - obj.Y)]
-                                : tileData.TileData[line - obj.Y];
-
-                            var pallete = obj.Palette != 0 ? Obj0Pallete : Obj1Pallete;
-                            var bufferOffset = (line * 160) + obj.X;
-                            for (var x = 0; x < 8; x++) {
-                                var color = obj.XFlip ? pallete[tileRow[7 - x]] : pallete[tileRow[x]];
-                                if (tileRow[x] != 0x00 && obj.X + x >= 0 && obj.X + x < 160 && (obj.Prio || currentRow[x] == 0x00)) {
-                                    cpu.memory.videoBuffer[bufferOffset] = color;
-                                }
-
-                                bufferOffset++;
-                            }
-
-                            spriteCount++;
-                        }
+                #region Window
+                var winVramOffset = Addresses.VRAMBASE;
+                winVramOffset += regs.WinMapBase;
+                winVramOffset += (((line + regs.WinY) & 0xFF) / 8) * 32;
+                
+                var wY = (line + regs.WinY) % 8;
+                var wX = regs.WinX % 8;
+                var wTileOffset = (regs.WinX / 8) % 32;  
+                #endregion
+
+                var x = 0;
+                var y = 0;
+                var tileOffset = 0; 
+                var vramOffset = 0;
+
+                if (regs.SwitchWin) {
+                    x = wX;
+                    y = wY;
+                    tileOffset = wTileOffset;
+                    vramOffset = winVramOffset;
+                } else {
+                    x = bgX;
+                    y = bgY;
+                    tileOffset = bgTileOffset;
+                    vramOffset = bgVramOffset;
+                }
+
+                var videoRam = cpu.memory._videoRam;
+                var mapOffset = vramOffset - Addresses.VRAMBASE;
+
+                // Copy whole tile rows, only the first and last spans are partial
+                for (var i = 0; i < 160;) {
+                    var tile = (int) videoRam[mapOffset + tileOffset];
+                    if (regs.BgTileBase != 0x0000 && tile < 128) {
+                        tile += 256;
+                    }
+
+                    if (!bgRowCacheValid[tile]) {
+                        UpdateBgRowCache(tile);
                     }
+
+                    var count = Math.Min(8 - x, 160 - i);
+                    Buffer.BlockCopy(bgRowCache, (tile * 8 + y) * 8 + x, lineBuffer, i, count);
+                    Buffer.BlockCopy(tileSet[tile].TileData[y], x, currentRow, i, count);
+
+                    i += count;
+                    x = 0;
+                    tileOffset = (tileOffset + 1) % 32;
                 }
-                #endregion
+            } else {
+                // Without background the line keeps its previous content
+                Buffer.BlockCopy(videoBuffer, bufferOffset, lineBuffer, 0, 160);
             }
-        }
+            #endregion
+            #region Object Draw 
+
+            if (regs.SwitchObj) {
+                if (regs.ObjSize != renderObjSize) {
+                    // Tile numbers of 8x16 objects depend on the object size
+                    renderObjSize = regs.ObjSize;
+                    objsDirty = true;
+                }
+                if (objsDirty) {
+                    BuildLineObjects();
+                }
+
+                var objects = lineObjects[line];
+                var count = lineObjectCount[line];
+                for (var i = 0; i < count; i++) {
+                    var obj = objects[i];
+                    var tileData = tileSet[obj.Tile];
+                    var tileRow = obj.YFlip
+                        ? tileData.TileData[7 - (line - obj.Y)]
+                        : tileData.TileData[line - obj.Y];
 
-        private void RefreshTileData(int tileNum) {
-            if (tileNum == -1) {
-                var i = 0;
-                foreach (var tileData in tileSet) {
-                    // 16 x 32 tiles with 1px spacing
-                    // 16 * 9 x 32 * 9
-                    // 144 x 288 Buffer
-                    for (var y = 0; y < 8; y++) {
-                        for (var x = 0; x < 8; x++) {
-                            var px = (i % 16) * 9 + x;
-                            var py = (i / 16) * 9 + y;
-                            var p = py * 144 + px;
-    
-                            TileBuffer[p] = BgPallete[tileData.TileData[y][x]];
+                    var pallete = obj.Palette != 0 ? renderObj0Pallete : renderObj1Pallete;
+                    for (var x = 0; x < 8; x++) {
+                        var color = obj.XFlip ? pallete[tileRow[7 - x]] : pallete[tileRow[x]];
+                        if (tileRow[x] != 0x00 && obj.X + x >= 0 && obj.X + x < 160 && (obj.Prio || currentRow[x] == 0x00)) {
+                            lineBuffer[obj.X + x] = color;
                         }
                     }
-                    i++;
                 }
-            } else {
-                var i = tileNum;
-                var tileData = tileSet[tileNum];
+            }
+            #endregion
+
+            CommitLine(videoBuffer, bufferOffset, line);
+        }
+
+        /// <summary>
+        /// Copies the rendered line to the video buffer if it differs from what is already there
+        /// </summary>
+        /// <param name="videoBuffer"></param>
+        /// <param name="bufferOffset"></param>
+        /// <param name="line"></param>
+        private void CommitLine(byte[] videoBuffer, int bufferOffset, int line) {
+            for (var i = 0; i < 160; i++) {
+                if (videoBuffer[bufferOffset + i] == lineBuffer[i]) continue;
+
+                Buffer.BlockCopy(lineBuffer, i, videoBuffer, bufferOffset + i, 160 - i);
+                LineGenerations[line] = FrameGeneration + 1;
+                frameChanged = true;
+                return;
+            }
+        }
+
+        /// <summary>
+        /// Repaints the tiles of the tile view that were decoded again since they were painted
+        /// </summary>
+        private void UpdateTileView() {
+            var repaintAll = tileViewPalleteVersion != bgPalleteVersion;
+            tileViewPalleteVersion = bgPalleteVersion;
+
+            for (var tile = 0; tile < tileSet.Length; tile++) {
+                if (!repaintAll && tileViewVersions[tile] == tileVersions[tile]) continue;
+
+                tileViewVersions[tile] = tileVersions[tile];
+                var tileData = tileSet[tile].TileData;
                 // 16 x 32 tiles with 1px spacing
                 // 16 * 9 x 32 * 9
                 // 144 x 288 Buffer
+                var offset = (tile / 16) * 9 * 144 + (tile % 16) * 9;
                 for (var y = 0; y < 8; y++) {
+                    var row = tileData[y];
                     for (var x = 0; x < 8; x++) {
-                        var px = (i % 16) * 9 + x;
-                        var py = (i / 16) * 9 + y;
-                        var p = py * 144 + px;
-
-                        TileBuffer[p] = BgPallete[tileData.TileData[y][x]];
+                        TileBuffer[offset + x] = BgPallete[row[x]];
                     }
+                    offset += 144;
                 }
             }
         }
 
-        public void UpdateVRAM() {
-            for (var i = 0; i < VRamBuffer.Length; i++) {
-                var py = (i / 256);
-                var px = (i % 256);
-                var tileNum = (px / 8) + ((py / 8) * 32);
-                var v = cpu.memory.ReadByte(Addresses.VRAMBASE + bgMapBase + tileNum);
-                var tile = tileSet[v];
-                var x = px % 8;
-                var y = py % 8;
-                VRamBuffer[i] = BgPallete[tile.TileData[y][x]];
+        /// <summary>
+        /// Repaints and publishes the debug views that changed since they were last published.
+        /// Called at VBlank after SyncRenderer, so the tiles can be decoded here.
+        /// </summary>
+        private void UpdateDebugViews() {
+            var tileSetChanged = TileSetGeneration != viewTileSetGeneration;
+            if (!tileSetChanged && TileMapGeneration == viewTileMapGeneration) return;
+
+            DecodeDirtyTiles();
+            if (tileSetChanged) {
+                UpdateTileView();
+                viewTileSetGeneration = TileSetGeneration;
+                TileBuffer = TileViews.Publish(viewTileSetGeneration);
+            }
+
+            UpdateVRAM();
+            viewTileMapGeneration = TileMapGeneration;
+            VRamBuffer = VRamViews.Publish(viewTileMapGeneration);
+        }
+
+        private void UpdateVRAM() {
+            var repaintAll = vramPalleteVersion != bgPalleteVersion || vramMapBase != bgMapBase;
+            vramPalleteVersion = bgPalleteVersion;
+            vramMapBase = bgMapBase;
+
+            var videoRam = cpu.memory._videoRam;
+            for (var cell = 0; cell < 32 * 32; cell++) {
+                var tile = videoRam[vramMapBase + cell];
+                if (!repaintAll && vramCellTiles[cell] == tile && vramCellVersions[cell] == tileVersions[tile]) continue;
+
+                vramCellTiles[cell] = tile;
+                vramCellVersions[cell] = tileVersions[tile];
+                var tileData = tileSet[tile].TileData;
+                var offset = (cell / 32) * 8 * 256 + (cell % 32) * 8;
+                for (var y = 0; y < 8; y++) {
+                    var row = tileData[y];
+                    for (var x = 0; x < 8; x++) {
+                        VRamBuffer[offset + x] = BgPallete[row[x]];
+                    }
+                    offset += 256;
+                }
             }
         }
         
-        public void UpdateTile(int addr, byte val) {
-            var relAddr = addr & 0x1FFF;
-            if ((addr & 1) > 0) {
-                addr--;
-                relAddr--;
-            }
-            var tile = (relAddr >> 4) & 511;
-            var y = (relAddr >> 1) & 7;
-            var b0 = cpu.memory.ReadByte(addr);
-            var b1 = cpu.memory.ReadByte(addr+1);
-
-            for (var x = 0; x < 8; x++) {
-                var sx = 1 << (7 - x);
-                tileSet[tile].TileData[y][x] = (byte) (((b0 & sx) != 0 ? 1 : 0) + ((b1 & sx) != 0 ? 2 : 0));
-            }
-            RefreshTileData(tile);
-        }
-
-        public void UpdateOAM(int addr, byte val, bool sort=true) {
-            var relAddr = addr - 0xFE00;
-            var obj = relAddr >> 2;
-            if (obj < 40) {
-                switch (relAddr & 3) {
-                    case 0: 
-                        objs[obj].Y = val - 16;
-                        break;
-                    case 1:
-                        objs[obj].X = val - 8;
-                        break;
-                    case 2:
-                        objs[obj].Tile = (objSize) ? (byte) (val & 0xFE) : val;
-                        break;
-                    case 3:
-                        objs[obj].Palette = (val & 0x10) != 0 ? 1 : 0;
-                        objs[obj].XFlip = (val & 0x20) != 0;
-                        objs[obj].YFlip = (val & 0x40) != 0;
-                        objs[obj].Prio = (val & 0x80) != 0;
-                        break;
+        /// <summary>
+        /// Flags the tile that contains the VRAM address to be decoded before its next use,
+        /// or the tile maps as changed for addresses above the tile data
+        /// </summary>
+        /// <param name="addr"></param>
+        public void MarkVRAMDirty(int addr) {
+            var tile = (addr & 0x1FFF) >> 4;
+            if (tile < 384) {
+                dirtyTiles[tile >> 6] |= 1L << (tile & 63);
+                TileSetGeneration++;
+            } else {
+                TileMapGeneration++;
+            }
+        }
+
+        private void DecodeDirtyTiles() {
+            for (var i = 0; i < dirtyTiles.Length; i++) {
+                if (dirtyTiles[i] == 0) continue;
+
+                var dirty = dirtyTiles[i];
+                dirtyTiles[i] = 0;
+                for (var bit = 0; dirty != 0; bit++, dirty = (long) ((ulong) dirty >> 1)) {
+                    if ((dirty & 1) != 0) {
+                        DecodeTile(i * 64 + bit);
+                    }
                 }
             }
+        }
 
-            if (sort) {
-                SortOAM();
+        private void DecodeTile(int tile) {
+            var addr = Addresses.VRAMBASE + (tile << 4);
+            var tileData = tileSet[tile];
+            for (var y = 0; y < 8; y++) {
+                tileData.DecodeRow(y, cpu.memory.ReadByte(addr + y * 2), cpu.memory.ReadByte(addr + y * 2 + 1));
             }
+            bgRowCacheValid[tile] = false;
+            tileVersions[tile]++;
         }
 
-        public void SortOAM() {
-            
-            var sorted = objs.ToList();
-            sorted.Sort((a, b) => {
-                if (a.X > b.X) {
-                    return -1;
+        private void UpdateBgRowCache(int tile) {
+            var tileData = tileSet[tile].TileData;
+            var offset = tile * 64;
+            for (var y = 0; y < 8; y++) {
+                var row = tileData[y];
+                for (var x = 0; x < 8; x++) {
+                    bgRowCache[offset++] = renderBgPallete[row[x]];
                 }
+            }
+            bgRowCacheValid[tile] = true;
+        }
 
-                if (a.X < b.X) {
-                    return 1;
-                }
+        public byte ReadOAM(int addr) {
+            return dmaActive ? (byte) 0xFF : oam[addr - 0xFE00];
+        }
 
-                if (a.Pos > b.Pos) {
-                    return -1;
-                }
+        public void UpdateOAM(int addr, byte val) {
+            if (dmaActive) return;
+            SyncRenderer();
+            oam[addr - 0xFE00] = val;
+            objsDirty = true;
+        }
 
-                if (a.Pos < b.Pos) {
-                    return 1;
+        private void OnDmaEnd(long due) {
+            dmaActive = false;
+        }
+
+        private void DecodeObject(int obj) {
+            var relAddr = obj << 2;
+            objs[obj].Y = oam[relAddr] - 16;
+            objs[obj].X = oam[relAddr + 1] - 8;
+            objs[obj].Tile = (renderObjSize) ? (byte) (oam[relAddr + 2] & 0xFE) : oam[relAddr + 2];
+            var attributes = oam[relAddr + 3];
+            objs[obj].Palette = (attributes & 0x10) != 0 ? 1 : 0;
+            objs[obj].XFlip = (attributes & 0x20) != 0;
+            objs[obj].YFlip = (attributes & 0x40) != 0;
+            objs[obj].Prio = (attributes & 0x80) != 0;
+        }
+
+        private static readonly Comparison<GPUObject> ObjectPriority = CompareObjectPriority;
+
+        private static int CompareObjectPriority(GPUObject a, GPUObject b) {
+            if (a.X > b.X) {
+                return -1;
+            }
+
+            if (a.X < b.X) {
+                return 1;
+            }
+
+            if (a.Pos > b.Pos) {
+                return -1;
+            }
+
+            if (a.Pos < b.Pos) {
+                return 1;
+            }
+
+            return 0;
+        }
+
+        /// <summary>
+        /// Decodes the OAM, sorts the objects by drawing order and distributes them into the line buckets
+        /// </summary>
+        private void BuildLineObjects() {
+            for (var i = 0; i < 40; i++) {
+                DecodeObject(i);
+            }
+            Array.Sort(prioObjects, ObjectPriority);
+            Array.Clear(lineObjectCount, 0, lineObjectCount.Length);
+
+            for (var i = 0; i < 40; i++) {
+                var obj = prioObjects[i];
+                if (obj.X < 0 || obj.X >= 168) continue;
+                if (obj.Y < 0 || obj.Y >= 160) continue;
+
+                var lastLine = Math.Min(obj.Y + 8, 144);
+                for (var l = obj.Y; l < lastLine; l++) {
+                    if (lineObjectCount[l] < MaxObjectsPerLine) {
+                        lineObjects[l][lineObjectCount[l]++] = obj;
+                    }
                 }
+            }
 
-                return 0;
-            });
-            prioObjects = sorted.ToArray();
+            objsDirty = false;
         }
         
-        public void Cycle() {
+        /// <summary>
+        /// Duration of a GPU Mode in Processor Cycles
+        /// </summary>
+        /// <param name="mode"></param>
+        /// <returns></returns>
+        private static int ModeCycles(GPUModes mode) {
+            switch (mode) {
+                case GPUModes.HBLANK: return HorizontalBlankCycles;
+                case GPUModes.VBLANK: return VerticalBlankCycles / 9;
+                case GPUModes.OAM_READ: return OamCycles;
+                default: return VRamCycles;
+            }
+        }
+
+        /// <summary>
+        /// LY at the current master clock
+        /// </summary>
+        /// <returns></returns>
+        private int CurrentLine() {
+            if (mode != GPUModes.VBLANK) {
+                return line;
+            }
+            return line + (int) ((cpu.scheduler.Now - modeStartedAt) / (ModeCycles(GPUModes.VBLANK) * 4));
+        }
+
+        /// <summary>
+        /// Mode at the current master clock
+        /// </summary>
+        /// <returns></returns>
+        private GPUModes CurrentMode() {
+            if (mode == GPUModes.OAM_READ && cpu.scheduler.Now - modeStartedAt >= OamCycles * 4) {
+                return GPUModes.VRAM_READ;
+            }
+            return mode;
+        }
+
+        /// <summary>
+        /// Earliest master clock at which LY or STAT may read differently
+        /// </summary>
+        /// <returns></returns>
+        internal long NextStatusChangeAt() {
+            var now = cpu.scheduler.Now;
+            switch (mode) {
+                case GPUModes.OAM_READ:
+                    var vramReadAt = modeStartedAt + OamCycles * 4;
+                    if (now < vramReadAt) {
+                        return vramReadAt;
+                    }
+                    break;
+                case GPUModes.VBLANK:
+                    var period = ModeCycles(GPUModes.VBLANK) * 4;
+                    return modeStartedAt + ((now - modeStartedAt) / period + 1) * period;
+            }
+            return cpu.scheduler.DueAt(SchedulerEvents.GPU_MODE);
+        }
+
+        /// <summary>
+        /// Schedules the next VBlank line that has side effects: the one matching LYC, if its interrupt
+        /// is enabled, or the end of VBlank.
+        /// </summary>
+        /// <param name="fromLine">First line that was not reached yet</param>
+        private void ScheduleVBlankEvent(int fromLine) {
+            var target = 154;
+            if (FlagLycLy && lineCompare >= fromLine && lineCompare < target) {
+                target = lineCompare;
+            }
+            var due = modeStartedAt + (target - 144) * ModeCycles(GPUModes.VBLANK) * 4;
+            cpu.scheduler.ScheduleAt(SchedulerEvents.GPU_MODE, due);
+        }
+
+        /// <summary>
+        /// Called by the scheduler when the current mode ends
+        /// </summary>
+        /// <param name="due">Clock Cycle the mode ended</param>
+        private void OnModeEnd(long due) {
             // if (!switchLCD) return;
-            modeClocks += cpu.reg.lastClockM;
             switch (mode) {
                 case GPUModes.HBLANK:
-                    if (modeClocks >= HorizontalBlankCycles) {
-                        modeClocks = 0;
-                        line++;
-                        
-                        if (line == 144) {
-                            mode = GPUModes.VBLANK;
-                            cpu.reg.TriggerInterrupts |= Flags.INT_VBLANK;
-                            if (FlagVBlankMode && cpu.reg.InterruptEnable) {
-                                cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
-                            }
-                        } else {
-                            mode = GPUModes.OAM_READ;
-                            if (FlagOamMode && cpu.reg.InterruptEnable) {
-                                cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
-                            }
+                    line++;
+                    
+                    if (line == 144) {
+                        mode = GPUModes.VBLANK;
+                        SyncRenderer();
+                        if (frameChanged) {
+                            frameChanged = false;
+                            FrameGeneration++;
+                            cpu.memory.videoBuffer = cpu.memory.frames.Publish(FrameGeneration);
                         }
-
-                        if (line == lineCompare && FlagLycLy && cpu.reg.InterruptEnable) {
+                        if (DebugViews) {
+                            UpdateDebugViews();
+                        }
+                        cpu.reg.TriggerInterrupts |= Flags.INT_VBLANK;
+                        if (FlagVBlankMode && cpu.reg.InterruptEnable) {
+                            cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
+                        }
+                    } else {
+                        mode = GPUModes.OAM_READ;
+                        if (FlagOamMode && cpu.reg.InterruptEnable) {
                             cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
                         }
                     }
+
+                    if (line == lineCompare && FlagLycLy && cpu.reg.InterruptEnable) {
+                        cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
+                    }
                     break;
                 case GPUModes.VBLANK:
-                    if (modeClocks >= (VerticalBlankCycles/9)) {
-                        modeClocks = 0;
-                        line++;
-                        if (line == lineCompare && FlagLycLy) {
+                    var vblankLine = line + (int) ((due - modeStartedAt) / (ModeCycles(GPUModes.VBLANK) * 4));
+                    if (vblankLine == lineCompare && FlagLycLy) {
+                        cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
+                    }
+                    if (vblankLine > 153) {
+                        mode = GPUModes.OAM_READ;
+                        line = 0;
+                        if (FlagOamMode && cpu.reg.InterruptEnable) {
                             cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
                         }
-                        if (line > 153) {
-                            mode = GPUModes.OAM_READ;
-                            line = 0;
-                            if (FlagOamMode && cpu.reg.InterruptEnable) {
-                                cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
-                            }
-                        }
+                    } else {
+                        ScheduleVBlankEvent(vblankLine + 1);
+                        return;
                     }
                     break;
                 case GPUModes.OAM_READ:
-                    if (modeClocks >= OamCycles) {
-                        modeClocks = 0;
-                        mode = GPUModes.VRAM_READ;
-                    }
-                    break;
-                case GPUModes.VRAM_READ:
-                    if (modeClocks >= VRamCycles) {
-                        modeClocks = 0;
-                        
-                        RenderScanline();
-                        
-                        mode = GPUModes.HBLANK;
-                        
-                        // TODO: DMA
-                        
-                        if (FlagHBlankMode && cpu.reg.InterruptEnable) {
-                            cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
-                        }
+                    // Scheduled at the end of VRAM_READ, which has no side effects of its own
+                    QueueScanline();
+                    
+                    mode = GPUModes.HBLANK;
+                    
+                    // TODO: DMA
+                    
+                    if (FlagHBlankMode && cpu.reg.InterruptEnable) {
+                        cpu.reg.TriggerInterrupts |= Flags.INT_LCDSTAT;
                     }
                     break;
                 default:
                     Console.WriteLine($"BUG! Went to a unknown state: {mode}");
                     break;
             }
+
+            modeStartedAt = due;
+            switch (mode) {
+                case GPUModes.VBLANK:
+                    ScheduleVBlankEvent(145);
+                    break;
+                case GPUModes.OAM_READ:
+                    cpu.scheduler.ScheduleAt(SchedulerEvents.GPU_MODE, due + (OamCycles + VRamCycles) * 4);
+                    break;
+                default:
+                    cpu.scheduler.ScheduleAt(SchedulerEvents.GPU_MODE, due + ModeCycles(mode) * 4);
+                    break;
+            }
         }
     }
 }
@@ -1,6 +1,4 @@
-﻿using Microsoft.Xna.Framework;
-
-namespace GameBoyEmulator.Desktop.GBC {
+﻿namespace GameBoyEmulator.Desktop.GBC {
     public class GPUObject {
         public int Pos { get; set; }
         public int Palette { get; set; }
@@ -1,5 +1,11 @@
 ﻿namespace GameBoyEmulator.Desktop.GBC {
     public class GPUTile {
+        /// <summary>
+        /// 2bpp row decode table indexed by (high byte << 8) | low byte.
+        /// Each entry packs the 8 color indexes of the row, pixel 0 (leftmost) at the lowest 2 bits.
+        /// </summary>
+        internal static readonly ushort[] RowLookup = BuildRowLookup();
+
         public byte[][] TileData;
 
         public GPUTile() {
@@ -8,5 +14,35 @@
                 TileData[i] = new byte[8] { 0,0,0,0, 0,0,0,0 };                
             }
         }
+
+        /// <summary>
+        /// Decodes a row of tile data into 8 color indexes
+        /// </summary>
+        /// <param name="y"></param>
+        /// <param name="low"></param>
+        /// <param name="high"></param>
+        public void DecodeRow(int y, byte low, byte high) {
+            var packed = RowLookup[(high << 8) | low];
+            var row = TileData[y];
+            for (var x = 0; x < 8; x++) {
+                row[x] = (byte) ((packed >> (x * 2)) & 3);
+            }
+        }
+
+        private static ushort[] BuildRowLookup() {
+            var table = new ushort[0x10000];
+            for (var i = 0; i < table.Length; i++) {
+                var low = i & 0xFF;
+                var high = i >> 8;
+                var packed = 0;
+                for (var x = 0; x < 8; x++) {
+                    var sx = 1 << (7 - x);
+                    var color = ((low & sx) != 0 ? 1 : 0) + ((high & sx) != 0 ? 2 : 0);
+                    packed |= color << (x * 2);
+                }
+                table[i] = (ushort) packed;
+            }
+            return table;
+        }
     }
 }
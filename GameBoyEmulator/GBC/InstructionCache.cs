@@ -0,0 +1,154 @@
+﻿using System;
+using System.Collections.Generic;
+
+namespace GameBoyEmulator.Desktop.GBC {
+    /// <summary>
+    /// Index in Entries of the instruction at each ROM address, decoded on its first execution.
+    /// The instruction length and base cycles come with the OpcodeEntry at that index.
+    /// ROM is immutable, so entries stay valid until another ROM is loaded. The switchable bank area
+    /// keeps one table per bank.
+    /// Runs of instructions matching one of the superinstruction sequences, CPUInstructions.SuperInstructionSequences
+    /// unless replaced with SetSuperInstructions, decode to the superinstruction that executes them all,
+    /// at SuperInstructionBase and up.
+    /// </summary>
+    public class InstructionCache {
+        private const int BankSize = 0x4000;
+        private const int RomEnd = 0x8000;
+        internal const int SuperInstructionBase = 0x200;
+
+        /// <summary>
+        /// The dispatch table followed by the superinstructions
+        /// </summary>
+        internal OpcodeEntry[] Entries { get; private set; }
+
+        private readonly CPU cpu;
+        private int[][] sequences;
+
+        // Dispatch index + 1, 0 for addresses not decoded yet
+        private readonly short[] fixedBank = new short[BankSize];
+        private readonly Dictionary<int, short[]> switchableBanks = new Dictionary<int, short[]>();
+        private short[] currentBank;
+        private int currentBankNumber = -1;
+        private bool superInstructions = true;
+
+        public InstructionCache(CPU cpu) {
+            this.cpu = cpu;
+            sequences = CPUInstructions.SuperInstructionSequences;
+            Entries = GetEntries(CPUInstructions.SuperInstructions);
+        }
+
+        /// <summary>
+        /// Decode instruction sequences to superinstructions. Turned off while profiling them.
+        /// </summary>
+        public bool SuperInstructions {
+            get { return superInstructions; }
+            set {
+                superInstructions = value;
+                Clear();
+                cpu.blocks.Clear();
+            }
+        }
+
+        /// <summary>
+        /// Replaces the generated superinstructions, the ones in CPUSuperInstructions.cs
+        /// </summary>
+        /// <param name="sequences">Dispatch table indexes of the instructions run by each superinstruction, longest first</param>
+        /// <param name="superInstructions">Entry of the superinstruction that runs each sequence</param>
+        internal void SetSuperInstructions(int[][] sequences, OpcodeEntry[] superInstructions) {
+            this.sequences = sequences;
+            Entries = GetEntries(superInstructions);
+            Clear();
+            // Compiled blocks call the handlers decoded here
+            cpu.blocks.Clear();
+        }
+
+        private static OpcodeEntry[] GetEntries(OpcodeEntry[] superInstructions) {
+            var dispatch = CPUInstructions.Dispatch;
+            var entries = new OpcodeEntry[SuperInstructionBase + superInstructions.Length];
+            Array.Copy(dispatch, entries, dispatch.Length);
+            Array.Copy(superInstructions, 0, entries, SuperInstructionBase, superInstructions.Length);
+            return entries;
+        }
+
+        public void Clear() {
+            for (var i = 0; i < fixedBank.Length; i++) {
+                fixedBank[i] = 0;
+            }
+            switchableBanks.Clear();
+            currentBank = null;
+            currentBankNumber = -1;
+        }
+
+        /// <summary>
+        /// Returns the dispatch table index of the instruction at a ROM address
+        /// </summary>
+        /// <param name="pc">Address below 0x8000</param>
+        /// <returns></returns>
+        internal int Get(int pc) {
+            short[] table;
+            if (pc < BankSize) {
+                table = fixedBank;
+            } else {
+                table = SwitchableBank();
+                pc -= BankSize;
+            }
+
+            var entry = table[pc];
+            if (entry == 0) {
+                entry = (short) (Decode(pc + (table == fixedBank ? 0 : BankSize)) + 1);
+                table[pc] = entry;
+            }
+            return entry - 1;
+        }
+
+        private short[] SwitchableBank() {
+            var bank = cpu.memory.CurrentBank;
+            if (bank == currentBankNumber) {
+                return currentBank;
+            }
+
+            if (!switchableBanks.TryGetValue(bank, out currentBank)) {
+                currentBank = new short[BankSize];
+                switchableBanks[bank] = currentBank;
+            }
+            currentBankNumber = bank;
+            return currentBank;
+        }
+
+        private int Decode(int pc) {
+            var op = DecodeOpcode(pc);
+            if (!superInstructions) return op;
+
+            for (var i = 0; i < sequences.Length; i++) {
+                if (sequences[i][0] == op && Matches(sequences[i], pc)) {
+                    return SuperInstructionBase + i;
+                }
+            }
+            return op;
+        }
+
+        private int DecodeOpcode(int pc) {
+            var op = (int) cpu.memory.ReadByte(pc);
+            if (op == 0xCB) {
+                // CB Prefixed opcodes are at the upper half of the dispatch table
+                op = 0x100 | cpu.memory.ReadByte(pc + 1);
+            }
+            return op;
+        }
+
+        /// <summary>
+        /// Whether the sequence is at the address, without crossing into another bank
+        /// </summary>
+        /// <param name="sequence"></param>
+        /// <param name="pc"></param>
+        /// <returns></returns>
+        private bool Matches(int[] sequence, int pc) {
+            var end = pc < BankSize ? BankSize : RomEnd;
+            foreach (var op in sequence) {
+                if (pc >= end || DecodeOpcode(pc) != op) return false;
+                pc += CPUInstructions.Dispatch[op > 0xFF ? 0xCB : op].Length;
+            }
+            return pc <= end;
+        }
+    }
+}
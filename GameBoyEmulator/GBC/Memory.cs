@@ -2,7 +2,6 @@
 using System.Linq;
 using System.Text;
 using System.Text.RegularExpressions;
-using Microsoft.Xna.Framework;
 
 namespace GameBoyEmulator.Desktop.GBC {
     public class Memory {
@@ -25,30 +24,47 @@ namespace GameBoyEmulator.Desktop.GBC {
             0xF5, 0x06, 0x19, 0x78, 0x86, 0x23, 0x05, 0x20, 0xFB, 0x86, 0x20, 0xFE, 0x3E, 0x01, 0xE0, 0x50
         };
         
-        private readonly byte[] _videoRam = new byte[0x2000];
+        internal readonly byte[] _videoRam = new byte[0x2000];
         private readonly byte[] _workRam = new byte[0x2000];
         private readonly byte[] _highRam = new byte[0x7F];
         private byte[] _romData = new byte[0x8000];
         private byte[] _catridgeRam = new byte[0x2000];
         private byte _currentBank;
 
-        internal Color[] videoBuffer;
+        internal int CurrentBank => _currentBank;
+
+        #region Page Table
+        // Indexed by the address high byte. Each mapped page points to its backing array and the offset of the
+        // page start inside it. Pages without a backing array (I/O, OAM, ...) are decoded by ReadIO / WriteIO.
+        private readonly byte[][] _readPages = new byte[256][];
+        private readonly int[] _readOffsets = new int[256];
+        private readonly byte[][] _writePages = new byte[256][];
+        private readonly int[] _writeOffsets = new int[256];
+        #endregion
+
+        /// <summary>
+        /// Frame the GPU is currently drawing, the back buffer of frames
+        /// </summary>
+        internal byte[] videoBuffer;
+        internal readonly FrameExchange frames;
 
         internal bool inBIOS;
 
         private CPU cpu;
 
         public Memory(CPU cpu) {
-            videoBuffer = new Color[160*144];
+            frames = new FrameExchange(160*144);
+            videoBuffer = frames.Back;
             for (var i = 0; i < videoBuffer.Length; i++) {
-                videoBuffer[i] = Color.White;
+                videoBuffer[i] = Shades.WHITE;
             }
 
             this.cpu = cpu;
+            MapRAM();
             Reset();
         }
 
-        public Color[] GetVideoBuffer() {
+        public byte[] GetVideoBuffer() {
             return videoBuffer;
         }
 
@@ -71,6 +87,63 @@ namespace GameBoyEmulator.Desktop.GBC {
             }
 
             inBIOS = true;
+            MapROM();
+        }
+
+        private static void MapPages(byte[][] pages, int[] offsets, int firstPage, int lastPage, byte[] data, int offset) {
+            for (var page = firstPage; page <= lastPage; page++) {
+                pages[page] = data;
+                offsets[page] = offset + ((page - firstPage) << 8);
+            }
+        }
+
+        private void MapRAM() {
+            // Video RAM writes need to invalidate the tile cache, so only reads are mapped.
+            MapPages(_readPages, _readOffsets, 0x80, 0x9F, _videoRam, 0);
+            MapPages(_readPages, _readOffsets, 0xA0, 0xBF, _catridgeRam, 0);
+            MapPages(_writePages, _writeOffsets, 0xA0, 0xBF, _catridgeRam, 0);
+            MapPages(_readPages, _readOffsets, 0xC0, 0xDF, _workRam, 0);
+            MapPages(_writePages, _writeOffsets, 0xC0, 0xDF, _workRam, 0);
+            MapPages(_readPages, _readOffsets, 0xE0, 0xEF, _workRam, 0);
+            MapPages(_writePages, _writeOffsets, 0xE0, 0xEF, _workRam, 0);
+        }
+
+        /// <summary>
+        /// Unmaps the writes to a Work RAM page, and its echo, while it holds compiled code,
+        /// so they go through WriteIO and invalidate it. High RAM writes always go through WriteIO.
+        /// </summary>
+        /// <param name="page"></param>
+        /// <param name="code"></param>
+        internal void SetCodePage(int page, bool code) {
+            if (page < 0xC0 || page > 0xDF) return;
+
+            var offset = (page - 0xC0) << 8;
+            _writePages[page] = code ? null : _workRam;
+            _writeOffsets[page] = offset;
+            if (page <= 0xCF) {
+                _writePages[page + 0x20] = code ? null : _workRam;
+                _writeOffsets[page + 0x20] = offset;
+            }
+        }
+
+        /// <summary>
+        /// Maps a ROM bank at 0x4000-0x7FFF
+        /// </summary>
+        /// <param name="bank"></param>
+        internal void SelectBank(int bank) {
+            _currentBank = (byte) bank;
+            MapROM();
+        }
+
+        private void MapROM() {
+            MapPages(_readPages, _readOffsets, 0x00, 0x3F, _romData, 0);
+            MapPages(_readPages, _readOffsets, 0x40, 0x7F, _romData, 0x4000 + 0x4000 * _currentBank);
+            if (inBIOS) {
+                // Page 0x01 stays at ReadIO to detect the jump out of the BIOS
+                _readPages[0x00] = _bios;
+                _readOffsets[0x00] = 0;
+                _readPages[0x01] = null;
+            }
         }
 
         public void RandomizeMemory() {
@@ -90,22 +163,55 @@ namespace GameBoyEmulator.Desktop.GBC {
             }
         }
 
+        /// <summary>
+        /// Copies a block of memory. Blocks inside a mapped page are copied straight from its backing array.
+        /// </summary>
+        /// <param name="addr"></param>
+        /// <param name="dest"></param>
+        /// <param name="destOffset"></param>
+        /// <param name="length"></param>
+        internal void ReadBlock(int addr, byte[] dest, int destOffset, int length) {
+            var page = (addr >> 8) & 0xFF;
+            var data = _readPages[page];
+            if (data != null && (addr & 0xFF) + length <= 0x100) {
+                Buffer.BlockCopy(data, _readOffsets[page] + (addr & 0xFF), dest, destOffset, length);
+                return;
+            }
+
+            for (var i = 0; i < length; i++) {
+                dest[destOffset + i] = ReadByte(addr + i);
+            }
+        }
+
         public void WriteByte(int addr, byte val) {
             // Console.WriteLine($"Writting 0x{addr:X4} val 0x{val:X2}");
+            var page = (addr >> 8) & 0xFF;
+            var data = _writePages[page];
+            if (data != null) {
+                data[_writeOffsets[page] + (addr & 0xFF)] = val;
+                return;
+            }
+
+            WriteIO(addr, val);
+        }
+
+        private void WriteIO(int addr, byte val) {
             if (addr <= 0x3FFF) {                          // Catridge ROM
                 // _romData[addr] = val;
             } else if (addr >= 0x4000 && addr <= 0x7FFF) { // Catridge Bank N
                 // _romData[addr + 0x4000 * _currentBank] = val;
             } else if (addr >= 0x8000 && addr <= 0x9FFF) { // Video RAM
+                cpu.gpu.SyncRenderer();
                 _videoRam[addr - 0x8000] = val;
-                cpu.gpu.UpdateTile(addr, val);
+                cpu.gpu.MarkVRAMDirty(addr);
             } else if (addr >= 0xA000 && addr <= 0xBFFF) { // Catridge RAM
                 _catridgeRam[addr - 0xA000] = val;
             } else if (addr >= 0xC000 && addr <= 0xEFFF) { // Work RAM
                 _workRam[addr & 0x1FFF] = val;
+                // Only pages with compiled code are not mapped
+                cpu.blocks.InvalidateWrite(0xC000 + (addr & 0x1FFF));
             } else if (addr >= 0xFE00 && addr <= 0xFE9F) {
                 cpu.gpu.UpdateOAM(addr, val);
-                cpu.gpu.oam[addr - 0xFE00] = val;
             } else if (addr >= 0xFEA0 && addr <= 0xFEFF) { // Not usable, ... yet ...
                 //
             } else if (addr >= 0xFF00 && addr <= 0xFF7F) { // I/O Ports
@@ -139,6 +245,7 @@ namespace GameBoyEmulator.Desktop.GBC {
                 }
             } else if (addr >= 0xFF80 && addr <= 0xFFFE) { // High RAM
                 _highRam[addr - 0xFF80] = val;
+                cpu.blocks.InvalidateWrite(addr);
             } else if (addr == 0xFFFF) {                   // Interrupt Enable Register  p
                 cpu.reg.EnabledInterrupts = val;
             }
@@ -146,6 +253,16 @@ namespace GameBoyEmulator.Desktop.GBC {
 
         public byte ReadByte(int addr) {
             // Console.WriteLine($"Reading 0x{addr:X4}");
+            var page = (addr >> 8) & 0xFF;
+            var data = _readPages[page];
+            if (data != null) {
+                return data[_readOffsets[page] + (addr & 0xFF)];
+            }
+
+            return ReadIO(addr);
+        }
+
+        private byte ReadIO(int addr) {
             if (addr <= 0x3FFF) {                          // Catridge ROM
                 if (inBIOS) {
                     if (addr < 0x100) {
@@ -155,6 +272,7 @@ namespace GameBoyEmulator.Desktop.GBC {
                     if (addr == 0x100) {
                         Console.WriteLine("Jumping out BIOS");
                         inBIOS = false;
+                        MapROM();
                     }
                 }
                 return _romData[addr];
@@ -167,7 +285,7 @@ namespace GameBoyEmulator.Desktop.GBC {
             } else if (addr >= 0xC000 && addr <= 0xEFFF) { // Work RAM
                 return _workRam[addr & 0x1FFF];
             } else if (addr >= 0xFE00 && addr <= 0xFE9F) {
-                return cpu.gpu.oam[addr - 0xFE00];
+                return cpu.gpu.ReadOAM(addr);
             } else if (addr >= 0xFEA0 && addr <= 0xFEFF) { // Not usable, ... yet ...
                 //
             } else if (addr >= 0xFF00 && addr <= 0xFF7F) { // I/O Ports
@@ -242,6 +360,9 @@ namespace GameBoyEmulator.Desktop.GBC {
 
         public void LoadROM(byte[] romData) {
             _romData = romData;
+            MapROM();
+            cpu.blocks.Clear();
+            cpu.instructions.Clear();
         }
     }
 }
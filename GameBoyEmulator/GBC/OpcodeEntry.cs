@@ -0,0 +1,21 @@
+﻿using System;
+
+namespace GameBoyEmulator.Desktop.GBC {
+    public struct OpcodeEntry {
+        public readonly Action<CPU> Handler;
+        public readonly int Cycles;
+        public readonly int Length;
+
+        /// <summary>
+        /// The instruction may not continue at the next one (jumps, calls, returns, HALT, ...)
+        /// </summary>
+        public readonly bool EndsBlock;
+
+        public OpcodeEntry(Action<CPU> handler, int cycles, int length, bool endsBlock) {
+            Handler = handler;
+            Cycles = cycles;
+            Length = length;
+            EndsBlock = endsBlock;
+        }
+    }
+}
@@ -0,0 +1,74 @@
+﻿using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+
+namespace GameBoyEmulator.Desktop.GBC {
+    /// <summary>
+    /// Counts the pairs and triples of instructions executed back to back from ROM, the input of
+    /// Generators/superinstructions.py. Record is called before each CPU.Cycle, with superinstructions off.
+    /// Runs are broken by anything that leaves the straight line: branches, interrupts, HALT and the BIOS.
+    /// </summary>
+    public class OpcodeProfile {
+        private const int RomEnd = 0x8000;
+
+        private readonly Dictionary<string, long> counts = new Dictionary<string, long>();
+        private readonly int[] window = new int[3];
+        private int windowLength;
+        private int expectedPc = -1;
+
+        public void Record(CPU cpu) {
+            var memory = cpu.memory;
+            var pc = cpu.reg.PC;
+            if (cpu._halt || memory.inBIOS || pc >= RomEnd) {
+                expectedPc = -1;
+                return;
+            }
+
+            if (pc != expectedPc) {
+                windowLength = 0;
+            }
+
+            var op = (int) memory.ReadByte(pc);
+            var entry = CPUInstructions.Dispatch[op];
+            if (op == 0xCB) {
+                // CB Prefixed opcodes are at the upper half of the dispatch table
+                op = 0x100 | memory.ReadByte(pc + 1);
+            }
+
+            window[0] = window[1];
+            window[1] = window[2];
+            window[2] = op;
+            if (windowLength < 3) {
+                windowLength++;
+            }
+
+            if (windowLength >= 2) {
+                Count($"{window[1]:X3} {window[2]:X3}");
+            }
+            if (windowLength == 3) {
+                Count($"{window[0]:X3} {window[1]:X3} {window[2]:X3}");
+            }
+
+            expectedPc = entry.EndsBlock ? -1 : pc + entry.Length;
+        }
+
+        private void Count(string sequence) {
+            long count;
+            counts.TryGetValue(sequence, out count);
+            counts[sequence] = count + 1;
+        }
+
+        /// <summary>
+        /// Writes one sequence per line, most frequent first: count and dispatch table indexes in hex
+        /// </summary>
+        /// <param name="filename"></param>
+        public void Write(string filename) {
+            using (var f = new StreamWriter(filename)) {
+                f.WriteLine("# count opcodes (dispatch table indexes, 0x100 and up are 0xCB prefixed)");
+                foreach (var pair in counts.OrderByDescending(x => x.Value)) {
+                    f.WriteLine($"{pair.Value} {pair.Key}");
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,23 @@
+﻿namespace GameBoyEmulator.Desktop.GBC {
+    /// <summary>
+    /// GPU registers latched at the end of a line's VRAM_READ mode.
+    /// Everything the renderer needs to draw the line besides VRAM and OAM.
+    /// </summary>
+    internal struct ScanlineRegisters {
+        public int Line;
+        public int ScrollX;
+        public int ScrollY;
+        public int WinX;
+        public int WinY;
+        public bool SwitchBg;
+        public bool SwitchObj;
+        public bool SwitchWin;
+        public bool ObjSize;
+        public ushort BgTileBase;
+        public ushort BgMapBase;
+        public ushort WinMapBase;
+        public byte Bgp;
+        public byte Obp0;
+        public byte Obp1;
+    }
+}
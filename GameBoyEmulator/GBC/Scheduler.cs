@@ -0,0 +1,122 @@
+﻿using System;
+
+namespace GameBoyEmulator.Desktop.GBC {
+    /// <summary>
+    /// Keeps the peripherals in sync with the master cycle counter.
+    /// Each peripheral schedules its next state change as an absolute cycle timestamp and
+    /// the CPU only has to compare the counter against the earliest one after each instruction.
+    /// </summary>
+    public class Scheduler {
+        private const long Never = long.MaxValue;
+
+        private readonly long[] dueAt;
+        private readonly Action<long>[] handlers;
+
+        /// <summary>
+        /// Master cycle counter in T-cycles. Does not advance while the CPU is stopped.
+        /// </summary>
+        internal long Now;
+
+        /// <summary>
+        /// Timestamp of the earliest scheduled event
+        /// </summary>
+        internal long NextEventAt;
+
+        public Scheduler() {
+            var count = Enum.GetValues(typeof(SchedulerEvents)).Length;
+            dueAt = new long[count];
+            handlers = new Action<long>[count];
+            Reset();
+        }
+
+        public void Reset() {
+            Now = 0;
+            for (var i = 0; i < dueAt.Length; i++) {
+                dueAt[i] = Never;
+            }
+            NextEventAt = Never;
+        }
+
+        /// <summary>
+        /// Registers the callback that runs when the event is due.
+        /// The callback receives the timestamp the event was scheduled to, which may be earlier than Now.
+        /// </summary>
+        /// <param name="ev"></param>
+        /// <param name="handler"></param>
+        public void Register(SchedulerEvents ev, Action<long> handler) {
+            handlers[(int) ev] = handler;
+        }
+
+        /// <summary>
+        /// Schedules the event to happen at an absolute timestamp, replacing any previous schedule.
+        /// </summary>
+        /// <param name="ev"></param>
+        /// <param name="timestamp"></param>
+        public void ScheduleAt(SchedulerEvents ev, long timestamp) {
+            dueAt[(int) ev] = timestamp;
+            if (timestamp < NextEventAt) {
+                NextEventAt = timestamp;
+            } else {
+                UpdateNextEvent();
+            }
+        }
+
+        /// <summary>
+        /// Schedules the event to happen after the specified amount of T-cycles
+        /// </summary>
+        /// <param name="ev"></param>
+        /// <param name="cycles"></param>
+        public void Schedule(SchedulerEvents ev, long cycles) {
+            ScheduleAt(ev, Now + cycles);
+        }
+
+        public void Cancel(SchedulerEvents ev) {
+            dueAt[(int) ev] = Never;
+            UpdateNextEvent();
+        }
+
+        /// <summary>
+        /// Returns the timestamp the event is scheduled to, or long.MaxValue if not scheduled.
+        /// </summary>
+        /// <param name="ev"></param>
+        /// <returns></returns>
+        public long DueAt(SchedulerEvents ev) {
+            return dueAt[(int) ev];
+        }
+
+        /// <summary>
+        /// Advances the master clock and runs every event that became due
+        /// </summary>
+        /// <param name="cycles"></param>
+        public void Advance(int cycles) {
+            Now += cycles;
+            while (Now >= NextEventAt) {
+                RunNextEvent();
+            }
+        }
+
+        private void RunNextEvent() {
+            var ev = 0;
+            for (var i = 1; i < dueAt.Length; i++) {
+                if (dueAt[i] < dueAt[ev]) {
+                    ev = i;
+                }
+            }
+
+            var due = dueAt[ev];
+            dueAt[ev] = Never;
+            handlers[ev](due);
+            UpdateNextEvent();
+        }
+
+        private void UpdateNextEvent() {
+            var next = Never;
+            for (var i = 0; i < dueAt.Length; i++) {
+                if (dueAt[i] < next) {
+                    next = dueAt[i];
+                }
+            }
+            NextEventAt = next;
+        }
+    }
+}
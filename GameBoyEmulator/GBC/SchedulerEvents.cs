@@ -0,0 +1,7 @@
+﻿namespace GameBoyEmulator.Desktop.GBC {
+    public enum SchedulerEvents {
+        GPU_MODE = 0,
+        TIMER_OVERFLOW = 1,
+        OAM_DMA = 2,
+    }
+}
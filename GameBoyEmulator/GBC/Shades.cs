@@ -0,0 +1,21 @@
+﻿namespace GameBoyEmulator.Desktop.GBC {
+    /// <summary>
+    /// Values stored in the video buffers. Converting them to actual colors is up to whoever presents them.
+    /// </summary>
+    public static class Shades {
+        public const byte WHITE = 0;
+        public const byte LIGHT_GRAY = 1;
+        public const byte DARK_GRAY = 2;
+        public const byte BLACK = 3;
+
+        /// <summary>
+        /// Only used by the debugger buffers, for the spacing between tiles
+        /// </summary>
+        public const byte TRANSPARENT = 4;
+
+        /// <summary>
+        /// Gray level of each shade, from WHITE to BLACK
+        /// </summary>
+        public static readonly byte[] Intensity = { 255, 192, 96, 0 };
+    }
+}
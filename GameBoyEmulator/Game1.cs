@@ -22,13 +22,34 @@ namespace GameBoyEmulator.Desktop {
         private KeyboardManager keyboardManager;
         private string GameName = "Not loaded";
         private string disasm = "";
+        private readonly string romFile;
+        private readonly bool renderThread;
+
+        private static readonly Color[] ShadeColors = {
+            ShadeColor(Shades.WHITE),
+            ShadeColor(Shades.LIGHT_GRAY),
+            ShadeColor(Shades.DARK_GRAY),
+            ShadeColor(Shades.BLACK),
+            Color.Transparent,
+        };
+
+        private readonly Color[] videoPixels = new Color[160 * 144];
+        private readonly Color[] tilePixels = new Color[144 * 288];
+        private readonly Color[] vramPixels = new Color[256 * 256];
+
+        // GPU frame generation and cycle count last presented on screen
+        private int presentedFrame = -1;
+        private int presentedCycleCount = -1;
         
-        public Game1() {
+        public Game1(string romFile, bool renderThread = false) {
+            this.romFile = romFile;
+            this.renderThread = renderThread;
             graphics = new GraphicsDeviceManager(this);
             graphics.PreferredBackBufferHeight = 900;
             graphics.PreferredBackBufferWidth = 1280;
             Content.RootDirectory = "Content";
             cpu = new CPU();
+            cpu.gpu.DebugViews = true;
             keyboardManager = new KeyboardManager();
         }
 
@@ -54,13 +75,14 @@ namespace GameBoyEmulator.Desktop {
             videoTexture = new Texture2D(GraphicsDevice, 160, 144, false, SurfaceFormat.Color);
             tileBuffer = new Texture2D(GraphicsDevice, 144, 288, false, SurfaceFormat.Color);
             vramBuffer = new Texture2D(GraphicsDevice, 256, 256, false, SurfaceFormat.Color);
-            tileBuffer.SetData(cpu.gpu.TileBuffer);
             debuggerFont = Content.Load<SpriteFont>("Debugger");
-//            var f = File.ReadAllBytes("opus5.gb");
-            var f = File.ReadAllBytes("tetris.gb");
+            var f = File.ReadAllBytes(romFile);
             cpu.memory.LoadROM(f);
             GameName = cpu.memory.GetRomName();
             Window.Title = $"GameBoyEmulator: ({GameName}) [{cpu.memory.GetRomSize()} - {cpu.memory.GetCatridgeRamSize()}]";
+            if (renderThread) {
+                cpu.gpu.StartRenderThread();
+            }
             cpu.Start();
             keyboardManager.OnKeyPress += OnKeyPress;
             cpu.OnPause += OnPause;
@@ -72,6 +94,7 @@ namespace GameBoyEmulator.Desktop {
         /// </summary>
         protected override void UnloadContent() {
             cpu.Stop();
+            cpu.gpu.StopRenderThread();
         }
 
         private void OnPause() {
@@ -115,10 +138,34 @@ namespace GameBoyEmulator.Desktop {
         protected override void Update(GameTime gameTime) {
             keyboardManager.Update();
             cpu.GbKeys.Update(Keyboard.GetState());
-            tileBuffer.SetData(cpu.gpu.TileBuffer);
-            videoTexture.SetData(cpu.memory.GetVideoBuffer());
-            cpu.gpu.UpdateVRAM();
-            vramBuffer.SetData(cpu.gpu.VRamBuffer);
+            var gpu = cpu.gpu;
+
+            byte[] frame;
+            int frameGeneration;
+            if (cpu.memory.frames.TryTake(out frame, out frameGeneration)) {
+                PresentVideo(frame);
+                presentedFrame = frameGeneration;
+            }
+
+            // The debug views are only published when they changed
+            byte[] view;
+            int viewGeneration;
+            if (gpu.TileViews.TryTake(out view, out viewGeneration)) {
+                tileBuffer.SetData(ToColors(view, tilePixels, 0, tilePixels.Length));
+            }
+            if (gpu.VRamViews.TryTake(out view, out viewGeneration)) {
+                vramBuffer.SetData(ToColors(view, vramPixels, 0, vramPixels.Length));
+            }
+
+            if (cpu.reg.CycleCount != presentedCycleCount) {
+                presentedCycleCount = cpu.reg.CycleCount;
+                UpdateRegisters();
+            }
+
+            base.Update(gameTime);
+        }
+
+        private void UpdateRegisters() {
             var reg = cpu.reg;
             Registers = $"PC: {reg.PC}\n" +
                         $"SP: 0x{reg.SP:X4}\n" +
@@ -132,8 +179,8 @@ namespace GameBoyEmulator.Desktop {
                         $"Interrupts Enabled: {reg.InterruptEnable}\n" +
                         $"Enabled Interrupts: 0b{Convert.ToString(reg.EnabledInterrupts, 2).PadLeft(8, '0')}\n" +
                         $"Trigger Interrupts: 0b{Convert.ToString(reg.TriggerInterrupts, 2).PadLeft(8, '0')}\n" +
-                        $"Last Cycle Time: {cpu.lastCycleTimeMs:F3} ms\n" +
-                        $"Last Cycle Frequency: {(1000.0 / cpu.lastCycleTimeMs):F0} Hz\n" +
+                        $"Last Frame Time: {cpu.lastFrameTimeMs:F3} ms\n" +
+                        $"Emulation Speed: {(CPU.FRAME_PERIOD_MS / cpu.lastFrameTimeMs):F1}x\n" +
                         "\nGPU:\n" +
                         $"SCX: {cpu.gpu.scrollX:D4} SCY: {cpu.gpu.scrollY:D4}\n" +
                         $"BG On: {cpu.gpu.switchBg}\n" +
@@ -143,8 +190,50 @@ namespace GameBoyEmulator.Desktop {
                         $"BG Tile Base: {cpu.gpu.bgTileBase:X4}\n" +
                         $"BG Map Base: {cpu.gpu.bgMapBase:X4}\n" +
                         $"BG Win Map Base: {cpu.gpu.winMapBase:X4}\n";
-            
-            base.Update(gameTime);
+        }
+
+        /// <summary>
+        /// Uploads the lines that changed since the last presented frame
+        /// </summary>
+        /// <param name="frame"></param>
+        private void PresentVideo(byte[] frame) {
+            var gpu = cpu.gpu;
+            var first = -1;
+            var last = -1;
+            for (var line = 0; line < 144; line++) {
+                if (gpu.LineGenerations[line] <= presentedFrame) continue;
+                if (first == -1) {
+                    first = line;
+                }
+                last = line;
+            }
+
+            if (first == -1) return;
+
+            var start = first * 160;
+            var count = (last - first + 1) * 160;
+            ToColors(frame, videoPixels, start, count);
+            videoTexture.SetData(0, new Rectangle(0, first, 160, last - first + 1), videoPixels, start, count);
+        }
+
+        private static Color ShadeColor(byte shade) {
+            var level = Shades.Intensity[shade];
+            return Color.FromNonPremultiplied(level, level, level, 255);
+        }
+
+        /// <summary>
+        /// Converts a buffer of Shades to colors
+        /// </summary>
+        /// <param name="shades"></param>
+        /// <param name="pixels"></param>
+        /// <param name="start"></param>
+        /// <param name="count"></param>
+        /// <returns>pixels</returns>
+        private static Color[] ToColors(byte[] shades, Color[] pixels, int start, int count) {
+            for (var i = start; i < start + count; i++) {
+                pixels[i] = ShadeColors[shades[i]];
+            }
+            return pixels;
         }
 
         /// <summary>
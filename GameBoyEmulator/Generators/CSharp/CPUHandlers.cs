@@ -0,0 +1,33 @@
+using System;
+
+namespace GameBoyEmulator.Desktop.GBC {{
+    // AUTO GENERATED FILE - PLEASE CHECK Generators/gen.py! //
+    public static partial class CPUInstructions {{
+        #region Specialized Handlers
+{Handlers}
+        #endregion
+        #region Dispatch Table
+        /// <summary>
+        /// 0x000 - 0x0FF are the base opcodes, 0x100 - 0x1FF the 0xCB prefixed ones.
+        /// Cycles are in clock cycles (T), taking the branch when conditional.
+        /// Lengths are in bytes, the 0xCB prefix counts as part of PREFIX CB.
+        /// </summary>
+        internal static readonly OpcodeEntry[] Dispatch = {{
+{Dispatch}
+        }};
+        #endregion
+        #region CPU Instructions
+        internal static readonly Action<CPU>[] opcodes = GetHandlers(0x000);
+        internal static readonly Action<CPU>[] CBOPS = GetHandlers(0x100);
+
+        private static Action<CPU>[] GetHandlers(int offset) {{
+            var handlers = new Action<CPU>[256];
+            for (var i = 0; i < 256; i++) {{
+                handlers[i] = Dispatch[offset + i].Handler;
+            }}
+
+            return handlers;
+        }}
+        #endregion
+    }}
+}}
\ No newline at end of file
@@ -0,0 +1,24 @@
+namespace GameBoyEmulator.Desktop.GBC {{
+    // AUTO GENERATED FILE - PLEASE CHECK Generators/superinstructions.py! //
+    public static partial class CPUInstructions {{
+        #region Superinstructions
+{Handlers}
+        #endregion
+        #region Superinstruction Table
+        /// <summary>
+        /// Dispatch table indexes of the instructions run by each superinstruction, longest first.
+        /// InstructionCache decodes the first sequence found at an address to the SuperInstructions entry at the same index.
+        /// </summary>
+        internal static readonly int[][] SuperInstructionSequences = {{
+{Sequences}
+        }};
+
+        /// <summary>
+        /// Cycles and lengths are the sums of the fused instructions
+        /// </summary>
+        internal static readonly OpcodeEntry[] SuperInstructions = {{
+{Entries}
+        }};
+        #endregion
+    }}
+}}
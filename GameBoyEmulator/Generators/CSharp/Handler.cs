@@ -0,0 +1,5 @@
+        /// <summary>
+        /// {prefix}{opcode:02X} - {instruction}
+        /// </summary>
+        private static void {method}(CPU cpu) {{
+{body}        }}
\ No newline at end of file
@@ -0,0 +1,14 @@
+            var reg = cpu.reg;
+            var hl = reg.HL;
+            var ab = (reg.{Arg0} << 8) + reg.{Arg1};
+            var sum = hl + ab;
+
+            reg.FlagCarry = sum > 65535;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = ((ab & 0xFFF) + (hl & 0xFFF)) > 0xFFF;
+
+            reg.H = (byte) (sum >> 8);
+            reg.L = (byte) sum;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
@@ -0,0 +1,10 @@
+            var reg = cpu.reg;
+            var z = (int) reg.{Arg0};
+            var sum = reg.A + z;
+
+            reg.AddFlags(reg.A, z, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
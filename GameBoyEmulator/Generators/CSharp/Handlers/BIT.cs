@@ -0,0 +1,8 @@
+            var reg = cpu.reg;
+
+            reg.FlagZero = (reg.{Arg1} & (1 << {Arg0})) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 4;
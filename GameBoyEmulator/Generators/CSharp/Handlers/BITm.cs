@@ -0,0 +1,8 @@
+            var reg = cpu.reg;
+
+            reg.FlagZero = (cpu.memory.ReadByte(reg.HL) & (1 << {Arg0})) != 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
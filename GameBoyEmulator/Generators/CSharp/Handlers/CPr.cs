@@ -0,0 +1,8 @@
+            var reg = cpu.reg;
+            var a = (int) reg.A;
+            var b = reg.{Arg0};
+
+            reg.SubFlags(a, b, 0);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
@@ -0,0 +1,8 @@
+            var reg = cpu.reg;
+            reg.{Arg1}--;
+            if (reg.{Arg1} == 255) {{
+                reg.{Arg0}--;
+            }}
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
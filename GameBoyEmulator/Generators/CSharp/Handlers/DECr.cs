@@ -0,0 +1,9 @@
+            var reg = cpu.reg;
+            var v = reg.{Arg0};
+            var v2 = (byte) (v - 1);
+            reg.{Arg0} = v2;
+
+            reg.DecFlags(v);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
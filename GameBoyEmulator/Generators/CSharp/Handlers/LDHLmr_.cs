@@ -0,0 +1,4 @@
+            var reg = cpu.reg;
+            cpu.memory.WriteByte(reg.HL, reg.{Arg0});
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
@@ -0,0 +1,5 @@
+            var reg = cpu.reg;
+            var hl = (reg.{Arg1} << 8) + reg.{Arg2};
+            reg.{Arg0} = cpu.memory.ReadByte(hl);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
@@ -0,0 +1,5 @@
+            var reg = cpu.reg;
+            var hl = (reg.{Arg0} << 8) + reg.{Arg1};
+            cpu.memory.WriteByte(hl, reg.{Arg2});
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
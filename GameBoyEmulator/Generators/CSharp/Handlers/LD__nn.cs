@@ -0,0 +1,7 @@
+            var reg = cpu.reg;
+            reg.{Arg1} = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.{Arg0} = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
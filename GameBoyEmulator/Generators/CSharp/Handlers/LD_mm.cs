@@ -0,0 +1,6 @@
+            var reg = cpu.reg;
+            var addr = cpu.memory.ReadWord(reg.PC);
+            reg.{Arg0} = cpu.memory.ReadByte(addr);
+            reg.PC += 2;
+            reg.lastClockM = 4;
+            reg.lastClockT = 16;
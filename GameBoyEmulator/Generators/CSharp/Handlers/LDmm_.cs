@@ -0,0 +1,6 @@
+            var reg = cpu.reg;
+            var addr = cpu.memory.ReadWord(reg.PC);
+            reg.PC += 2;
+            cpu.memory.WriteByte(addr, reg.{Arg0});
+            reg.lastClockM += 4;
+            reg.lastClockT += 16;
@@ -0,0 +1,4 @@
+            var reg = cpu.reg;
+            reg.{Arg0} = cpu.memory.ReadByte(reg.HL);
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
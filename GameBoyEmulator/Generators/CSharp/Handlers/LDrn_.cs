@@ -0,0 +1,6 @@
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.PC);
+            reg.PC++;
+            reg.{Arg0} = b;
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
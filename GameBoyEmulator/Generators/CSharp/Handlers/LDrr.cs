@@ -0,0 +1,4 @@
+            var reg = cpu.reg;
+            reg.{Arg0} = reg.{Arg1};
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
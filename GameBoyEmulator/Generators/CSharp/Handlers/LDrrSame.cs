@@ -0,0 +1,3 @@
+            var reg = cpu.reg;
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
@@ -0,0 +1 @@
+            NOPWARN(cpu, {Arg0});
@@ -0,0 +1,7 @@
+            var reg = cpu.reg;
+            reg.A |= reg.{Arg0};
+
+            reg.OrFlags(reg.A);
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
@@ -0,0 +1,8 @@
+            var reg = cpu.reg;
+            reg.{Arg1} = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+            reg.{Arg0} = cpu.memory.ReadByte(reg.SP);
+            reg.SP++;
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
@@ -0,0 +1,8 @@
+            var reg = cpu.reg;
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.{Arg0});
+            reg.SP--;
+            cpu.memory.WriteByte(reg.SP, reg.{Arg1});
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 16;
@@ -0,0 +1,5 @@
+            var reg = cpu.reg;
+            reg.{Arg1} &= (byte) (~(1 << {Arg0}) & 0xFF);
+
+            reg.lastClockM = 4;
+            reg.lastClockT = 8;
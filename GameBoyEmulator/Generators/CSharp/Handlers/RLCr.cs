@@ -0,0 +1,14 @@
+            var reg = cpu.reg;
+            var v = reg.{Arg0};
+            var c = v >> 7;
+
+            v = (byte) ((v << 1) | c);
+            reg.{Arg0} = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
@@ -0,0 +1,15 @@
+            var reg = cpu.reg;
+            var v = reg.{Arg0};
+            var c = (v >> 7) > 0;
+            var f = reg.FlagCarry ? 1 : 0;
+
+            v = (byte) ((v << 1) | f);
+            reg.{Arg0} = v;
+
+            reg.FlagZero = v == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
@@ -0,0 +1 @@
+            RSTXX(cpu, {Arg0});
@@ -0,0 +1,11 @@
+            var reg = cpu.reg;
+            var b = (int) reg.{Arg0};
+            var f = reg.FlagCarry ? 1 : 0;
+            var sum = reg.A - b - f;
+
+            reg.SubFlags(reg.A, b, f);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
@@ -0,0 +1,5 @@
+            var reg = cpu.reg;
+            reg.{Arg1} |= (byte) (1 << {Arg0});
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
@@ -0,0 +1,7 @@
+            var reg = cpu.reg;
+            var b = cpu.memory.ReadByte(reg.HL);
+            b |= (byte) (1 << {Arg0});
+            cpu.memory.WriteByte(reg.HL, b);
+
+            reg.lastClockM = 3;
+            reg.lastClockT = 12;
@@ -0,0 +1,14 @@
+            var reg = cpu.reg;
+            var b = reg.{Arg0};
+            var c = b >> 7;
+
+            b = (byte) (b << 1);
+            reg.{Arg0} = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c > 0;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
@@ -0,0 +1,15 @@
+            var reg = cpu.reg;
+            var b = reg.{Arg0};
+            var c = (b & 1) > 0;
+            var ext = b & 0x80;
+
+            b = (byte) ((b >> 1) | ext);
+            reg.{Arg0} = b;
+
+            reg.FlagZero = b == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = c;
+
+            reg.lastClockM = 2;
+            reg.lastClockT = 8;
@@ -0,0 +1,10 @@
+            var reg = cpu.reg;
+            var b = (int) reg.{Arg0};
+            var sum = reg.A - b;
+
+            reg.SubFlags(reg.A, b, 0);
+
+            reg.A = (byte) sum;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
@@ -0,0 +1,12 @@
+            var reg = cpu.reg;
+            var b = reg.{Arg0};
+            var swapped = ((b & 0x0F) << 4) | ((b & 0xF0) >> 4);
+            reg.{Arg0} = (byte) swapped;
+
+            reg.FlagZero = swapped == 0;
+            reg.FlagSub = false;
+            reg.FlagHalfCarry = false;
+            reg.FlagCarry = false;
+
+            reg.lastClockM = 1;
+            reg.lastClockT = 4;
@@ -0,0 +1,5 @@
+        /// <summary>
+        /// {opcodes} - {instructions}
+        /// </summary>
+        private static void {method}(CPU cpu) {{
+{body}        }}
\ No newline at end of file
@@ -37,6 +37,64 @@ def GenDisasm(opcodes, cbopcodes):
     CBInstructions = cbinstructions,
   )
 
+def HandlerName(ins):
+  name = ins["templateData"]["name"]
+  args = ins["templateData"]["args"]
+  if len(args) == 0:
+    # Templates without arguments are hand written at CPUInstructions.cs
+    return name
+  return "%s_%s" % (name.rstrip("_"), "_".join([ x.replace("0x", "") for x in args ]))
+
+def GenHandler(ins, prefix):
+  tplName = ins["templateData"]["name"]
+  args = ins["templateData"]["args"]
+  if tplName == "LDrr" and args[0] == args[1]:
+    # LD r, r only burns cycles. Avoids a self assignment warning.
+    tplName = "LDrrSame"
+  tplArgs = dict([ ("Arg%d" % i, v) for i, v in enumerate(args) ])
+  body = LoadTPL("Handlers/%s" % tplName).format(**tplArgs)
+  return LoadTPL("Handler").format(
+    prefix = prefix,
+    opcode = ins["code"],
+    instruction = ins["instruction"],
+    method = HandlerName(ins),
+    body = body,
+  )
+
+# Instructions that can change the flow of execution. Compiled blocks end at them.
+BLOCK_ENDS = ("JR", "JP", "CALL", "RET", "RETI", "RST", "HALT", "STOP", "UNDEFINED")
+
+def EndsBlock(ins):
+  return ins["instruction"].split(" ")[0] in BLOCK_ENDS
+
+def GenTable(opcodes, prefix):
+  table = ""
+  for ins in opcodes:
+    if ins["code"] % 16 == 0:
+      table += "            #region %s%02X Group\n" % (prefix, ins["code"])
+    cycles = ins["cycles"][0] if isinstance(ins["cycles"], list) else ins["cycles"]
+    table += "            new OpcodeEntry(%s, %d, %d, %s),\n" % (
+      HandlerName(ins), cycles, int(ins["size"]), "true" if EndsBlock(ins) else "false")
+    if ins["code"] % 16 == 15:
+      table += "            #endregion\n"
+  return table
+
+def GenHandlers(opcodes, cbopcodes):
+  handlers = []
+  generated = set()
+  for prefix, ops in (("0x", opcodes), ("CB", cbopcodes)):
+    for ins in ops:
+      name = HandlerName(ins)
+      if len(ins["templateData"]["args"]) == 0 or name in generated:
+        continue
+      generated.add(name)
+      handlers.append(GenHandler(ins, prefix))
+
+  return LoadTPL("CPUHandlers").format(
+    Handlers = "\n\n".join(handlers),
+    Dispatch = (GenTable(opcodes, "0x") + GenTable(cbopcodes, "CB")).rstrip("\n"),
+  )
+
 def Gen(data):
   opcodes = []
   code = 0x00
@@ -87,40 +145,52 @@ def Gen(data):
   return opcodes
 
 
-print "Generating instructions.py"
+def Main():
+  print "Generating instructions.py"
+
+  f = open("instructions.txt")
+  data = f.read().split("\n")
+  f.close()
+
+  opcodes = Gen(data)
+  formattedOpcodes = pprint.pformat(opcodes)
+
+  f = open("instructions.py", "w")
+  f.write("#!/usr/bin/env python\n\n")
+  f.write("# AUTO GENERATED FILE - PLEASE CHECK gen.py! #\n\n")
+  f.write("Instructions = %s" %formattedOpcodes)
+  f.write("\n")
+  f.close()
 
-f = open("instructions.txt")
-data = f.read().split("\n")
-f.close()
+  print "Generating instructions_cb.py"
+  f = open("instructions_cb.txt")
+  data = f.read().split("\n")
+  f.close()
 
-opcodes = Gen(data)
-formattedOpcodes = pprint.pformat(opcodes)
+  cbopcodes = Gen(data)
+  formattedOpcodes = pprint.pformat(cbopcodes)
 
-f = open("instructions.py", "w")
-f.write("#!/usr/bin/env python\n\n")
-f.write("# AUTO GENERATED FILE - PLEASE CHECK gen.py! #\n\n")
-f.write("Instructions = %s" %formattedOpcodes)
-f.write("\n")
-f.close()
+  f = open("instructions_cb.py", "w")
+  f.write("#!/usr/bin/env python\n\n")
+  f.write("# AUTO GENERATED FILE - PLEASE CHECK gen.py! #\n\n")
+  f.write("InstructionsCB = %s" %formattedOpcodes)
+  f.write("\n")
+  f.close()
 
-print "Generating instructions_cb.py"
-f = open("instructions_cb.txt")
-data = f.read().split("\n")
-f.close()
+  disasm = GenDisasm(opcodes, cbopcodes)
 
-cbopcodes = Gen(data)
-formattedOpcodes = pprint.pformat(cbopcodes)
+  f = open("../Disasm/DisasmInstructions.cs", "w")
+  f.write(disasm)
+  f.write("\n")
+  f.close()
 
-f = open("instructions_cb.py", "w")
-f.write("#!/usr/bin/env python\n\n")
-f.write("# AUTO GENERATED FILE - PLEASE CHECK gen.py! #\n\n")
-f.write("InstructionsCB = %s" %formattedOpcodes)
-f.write("\n")
-f.close()
+  print "Generating CPUHandlers.cs"
+  handlers = GenHandlers(opcodes, cbopcodes)
 
-disasm = GenDisasm(opcodes, cbopcodes)
+  f = open("../GBC/CPUHandlers.cs", "w")
+  f.write(handlers)
+  f.write("\n")
+  f.close()
 
-f = open("../Disasm/DisasmInstructions.cs", "w")
-f.write(disasm)
-f.write("\n")
-f.close()
\ No newline at end of file
+if __name__ == "__main__":
+  Main()
@@ -159,7 +159,7 @@ Instructions = [{'code': 0,
   'instruction': 'STOP',
   'name': 'STOP',
   'simpleFlags': ['-', '-', '-', '-'],
-  'size': '1',
+  'size': '2',
   'templateData': {'args': [], 'name': 'STOP'}},
  {'code': 17,
   'cycles': 12,
@@ -318,7 +318,7 @@ Instructions = [{'code': 0,
   'instruction': 'LD HL, d16',
   'name': 'LDHLnn',
   'simpleFlags': ['-', '-', '-', '-'],
-  'size': '1',
+  'size': '3',
   'templateData': {'args': ['H', 'L'], 'name': 'LD__nn'}},
  {'code': 34,
   'cycles': 8,
@@ -462,7 +462,7 @@ Instructions = [{'code': 0,
   'instruction': 'LD SP, d16',
   'name': 'LDSPnn',
   'simpleFlags': ['-', '-', '-', '-'],
-  'size': '1',
+  'size': '3',
   'templateData': {'args': [], 'name': 'LDSPnn'}},
  {'code': 50,
   'cycles': 8,
@@ -2115,7 +2115,7 @@ Instructions = [{'code': 0,
   'instruction': 'LD [$FF00 + a8], A',
   'name': 'LDIOnA',
   'simpleFlags': ['-', '-', '-', '-'],
-  'size': '1',
+  'size': '2',
   'templateData': {'args': [], 'name': 'LDIOnA'}},
  {'code': 225,
   'cycles': 12,
@@ -2265,7 +2265,7 @@ Instructions = [{'code': 0,
   'instruction': 'LD A, [$FF00 + a8]',
   'name': 'LDAIOn',
   'simpleFlags': ['-', '-', '-', '-'],
-  'size': '1',
+  'size': '2',
   'templateData': {'args': [], 'name': 'LDAIOn'}},
  {'code': 241,
   'cycles': 12,
@@ -1570,7 +1570,7 @@ InstructionsCB = [{'code': 0,
   'name': 'RES5b',
   'simpleFlags': ['-', '-', '-', '-'],
   'size': 1,
-  'templateData': {'args': ['6', 'B'], 'name': 'RES'}},
+  'templateData': {'args': ['5', 'B'], 'name': 'RES'}},
  {'code': 169,
   'cycles': 8,
   'flagResult': {'carry': None, 'halfcarry': None, 'sub': None, 'zero': None},
@@ -1579,7 +1579,7 @@ InstructionsCB = [{'code': 0,
   'name': 'RES5c',
   'simpleFlags': ['-', '-', '-', '-'],
   'size': 1,
-  'templateData': {'args': ['6', 'C'], 'name': 'RES'}},
+  'templateData': {'args': ['5', 'C'], 'name': 'RES'}},
  {'code': 170,
   'cycles': 8,
   'flagResult': {'carry': None, 'halfcarry': None, 'sub': None, 'zero': None},
@@ -1588,7 +1588,7 @@ InstructionsCB = [{'code': 0,
   'name': 'RES5d',
   'simpleFlags': ['-', '-', '-', '-'],
   'size': 1,
-  'templateData': {'args': ['6', 'D'], 'name': 'RES'}},
+  'templateData': {'args': ['5', 'D'], 'name': 'RES'}},
  {'code': 171,
   'cycles': 8,
   'flagResult': {'carry': None, 'halfcarry': None, 'sub': None, 'zero': None},
@@ -1597,7 +1597,7 @@ InstructionsCB = [{'code': 0,
   'name': 'RES5e',
   'simpleFlags': ['-', '-', '-', '-'],
   'size': 1,
-  'templateData': {'args': ['6', 'E'], 'name': 'RES'}},
+  'templateData': {'args': ['5', 'E'], 'name': 'RES'}},
  {'code': 172,
   'cycles': 8,
   'flagResult': {'carry': None, 'halfcarry': None, 'sub': None, 'zero': None},
@@ -1606,7 +1606,7 @@ InstructionsCB = [{'code': 0,
   'name': 'RES5h',
   'simpleFlags': ['-', '-', '-', '-'],
   'size': 1,
-  'templateData': {'args': ['6', 'H'], 'name': 'RES'}},
+  'templateData': {'args': ['5', 'H'], 'name': 'RES'}},
  {'code': 173,
   'cycles': 8,
   'flagResult': {'carry': None, 'halfcarry': None, 'sub': None, 'zero': None},
@@ -1615,7 +1615,7 @@ InstructionsCB = [{'code': 0,
   'name': 'RES5l',
   'simpleFlags': ['-', '-', '-', '-'],
   'size': 1,
-  'templateData': {'args': ['6', 'L'], 'name': 'RES'}},
+  'templateData': {'args': ['5', 'L'], 'name': 'RES'}},
  {'code': 174,
   'cycles': 16,
   'flagResult': {'carry': None, 'halfcarry': None, 'sub': None, 'zero': None},
@@ -1624,7 +1624,7 @@ InstructionsCB = [{'code': 0,
   'name': 'RES5m',
   'simpleFlags': ['-', '-', '-', '-'],
   'size': 1,
-  'templateData': {'args': ['6'], 'name': 'RESHL'}},
+  'templateData': {'args': ['5'], 'name': 'RESHL'}},
  {'code': 175,
   'cycles': 8,
   'flagResult': {'carry': None, 'halfcarry': None, 'sub': None, 'zero': None},
@@ -1633,7 +1633,7 @@ InstructionsCB = [{'code': 0,
   'name': 'RES5a',
   'simpleFlags': ['-', '-', '-', '-'],
   'size': 1,
-  'templateData': {'args': ['6', 'A'], 'name': 'RES'}},
+  'templateData': {'args': ['5', 'A'], 'name': 'RES'}},
  {'code': 176,
   'cycles': 8,
   'flagResult': {'carry': None, 'halfcarry': None, 'sub': None, 'zero': None},
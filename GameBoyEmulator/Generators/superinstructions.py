@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+# Generates superinstructions: handlers that run a whole sequence of instructions with a single dispatch.
+# The sequences are the most frequent ones of a profile recorded with
+#   GameBoyEmulator.exe --headless rom.gb --profile profile.txt
+# Record it from real games: test ROMs exercise every instruction evenly and pick sequences no game runs.
+# Without a profile the tables are left empty and every instruction is dispatched on its own.
+#
+# Usage: superinstructions.py [profile.txt [count]]
+
+import sys
+
+from gen import LoadTPL, HandlerName, EndsBlock
+from instructions import Instructions
+from instructions_cb import InstructionsCB
+
+DEFAULT_COUNT = 32
+
+# JR NZ / JR Z, the branches of the idle loops detected by CPU.DetectIdleLoop
+IDLE_LOOP_JUMPS = (0x20, 0x28)
+
+def Instruction(op):
+  if op > 0xFF:
+    return InstructionsCB[op & 0xFF]
+  return Instructions[op]
+
+def Length(op):
+  # The 0xCB prefix is part of the instruction
+  if op > 0xFF:
+    return 2
+  return int(Instruction(op)["size"])
+
+def Cycles(op):
+  cycles = Instruction(op)["cycles"]
+  return cycles[0] if isinstance(cycles, list) else cycles
+
+def Label(op):
+  if op > 0xFF:
+    return "CB%02X" % (op & 0xFF)
+  return "0x%02X" % op
+
+def LoadProfile(filename):
+  sequences = []
+  f = open(filename)
+  for line in f.read().split("\n"):
+    if line.startswith("#") or len(line.strip()) == 0:
+      continue
+    fields = line.split()
+    sequences.append((int(fields[0]), [ int(x, 16) for x in fields[1:] ]))
+  f.close()
+  return sequences
+
+def Fusable(ops):
+  # Cycle only skips a single opcode byte before dispatching
+  if ops[0] > 0xFF:
+    return False
+  # Only the last instruction may leave the straight line
+  for op in ops[:-1]:
+    if EndsBlock(Instruction(op)):
+      return False
+  return True
+
+def Select(profile, count):
+  # Each superinstruction saves one dispatch per fused instruction after the first
+  candidates = [ (n * (len(ops) - 1), ops) for n, ops in profile if Fusable(ops) ]
+  candidates.sort(key=lambda x: -x[0])
+  selected = [ ops for weight, ops in candidates[:count] ]
+  # A triple is tried before the pair it starts with
+  selected.sort(key=lambda ops: -len(ops))
+  return selected
+
+def MethodName(ops):
+  return "SuperInstruction_%s" % "_".join([ "%03X" % op for op in ops ])
+
+def GenSuperInstruction(ops):
+  body = "            var pc = cpu.reg.PC - 1;\n"
+  offset = 0
+  for i, op in enumerate(ops):
+    if i > 0:
+      body += "            if (!cpu.ChainInstruction(pc + %d)) return;\n" % (offset + (2 if op > 0xFF else 1))
+    body += "            %s(cpu);\n" % HandlerName(Instruction(op))
+    if i == len(ops) - 1 and op in IDLE_LOOP_JUMPS:
+      body += "            cpu.DetectIdleLoop(pc + %d);\n" % offset
+    offset += Length(op)
+
+  return LoadTPL("SuperInstruction").format(
+    opcodes = " ".join([ Label(op) for op in ops ]),
+    instructions = " / ".join([ Instruction(op)["instruction"] for op in ops ]),
+    method = MethodName(ops),
+    body = body,
+  )
+
+def GenSuperInstructions(sequences):
+  handlers = [ GenSuperInstruction(ops) for ops in sequences ]
+  table = ""
+  entries = ""
+  for ops in sequences:
+    table += "            new[] { %s },\n" % ", ".join([ "0x%03X" % op for op in ops ])
+    entries += "            new OpcodeEntry(%s, %d, %d, %s),\n" % (
+      MethodName(ops),
+      sum([ Cycles(op) for op in ops ]),
+      sum([ Length(op) for op in ops ]),
+      "true" if EndsBlock(Instruction(ops[-1])) else "false")
+
+  return LoadTPL("CPUSuperInstructions").format(
+    Handlers = "\n\n".join(handlers),
+    Sequences = table.rstrip("\n"),
+    Entries = entries.rstrip("\n"),
+  )
+
+def Main():
+  sequences = []
+  if len(sys.argv) > 1:
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_COUNT
+    sequences = Select(LoadProfile(sys.argv[1]), count)
+  else:
+    print("No profile given, generating no superinstructions")
+
+  print("Generating CPUSuperInstructions.cs")
+  f = open("../GBC/CPUSuperInstructions.cs", "w")
+  f.write(GenSuperInstructions(sequences))
+  f.write("\n")
+  f.close()
+
+if __name__ == "__main__":
+  Main()
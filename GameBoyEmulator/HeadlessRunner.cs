@@ -0,0 +1,160 @@
+﻿using System;
+using System.Diagnostics;
+using System.IO;
+using System.Text;
+using GameBoyEmulator.Desktop.GBC;
+
+namespace GameBoyEmulator.Desktop {
+    /// <summary>
+    /// Runs a ROM without a window or render loop, as fast as the host allows.
+    /// Usage: --headless rom.gb [--frames N | --cycles N] [--dump-frame out.ppm] [--dump-regs] [--render-thread] [--interpreter] [--profile out.txt] [--verbose]
+    /// </summary>
+    public class HeadlessRunner {
+        private const int DefaultFrames = 60;
+
+        public string RomFile;
+        public long Cycles = DefaultFrames * CPU.FRAME_CYCLES;
+        public string FrameDumpFile;
+        public bool DumpRegisters;
+        public bool RenderThread;
+        public bool Interpreter;
+        public string ProfileFile;
+        public bool Verbose;
+
+        public static HeadlessRunner FromArgs(string[] args) {
+            var runner = new HeadlessRunner();
+            for (var i = 0; i < args.Length; i++) {
+                switch (args[i]) {
+                    case "--headless":
+                        break;
+                    case "--frames":
+                        runner.Cycles = long.Parse(args[++i]) * CPU.FRAME_CYCLES;
+                        break;
+                    case "--cycles":
+                        runner.Cycles = long.Parse(args[++i]);
+                        break;
+                    case "--dump-frame":
+                        runner.FrameDumpFile = args[++i];
+                        break;
+                    case "--dump-regs":
+                        runner.DumpRegisters = true;
+                        break;
+                    case "--render-thread":
+                        runner.RenderThread = true;
+                        break;
+                    case "--interpreter":
+                        runner.Interpreter = true;
+                        break;
+                    case "--profile":
+                        runner.ProfileFile = args[++i];
+                        break;
+                    case "--verbose":
+                        runner.Verbose = true;
+                        break;
+                    default:
+                        runner.RomFile = args[i];
+                        break;
+                }
+            }
+
+            if (runner.RomFile == null) {
+                throw new ArgumentException("No ROM file specified");
+            }
+
+            return runner;
+        }
+
+        public void Run() {
+            var stdout = Console.Out;
+            if (!Verbose) {
+                // The core logs to the console on several hot paths (HALT, interrupts)
+                Console.SetOut(TextWriter.Null);
+            }
+
+            var cpu = new CPU();
+            cpu.memory.LoadROM(File.ReadAllBytes(RomFile));
+            if (RenderThread) {
+                cpu.gpu.StartRenderThread();
+            }
+
+            OpcodeProfile profile = null;
+            if (ProfileFile != null) {
+                // Every instruction has to go through Cycle to be counted
+                profile = new OpcodeProfile();
+                cpu.instructions.SuperInstructions = false;
+            }
+
+            var stopwatch = Stopwatch.StartNew();
+            var elapsed = 0L;
+            while (elapsed < Cycles) {
+                var clockT = cpu.clockT;
+                if (profile != null) {
+                    profile.Record(cpu);
+                    cpu.Cycle();
+                } else if (Interpreter) {
+                    cpu.Cycle();
+                } else {
+                    cpu.RunBlock();
+                }
+                elapsed += cpu.clockT - clockT;
+            }
+            // Lets the renderer catch up with the queued lines
+            cpu.gpu.StopRenderThread();
+            stopwatch.Stop();
+
+            Console.SetOut(stdout);
+
+            var frames = (double) elapsed / CPU.FRAME_CYCLES;
+            var seconds = Math.Max(stopwatch.Elapsed.TotalSeconds, 1e-6);
+            Console.WriteLine($"{cpu.memory.GetRomName()}: {elapsed} cycles ({frames:F1} frames) in {stopwatch.ElapsedMilliseconds} ms " +
+                              $"({frames / seconds:F1} fps)");
+
+            if (DumpRegisters) {
+                Console.WriteLine(GetRegisterDump(cpu));
+            }
+
+            if (profile != null) {
+                profile.Write(ProfileFile);
+            }
+
+            if (FrameDumpFile != null) {
+                DumpFrame(cpu, FrameDumpFile);
+            }
+        }
+
+        private static string GetRegisterDump(CPU cpu) {
+            var reg = cpu.reg;
+            return $"PC: 0x{reg.PC:X4} SP: 0x{reg.SP:X4}\n" +
+                   $"A: 0x{reg.A:X2} F: 0x{reg.F:X2}\n" +
+                   $"B: 0x{reg.B:X2} C: 0x{reg.C:X2}\n" +
+                   $"D: 0x{reg.D:X2} E: 0x{reg.E:X2}\n" +
+                   $"H: 0x{reg.H:X2} L: 0x{reg.L:X2}\n" +
+                   $"Cycles: {reg.CycleCount}\n" +
+                   $"In BIOS: {cpu.memory.inBIOS}\n" +
+                   $"Interrupts Enabled: {reg.InterruptEnable}\n" +
+                   $"Enabled Interrupts: 0b{Convert.ToString(reg.EnabledInterrupts, 2).PadLeft(8, '0')}\n" +
+                   $"Trigger Interrupts: 0b{Convert.ToString(reg.TriggerInterrupts, 2).PadLeft(8, '0')}";
+        }
+
+        /// <summary>
+        /// Writes the video buffer as a binary PPM (P6) image
+        /// </summary>
+        /// <param name="cpu"></param>
+        /// <param name="filename"></param>
+        private static void DumpFrame(CPU cpu, string filename) {
+            var videoBuffer = cpu.memory.GetVideoBuffer();
+            using (var f = File.Create(filename)) {
+                var header = Encoding.ASCII.GetBytes("P6\n160 144\n255\n");
+                f.Write(header, 0, header.Length);
+                var pixels = new byte[videoBuffer.Length * 3];
+                for (var i = 0; i < videoBuffer.Length; i++) {
+                    var level = Shades.Intensity[videoBuffer[i]];
+                    pixels[i * 3 + 0] = level;
+                    pixels[i * 3 + 1] = level;
+                    pixels[i * 3 + 2] = level;
+                }
+                f.Write(pixels, 0, pixels.Length);
+            }
+        }
+    }
+}
@@ -9,8 +9,23 @@ namespace GameBoyEmulator.Desktop {
         /// The main entry point for the application.
         /// </summary>
         [STAThread]
-        static void Main() {
-            using (var game = new Game1())
+        static void Main(string[] args) {
+            if (args.Length > 0 && args[0] == "--headless") {
+                HeadlessRunner.FromArgs(args).Run();
+                return;
+            }
+
+            var romFile = "tetris.gb";
+            var renderThread = false;
+            foreach (var arg in args) {
+                if (arg == "--render-thread") {
+                    renderThread = true;
+                } else {
+                    romFile = arg;
+                }
+            }
+
+            using (var game = new Game1(romFile, renderThread))
                 game.Run();
         }
     }
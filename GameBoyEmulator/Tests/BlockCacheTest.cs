@@ -0,0 +1,164 @@
+using GameBoyEmulator.Desktop.GBC;
+using NUnit.Framework;
+
+namespace GameBoyEmulator.Desktop.Tests {
+    [TestFixture]
+    public class BlockCacheTest {
+        // More than BlockCache.HotThreshold, so the loops end up compiled
+        private const int WARMUP_LOOPS = 100;
+        private const int MAX_LOOP_STEPS = 100;
+
+        private static CPU NewCPU() {
+            var cpu = new CPU();
+            cpu.memory.inBIOS = false;
+            cpu.memory.LoadROM(new byte[0x8000]);
+            return cpu;
+        }
+
+        private static void WriteCode(CPU cpu, int addr, params byte[] code) {
+            for (var i = 0; i < code.Length; i++) {
+                cpu.memory.WriteByte(addr + i, code[i]);
+            }
+        }
+
+        /// <summary>
+        /// Runs the loop at PC until it branched back to its start the given number of times
+        /// </summary>
+        /// <param name="cpu"></param>
+        /// <param name="times"></param>
+        private static void RunLoop(CPU cpu, int times) {
+            var start = cpu.reg.PC;
+            for (var i = 0; i < times; i++) {
+                var steps = 0;
+                do {
+                    cpu.RunBlock();
+                    Assert.Less(++steps, MAX_LOOP_STEPS, "Loop did not branch back to 0x{0:X4}", start);
+                } while (cpu.reg.PC != start);
+            }
+        }
+
+        [TestCase(0xC000)]
+        [TestCase(0xFF80)]
+        public void BlockOverwritesItsNextInstruction(int addr) {
+            var cpu = NewCPU();
+            // ld (hl),a; inc b; jr -4
+            WriteCode(cpu, addr, 0x77, 0x04, 0x18, 0xFC);
+            cpu.reg.PC = (ushort) addr;
+            cpu.reg.H = 0xD0;
+            cpu.reg.L = 0x00;
+            cpu.reg.A = 0x0C; // inc c
+
+            RunLoop(cpu, WARMUP_LOOPS);
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.B);
+            Assert.AreEqual(0, cpu.reg.C);
+            Assert.IsNotNull(cpu.blocks.Get(addr));
+
+            // Now the store replaces the inc b that follows it in the compiled block
+            cpu.reg.H = (byte) ((addr + 1) >> 8);
+            cpu.reg.L = (byte) (addr + 1);
+            RunLoop(cpu, 1);
+            Assert.AreEqual(0x0C, cpu.memory.ReadByte(addr + 1));
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.B);
+            Assert.AreEqual(1, cpu.reg.C);
+
+            RunLoop(cpu, WARMUP_LOOPS);
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.B);
+            Assert.AreEqual(WARMUP_LOOPS + 1, cpu.reg.C);
+        }
+
+        [TestCase(0xC0FF)]
+        [TestCase(0xC100)]
+        public void WriteInsideBlockSpanningTwoPages(int patchAddr) {
+            var cpu = NewCPU();
+            // nop; nop; nop; nop; nop; jr -7, from 0xC0FC to 0xC102
+            WriteCode(cpu, 0xC0FC, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18, 0xF9);
+            cpu.reg.PC = 0xC0FC;
+
+            RunLoop(cpu, WARMUP_LOOPS);
+            Assert.IsNotNull(cpu.blocks.Get(0xC0FC));
+
+            cpu.memory.WriteByte(patchAddr, 0x04); // inc b
+            RunLoop(cpu, 1);
+            Assert.AreEqual(1, cpu.reg.B);
+
+            RunLoop(cpu, WARMUP_LOOPS);
+            Assert.AreEqual(WARMUP_LOOPS + 1, cpu.reg.B);
+        }
+
+        [Test]
+        public void EchoWriteInsideBlock() {
+            var cpu = NewCPU();
+            // inc b; jr -3
+            WriteCode(cpu, 0xC200, 0x04, 0x18, 0xFD);
+            cpu.reg.PC = 0xC200;
+            RunLoop(cpu, WARMUP_LOOPS);
+            Assert.IsNotNull(cpu.blocks.Get(0xC200));
+
+            // The echo at 0xE000 writes the same page
+            cpu.memory.WriteByte(0xE200, 0x0C); // inc c
+            RunLoop(cpu, 1);
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.B);
+            Assert.AreEqual(1, cpu.reg.C);
+        }
+
+        [Test]
+        public void BankSwitchRunsTheNewBank() {
+            var rom = new byte[0xC000];
+            // inc b; jr -3 in the first switchable bank, inc c; jr -3 in the second
+            rom[0x4000] = 0x04;
+            rom[0x4001] = 0x18;
+            rom[0x4002] = 0xFD;
+            rom[0x8000] = 0x0C;
+            rom[0x8001] = 0x18;
+            rom[0x8002] = 0xFD;
+            var cpu = new CPU();
+            cpu.memory.inBIOS = false;
+            cpu.memory.LoadROM(rom);
+            cpu.reg.PC = 0x4000;
+
+            RunLoop(cpu, WARMUP_LOOPS);
+            var firstBankBlock = cpu.blocks.Get(0x4000);
+            Assert.IsNotNull(firstBankBlock);
+
+            cpu.memory.SelectBank(1);
+            RunLoop(cpu, WARMUP_LOOPS);
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.B);
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.C);
+            Assert.IsNotNull(cpu.blocks.Get(0x4000));
+
+            // Each bank keeps its blocks, switching back does not compile them again
+            cpu.memory.SelectBank(0);
+            Assert.AreSame(firstBankBlock, cpu.blocks.Get(0x4000));
+            RunLoop(cpu, 1);
+            Assert.AreEqual(WARMUP_LOOPS + 1, cpu.reg.B);
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.C);
+        }
+
+        [Test]
+        public void FixedBankBlockEndsAtTheBankBoundary() {
+            var rom = new byte[0xC000];
+            // nops from 0x3FF0 into inc b; jp 0x3FF0 in the first switchable bank, inc c; jp 0x3FF0 in the second
+            rom[0x4000] = 0x04;
+            rom[0x4001] = 0xC3;
+            rom[0x4002] = 0xF0;
+            rom[0x4003] = 0x3F;
+            rom[0x8000] = 0x0C;
+            rom[0x8001] = 0xC3;
+            rom[0x8002] = 0xF0;
+            rom[0x8003] = 0x3F;
+            var cpu = new CPU();
+            cpu.memory.inBIOS = false;
+            cpu.memory.LoadROM(rom);
+            cpu.reg.PC = 0x3FF0;
+
+            RunLoop(cpu, WARMUP_LOOPS);
+            Assert.IsNotNull(cpu.blocks.Get(0x3FF0));
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.B);
+
+            cpu.memory.SelectBank(1);
+            RunLoop(cpu, WARMUP_LOOPS);
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.B);
+            Assert.AreEqual(WARMUP_LOOPS, cpu.reg.C);
+        }
+    }
+}
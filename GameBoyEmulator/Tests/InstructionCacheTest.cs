@@ -0,0 +1,80 @@
+using GameBoyEmulator.Desktop.GBC;
+using NUnit.Framework;
+
+namespace GameBoyEmulator.Desktop.Tests {
+    [TestFixture]
+    public class InstructionCacheTest {
+        private const int LOOPS = 100;
+        private const int MAX_LOOP_STEPS = 100;
+
+        /// <summary>
+        /// ROM with a different inc r; jr -3 loop at 0x4000 of both switchable banks
+        /// </summary>
+        /// <returns></returns>
+        private static CPU NewBankedCPU() {
+            var rom = new byte[0xC000];
+            rom[0x4000] = 0x04; // inc b
+            rom[0x4001] = 0x18;
+            rom[0x4002] = 0xFD;
+            rom[0x8000] = 0x0C; // inc c
+            rom[0x8001] = 0x18;
+            rom[0x8002] = 0xFD;
+
+            var cpu = new CPU();
+            cpu.memory.inBIOS = false;
+            cpu.memory.LoadROM(rom);
+            cpu.reg.PC = 0x4000;
+            return cpu;
+        }
+
+        /// <summary>
+        /// Interprets the loop at PC until it branched back to its start the given number of times
+        /// </summary>
+        /// <param name="cpu"></param>
+        /// <param name="times"></param>
+        private static void RunLoop(CPU cpu, int times) {
+            var start = cpu.reg.PC;
+            for (var i = 0; i < times; i++) {
+                var steps = 0;
+                do {
+                    cpu.Cycle();
+                    Assert.Less(++steps, MAX_LOOP_STEPS, "Loop did not branch back to 0x{0:X4}", start);
+                } while (cpu.reg.PC != start);
+            }
+        }
+
+        [Test]
+        public void BankSwitchDecodesTheNewBank() {
+            var cpu = NewBankedCPU();
+            RunLoop(cpu, LOOPS);
+            Assert.AreEqual(LOOPS, cpu.reg.B);
+            Assert.AreEqual(0, cpu.reg.C);
+
+            cpu.memory.SelectBank(1);
+            RunLoop(cpu, LOOPS);
+            Assert.AreEqual(LOOPS, cpu.reg.B);
+            Assert.AreEqual(LOOPS, cpu.reg.C);
+
+            // The first bank keeps its decoded table
+            cpu.memory.SelectBank(0);
+            RunLoop(cpu, 1);
+            Assert.AreEqual(LOOPS + 1, cpu.reg.B);
+            Assert.AreEqual(LOOPS, cpu.reg.C);
+        }
+
+        [Test]
+        public void LoadROMDropsDecodedInstructions() {
+            var cpu = NewBankedCPU();
+            RunLoop(cpu, LOOPS);
+
+            var rom = new byte[0x8000];
+            rom[0x4000] = 0x14; // inc d
+            rom[0x4001] = 0x18;
+            rom[0x4002] = 0xFD;
+            cpu.memory.LoadROM(rom);
+            RunLoop(cpu, 1);
+            Assert.AreEqual(LOOPS, cpu.reg.B);
+            Assert.AreEqual(1, cpu.reg.D);
+        }
+    }
+}
@@ -0,0 +1,159 @@
+using System;
+using System.Linq;
+using GameBoyEmulator.Desktop.GBC;
+using NUnit.Framework;
+
+namespace GameBoyEmulator.Desktop.Tests {
+    [TestFixture]
+    public class SuperInstructionTest {
+        private const int WARMUP_LOOPS = 100;
+        private const int MAX_LOOP_STEPS = 100;
+        private const int RUN_CYCLES = CPU.FRAME_CYCLES * 5;
+
+        // ldh a,(n); cp n; jr nz - dec b; jr nz - ldh (n),a; dec b
+        private static readonly int[][] Sequences = {
+            new[] { 0xF0, 0xFE, 0x20 },
+            new[] { 0x05, 0x20 },
+            new[] { 0xE0, 0x05 },
+        };
+
+        /// <summary>
+        /// Builds the superinstruction entry of a sequence without CB prefixed opcodes,
+        /// the same way Generators/superinstructions.py does
+        /// </summary>
+        /// <param name="ops"></param>
+        /// <returns></returns>
+        private static OpcodeEntry Fuse(int[] ops) {
+            var dispatch = CPUInstructions.Dispatch;
+            Action<CPU> handler = cpu => {
+                var pc = cpu.reg.PC - 1;
+                var offset = 0;
+                for (var i = 0; i < ops.Length; i++) {
+                    if (i > 0 && !cpu.ChainInstruction(pc + offset + 1)) return;
+                    dispatch[ops[i]].Handler(cpu);
+                    if (i == ops.Length - 1 && (ops[i] == 0x20 || ops[i] == 0x28)) {
+                        cpu.DetectIdleLoop(pc + offset);
+                    }
+                    offset += dispatch[ops[i]].Length;
+                }
+            };
+            return new OpcodeEntry(handler,
+                ops.Sum(op => dispatch[op].Cycles),
+                ops.Sum(op => dispatch[op].Length),
+                dispatch[ops.Last()].EndsBlock);
+        }
+
+        private static CPU NewCPU(byte[] code, bool fused) {
+            var rom = new byte[0x8000];
+            Array.Copy(code, 0, rom, 0x150, code.Length);
+            var cpu = new CPU();
+            cpu.memory.inBIOS = false;
+            cpu.memory.LoadROM(rom);
+            cpu.instructions.SetSuperInstructions(Sequences, Sequences.Select(Fuse).ToArray());
+            cpu.instructions.SuperInstructions = fused;
+            cpu.reg.PC = 0x150;
+            cpu.reg.SP = 0xDFF0;
+            return cpu;
+        }
+
+        private static void Step(CPU cpu, bool blocks) {
+            if (blocks) {
+                cpu.RunBlock();
+            } else {
+                cpu.Cycle();
+            }
+        }
+
+        private static void RunLoop(CPU cpu, bool blocks, int times) {
+            var start = cpu.reg.PC;
+            for (var i = 0; i < times; i++) {
+                var steps = 0;
+                do {
+                    Step(cpu, blocks);
+                    Assert.Less(++steps, MAX_LOOP_STEPS, "Loop did not branch back to 0x{0:X4}", start);
+                } while (cpu.reg.PC != start);
+            }
+        }
+
+        private static string State(CPU cpu) {
+            var reg = cpu.reg;
+            return $"A={reg.A:X2} B={reg.B:X2} C={reg.C:X2} D={reg.D:X2} F={reg.F:X2} " +
+                   $"PC={reg.PC:X4} SP={reg.SP:X4} clockT={cpu.clockT} CycleCount={reg.CycleCount}";
+        }
+
+        [Test]
+        public void SequencesDecodeToTheirSuperInstruction() {
+            // ldh a,(LY); cp 0x90; jr nz,-6; dec b; jr nz,-3; ldh (IF),a; dec b
+            var cpu = NewCPU(new byte[] { 0xF0, 0x44, 0xFE, 0x90, 0x20, 0xFA, 0x05, 0x20, 0xFD, 0xE0, 0x0F, 0x05 }, true);
+            Assert.AreEqual(InstructionCache.SuperInstructionBase + 0, cpu.instructions.Get(0x150));
+            Assert.AreEqual(InstructionCache.SuperInstructionBase + 1, cpu.instructions.Get(0x156));
+            Assert.AreEqual(InstructionCache.SuperInstructionBase + 2, cpu.instructions.Get(0x159));
+            // Not the start of a sequence
+            Assert.AreEqual(0xFE, cpu.instructions.Get(0x152));
+
+            cpu.instructions.SuperInstructions = false;
+            Assert.AreEqual(0xF0, cpu.instructions.Get(0x150));
+            Assert.AreEqual(0x05, cpu.instructions.Get(0x156));
+        }
+
+        [TestCase(false)]
+        [TestCase(true)]
+        public void SuperInstructionsMatchSeparateDispatch(bool blocks) {
+            var code = new byte[] {
+                0x06, 0x30,       // 0x150: ld b,0x30
+                0x0C,             // 0x152: inc c
+                0x05, 0x20, 0xFC, // 0x153: dec b; jr nz,0x152
+                0xF0, 0x44,       // 0x156: ldh a,(LY)
+                0xFE, 0x90,       //        cp 0x90
+                0x20, 0xFA,       //        jr nz,0x156
+                0x14,             // 0x15C: inc d
+                0xC3, 0x50, 0x01, // 0x15D: jp 0x150
+            };
+            var cpu = NewCPU(code, true);
+            while (cpu.clockT < RUN_CYCLES) {
+                Step(cpu, blocks);
+            }
+
+            var reference = NewCPU(code, false);
+            while (reference.clockT < cpu.clockT) {
+                reference.Cycle();
+            }
+
+            Assert.AreEqual(State(reference), State(cpu));
+            Assert.Greater(cpu.reg.D, 0);
+        }
+
+        [TestCase(false)]
+        [TestCase(true)]
+        public void InterruptStopsTheSuperInstruction(bool blocks) {
+            // ldh (IF),a; dec b; jr 0x150
+            var code = new byte[] { 0xE0, 0x0F, 0x05, 0x18, 0xFB };
+            var cpu = NewCPU(code, true);
+            var reference = NewCPU(code, false);
+            foreach (var c in new[] { cpu, reference }) {
+                c.reg.EnabledInterrupts = Flags.INT_TIMER;
+                c.reg.B = 0xFF;
+            }
+
+            RunLoop(cpu, blocks, WARMUP_LOOPS);
+            RunLoop(reference, false, WARMUP_LOOPS);
+            Assert.AreEqual(State(reference), State(cpu));
+            if (blocks) {
+                Assert.IsNotNull(cpu.blocks.Get(0x150));
+            }
+
+            // The ldh raises the timer interrupt, dec b must not run
+            cpu.reg.A = Flags.INT_TIMER;
+            reference.reg.A = Flags.INT_TIMER;
+            var b = cpu.reg.B;
+            Step(cpu, blocks);
+            reference.Cycle();
+
+            Assert.AreEqual(Addresses.INT_TIMER, cpu.reg.PC);
+            Assert.AreEqual(0xDFEE, cpu.reg.SP);
+            Assert.AreEqual(0x152, cpu.memory.ReadWord(cpu.reg.SP));
+            Assert.AreEqual(b, cpu.reg.B);
+            Assert.AreEqual(State(reference), State(cpu));
+        }
+    }
+}